@@ -1,9 +1,21 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple, Set
-
+import math
+import os
+import random
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Set
+
+from CompactBoard import CompactBoard
+from Instrumentation import Instrumentation
+from LegEnumerator import LegEnumerator
+from OpeningBook import OpeningBook
 from Pyramid import Pyramid
-from RaceTrack import RaceTrack
+from RaceSimulator import RaceSimulator
+from RandomSource import RandomSource
+from SimulationCache import SimulationCache
+from SpectatorEvaluator import SpectatorEvaluator
 
 
 class AIPlayer:
@@ -12,12 +24,102 @@ class AIPlayer:
       - how often each camel finishes 1st / 2nd
       - which tiles are most frequently landed on
 
-    NOTE: This currently only considers the 5 regular camels (no tiles or black/white
-    crazy camels) in the simulation.
+    Legs are played by the game's rules, spectator tiles and crazy camels
+    included, in one of three modes:
+      - "monte_carlo": sample `amount_of_sims` random legs (default)
+      - "exact": walk every remaining roll sequence with LegEnumerator
+      - "vectorized": sample `amount_of_sims` legs at once with BatchSimulator
+        (requires NumPy)
+
+    Draws come from `rng` (anything RandomSource accepts; the global `random`
+    module by default), or from a master `seed` when one is given. With
+    `workers > 1` the sampling is split across a process pool kept until
+    close(). Answers come from the OpeningBook or the SimulationCache first
+    when they can.
     """
 
-    def __init__(self, amount_of_sims: int = 4000) -> None:
+    MODES = ("monte_carlo", "exact", "vectorized")
+
+    def __init__(
+        self,
+        amount_of_sims: int = 4000,
+        mode: str = "monte_carlo",
+        cache_size: int = 128,
+        workers: int = 1,
+        seed: Optional[int] = None,
+        tolerance: Optional[float] = None,
+        max_sims: Optional[int] = None,
+        opening_book_path: Optional[str] = OpeningBook.DEFAULT_PATH,
+        instrumentation: Optional[Instrumentation] = None,
+        rng: Any = None,
+        spectator_sims: Optional[int] = None,
+    ) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown simulation mode {mode!r}; expected one of {self.MODES}")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
         self.amount_of_sims = amount_of_sims
+        self.mode = mode
+        self.workers = workers
+        self.seed = seed
+        self.rng = RandomSource.coerce(rng)
+        self.spectator_sims = spectator_sims if spectator_sims is not None else max(1, amount_of_sims // 4)
+        # Adaptive sampling (run_adaptive_simulation); None tolerance = fixed count
+        self.tolerance = tolerance
+        self.max_sims = max_sims if max_sims is not None else 4 * amount_of_sims
+        self.leg_enumerator = LegEnumerator()
+        self.batch_simulator = None
+        if mode == "vectorized":
+            # Imported lazily so the game itself does not depend on NumPy
+            from BatchSimulator import BatchSimulator
+
+            # An injected NumPy Generator drives unseeded vectorized runs
+            self.batch_simulator = BatchSimulator(seed=seed if seed is not None else self.rng.generator)
+        self.cache = SimulationCache(cache_size)
+        self.instrumentation = instrumentation or Instrumentation()
+
+        # Master seed stream for per-chunk seeds; None draws from self.rng
+        self._seed_stream = random.Random(seed) if seed is not None else None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        # Exact first-leg answers for opening boards, if a book has been built
+        self.opening_book: Optional[OpeningBook] = None
+        if opening_book_path and os.path.exists(opening_book_path):
+            try:
+                self.opening_book = OpeningBook(opening_book_path)
+            except ValueError:
+                # Built for other rules; fall back to simulating
+                self.opening_book = None
+
+    def start_pool(self) -> None:
+        """
+        Start the worker processes up front so the first hint does not pay for it.
+
+        Does nothing when workers == 1 or the pool is already running.
+
+        Returns:
+            None
+        """
+        if self.workers == 1 or self._pool is not None:
+            return
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        # Workers are spawned on demand; one task per worker forces them all up
+        for future in [self._pool.submit(_warm_up) for _ in range(self.workers)]:
+            future.result()
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool and release the opening book, if any.
+
+        Returns:
+            None
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self.opening_book is not None:
+            self.opening_book.close()
+            self.opening_book = None
 
     def run_simulation(
         self,
@@ -25,7 +127,10 @@ class AIPlayer:
         remaining_die: List[str],
     ) -> Tuple[Dict[str, List[int]], List[int]]:
         """
-        Run Monte Carlo simulations for the current leg.
+        Run simulations for the current leg.
+
+        In "exact" mode the returned values are probabilities / expected counts
+        rather than raw counts; display_stats handles both.
 
         Args:
             race_track_simulatable_list:
@@ -38,6 +143,566 @@ class AIPlayer:
               - placement_counts: dict[color] -> [first_place_count, second_place_count]
               - tile_placement: list where tile_placement[i] is how many times a camel
                 ended a roll on tile i across all simulations.
+
+            Cached results are returned as fresh copies, so callers may mutate them.
+            Opening positions found in the opening book return exact probabilities
+            in every mode.
+        """
+        placement_counts, tile_placement, _ = self.simulation_result(race_track_simulatable_list, remaining_die)
+        return placement_counts, tile_placement
+
+    def simulation_result(
+        self,
+        race_track_simulatable_list: List[Tuple[str, int]],
+        remaining_die: List[str],
+    ) -> Tuple[Dict[str, List[int]], List[int], bool]:
+        """
+        run_simulation, also telling whether the result is exact.
+
+        Args:
+            race_track_simulatable_list: Current camel positions (see run_simulation).
+            remaining_die: Colors of dice still in the pyramid.
+
+        Returns:
+            (placement_counts, tile_placement, exact): as from run_simulation,
+            and True if they are probabilities from "exact" mode or the
+            opening book rather than sampled counts.
+        """
+        key = self._cache_key(race_track_simulatable_list, remaining_die)
+        found = self._lookup(key, race_track_simulatable_list, remaining_die)
+        if found is None:
+            with self.instrumentation.phase("ai.simulate"):
+                result = self._simulate(race_track_simulatable_list, remaining_die, self.amount_of_sims)
+            self.cache.put(key, result)
+            found = result + (self.mode == "exact",)
+
+        placement_counts, tile_placement, exact = found
+        return {color: list(counts) for color, counts in placement_counts.items()}, list(tile_placement), exact
+
+    def hint_batch(
+        self,
+        states: Iterable[Tuple[List[Tuple], List[str], Dict[str, int], Set[int]]],
+        window: int = 1024,
+    ) -> Iterator[Dict[str, float]]:
+        """
+        Stream display_stats EVs for many positions, in input order.
+
+        States are read `window` at a time. Within a window every distinct board
+        is simulated once (positions that differ only in bets or empty spaces
+        share the simulation), the opening book and cache are consulted first,
+        and results are cached for later windows and calls. With `workers > 1`
+        the distinct boards are split into groups that run in the pool in
+        parallel, each simulated with all `amount_of_sims` legs and its own
+        seed. Adaptive sampling (`tolerance`) is not used here.
+
+        Args:
+            states: (race track list, unrolled dice, available bets, empty
+                spaces) per position, as passed to run_simulation and
+                display_stats.
+            window: Positions read and scheduled together.
+
+        Raises:
+            ValueError: If window is less than 1.
+
+        Returns:
+            Iterator[dict[str, float]]: One EV dict per state (see display_stats).
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        batch: List[Tuple[List[Tuple], List[str], Dict[str, int], Set[int]]] = []
+        for state in states:
+            batch.append(state)
+            if len(batch) == window:
+                yield from self._hint_window(batch)
+                batch = []
+        if batch:
+            yield from self._hint_window(batch)
+
+    def _hint_window(
+        self,
+        states: List[Tuple[List[Tuple], List[str], Dict[str, int], Set[int]]],
+    ) -> Iterator[Dict[str, float]]:
+        """
+        Score one window of hint_batch: look up, schedule and yield in order.
+        """
+        keys: List[Tuple] = []
+        results: Dict[Tuple, Tuple[Dict[str, List[int]], List[int]]] = {}
+        misses: Dict[Tuple, Tuple[List[Tuple], List[str]]] = {}
+        for race_track_simulatable_list, remaining_die, _, _ in states:
+            key = self._cache_key(race_track_simulatable_list, remaining_die)
+            keys.append(key)
+            if key in results or key in misses:
+                continue
+            found = self._lookup(key, race_track_simulatable_list, remaining_die)
+            if found is None:
+                misses[key] = (list(race_track_simulatable_list), list(remaining_die))
+            else:
+                results[key] = found[:2]
+        self.instrumentation.count("ai.batch_states", len(states))
+        self.instrumentation.count("ai.batch_simulations", len(misses))
+
+        scheduled = self._schedule_batch(misses)
+        evs_by_state: Dict[Tuple, Dict[str, float]] = {}
+        for key, (_, remaining_die, available_bets, empty_spaces) in zip(keys, states):
+            if key not in results:
+                if key in scheduled:
+                    future, index = scheduled[key]
+                    results[key] = future.result()[index]
+                else:
+                    with self.instrumentation.phase("ai.simulate"):
+                        results[key] = self._simulate(*misses[key], self.amount_of_sims)
+                self.cache.put(key, results[key])
+
+            state_key = (key, tuple(sorted(available_bets.items())), frozenset(empty_spaces))
+            evs = evs_by_state.get(state_key)
+            if evs is None:
+                placement_counts, tile_placement = results[key]
+                evs = evs_by_state[state_key] = self.display_stats(
+                    placement_counts, tile_placement, available_bets, empty_spaces, remaining_die
+                )
+            yield dict(evs)
+
+    def _schedule_batch(
+        self,
+        misses: Dict[Tuple, Tuple[List[Tuple], List[str]]],
+    ) -> Dict[Tuple, Tuple[Future, int]]:
+        """
+        Submit hint_batch's uncached boards to the pool in contiguous groups.
+
+        Returns:
+            dict: key -> (future of the group's results, index in the group). Empty
+            when there is no pool; _hint_window then simulates in-process.
+        """
+        if self.workers == 1 or not misses:
+            return {}
+        self.start_pool()
+        items = list(misses.items())
+        # A few groups per worker keeps the pool busy while results stream out
+        group_size = -(-len(items) // (self.workers * 4))
+        scheduled: Dict[Tuple, Tuple[Future, int]] = {}
+        for start in range(0, len(items), group_size):
+            group = items[start:start + group_size]
+            future = self._pool.submit(
+                _simulate_positions,
+                self.mode,
+                self.amount_of_sims,
+                [(track, dice, self._next_seed()) for _, (track, dice) in group],
+            )
+            for index, (key, _) in enumerate(group):
+                scheduled[key] = (future, index)
+        return scheduled
+
+    def _cache_key(self, race_track_simulatable_list: List[Tuple], remaining_die: List[str]) -> Tuple:
+        """
+        Cache key of a position; settings that change the result are part of it.
+        """
+        return (self.mode, self.amount_of_sims) + SimulationCache.make_key(race_track_simulatable_list, remaining_die)
+
+    def _lookup(
+        self,
+        key: Tuple,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+    ) -> Optional[Tuple[Dict[str, List[int]], List[int], bool]]:
+        """
+        Answer a position from the opening book or the cache, if possible, as
+        (placement_counts, tile_placement, exact). Book answers are exact, and
+        so are cached ones in "exact" mode (the mode is part of the key).
+        """
+        if self.opening_book is not None:
+            book_result = self.opening_book.lookup(race_track_simulatable_list, remaining_die)
+            if book_result is not None:
+                self.instrumentation.count("ai.book_hits")
+                return book_result + (True,)
+        cached = self.cache.get(key)
+        if cached is None:
+            return None
+        self.instrumentation.count("ai.cache_hits")
+        return cached + (self.mode == "exact",)
+
+    def run_adaptive_simulation(
+        self,
+        race_track_simulatable_list: List[Tuple[str, int]],
+        remaining_die: List[str],
+        available_bets: Dict[str, int],
+        tolerance: Optional[float] = None,
+        batch_size: int = 500,
+        max_sims: Optional[int] = None,
+        z: float = 1.96,
+        empty_spaces: Optional[Set[int]] = None,
+    ) -> Tuple[Dict[str, List[int]], List[int], Dict[str, float]]:
+        """
+        Simulate in batches until the bet EVs are precise enough.
+
+        Stops as soon as either:
+          - every bet EV's confidence half-width is at most `tolerance`, or
+          - the best action (bets, rolling and display_stats' spectator tile)
+            is separated from every other action by their confidence intervals,
+        or when `max_sims` legs have been simulated. "exact" mode has no sampling
+        error and returns after one call.
+
+        Args:
+            race_track_simulatable_list: Current camel positions (see run_simulation).
+            remaining_die: Colors of dice still in the pyramid.
+            available_bets: dict[color] -> top payout value of the next ticket.
+            tolerance: Target half-width for every bet EV; defaults to self.tolerance.
+            batch_size: Number of legs simulated between checks.
+            max_sims: Upper bound on legs; defaults to self.max_sims.
+            z: Normal quantile for the interval (1.96 ~ 95%).
+            empty_spaces: Tiles where a spectator tile may be placed; defaults
+                to the empty spaces of the race track list (see empty_spaces_of).
+
+        Returns:
+            A tuple:
+              - placement_counts and tile_placement, as from run_simulation
+              - report: {"samples": legs simulated, "max_error": widest bet EV
+                half-width, "separated": 1.0 if the best action was separated}
+        """
+        tolerance = self.tolerance if tolerance is None else tolerance
+        max_sims = self.max_sims if max_sims is None else max_sims
+        if empty_spaces is None:
+            empty_spaces = self.empty_spaces_of(race_track_simulatable_list)
+
+        if self.mode == "exact":
+            placement_counts, tile_placement = self.run_simulation(race_track_simulatable_list, remaining_die)
+            return placement_counts, tile_placement, {"samples": 0, "max_error": 0.0, "separated": 1.0}
+
+        results: List[Tuple[Dict[str, List[int]], List[int]]] = []
+        samples = 0
+        while True:
+            n = min(batch_size, max_sims - samples)
+            results.append(self._simulate(race_track_simulatable_list, remaining_die, n))
+            samples += n
+            placement_counts, tile_placement = AIPlayer.merge_results(results)
+            results = [(placement_counts, tile_placement)]
+
+            errors = self.bet_ev_errors(placement_counts, available_bets, z)
+            max_error = max(errors.values(), default=0.0)
+            separated = self._is_separated(
+                placement_counts, tile_placement, available_bets, empty_spaces, remaining_die, z
+            )
+            if max_error <= tolerance or separated or samples >= max_sims:
+                break
+
+        report = {"samples": samples, "max_error": max_error, "separated": 1.0 if separated else 0.0}
+        return placement_counts, tile_placement, report
+
+    def stream_hint(
+        self,
+        race_track_simulatable_list: List[Tuple[str, int]],
+        remaining_die: List[str],
+        available_bets: Dict[str, int],
+        empty_spaces: Set[int],
+        deadline: Optional[float] = None,
+        batch_size: int = 250,
+        max_sims: Optional[int] = None,
+        z: float = 1.96,
+    ) -> Iterator[Tuple[Dict[str, float], Dict[str, float], int]]:
+        """
+        Simulate in batches, yielding display_stats' EVs after every batch.
+
+        The first batch is always simulated, so there is at least one estimate
+        even if the deadline has already passed; after that the stream stops at
+        the first batch boundary past the deadline. Positions in the opening
+        book or the cache, and "exact" mode, are answered with one exact update.
+        A stream that runs to `amount_of_sims` legs caches its result like
+        run_simulation.
+
+        Args:
+            race_track_simulatable_list: Current camel positions (see run_simulation).
+            remaining_die: Colors of dice still in the pyramid.
+            available_bets: dict[color] -> top payout value of the next ticket.
+            empty_spaces: Tiles where a spectator tile may be placed.
+            deadline: time.perf_counter() value to stop at; None runs to max_sims.
+            batch_size: Legs simulated between updates.
+            max_sims: Legs to simulate at most; defaults to self.amount_of_sims.
+            z: Normal quantile for the half-widths (1.96 ~ 95%).
+
+        Raises:
+            ValueError: If batch_size is less than 1.
+
+        Returns:
+            Iterator of (evs, errors, samples):
+              - evs: as from display_stats
+              - errors: label -> confidence half-width (see hint_errors)
+              - samples: legs simulated so far (0 for exact answers)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        max_sims = self.amount_of_sims if max_sims is None else max_sims
+        key = self._cache_key(race_track_simulatable_list, remaining_die)
+        result = self._lookup(key, race_track_simulatable_list, remaining_die)
+        if result is None and self.mode == "exact":
+            result = self.simulation_result(race_track_simulatable_list, remaining_die)
+        if result is not None:
+            placement_counts, tile_placement, exact = result
+            samples = 0 if exact else int(sum(counts[0] for counts in placement_counts.values()))
+            evs = self.display_stats(placement_counts, tile_placement, available_bets, empty_spaces, remaining_die)
+            if exact:
+                errors = {label: 0.0 for label in evs}
+            else:
+                errors = self.hint_errors(placement_counts, tile_placement, available_bets, empty_spaces, z)
+            yield evs, errors, samples
+            return
+
+        results: List[Tuple[Dict[str, List[int]], List[int]]] = []
+        samples = 0
+        while samples < max_sims:
+            n = min(batch_size, max_sims - samples)
+            with self.instrumentation.phase("ai.simulate"):
+                results.append(self._simulate(race_track_simulatable_list, remaining_die, n))
+            samples += n
+            placement_counts, tile_placement = AIPlayer.merge_results(results)
+            results = [(placement_counts, tile_placement)]
+            evs = self.display_stats(placement_counts, tile_placement, available_bets, empty_spaces, remaining_die)
+            errors = self.hint_errors(placement_counts, tile_placement, available_bets, empty_spaces, z)
+            yield evs, errors, samples
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+        if samples == self.amount_of_sims:
+            self.cache.put(key, results[0])
+
+    @staticmethod
+    def empty_spaces_of(
+        race_track_simulatable_list: List[Tuple],
+        track_length: int = CompactBoard.TRACK_LENGTH,
+    ) -> Set[int]:
+        """
+        RaceTrack.empty_spaces() recovered from a simulatable list.
+
+        Args:
+            race_track_simulatable_list: Output of RaceTrack.to_simulatable_list().
+            track_length: Number of tiles on the track.
+
+        Returns:
+            set[int]: Tiles with no camel that are neither a spectator tile nor
+            next to one.
+        """
+        spaces = set(range(track_length))
+        for entry in race_track_simulatable_list:
+            if entry[0] == "spectator":
+                spaces.difference_update((entry[1] - 1, entry[1], entry[1] + 1))
+            else:
+                spaces.discard(entry[1])
+        return spaces
+
+    @staticmethod
+    def hint_errors(
+        placement_dict: Dict[str, List[int]],
+        tile_placement: List[int],
+        available_bets: Dict[str, int],
+        empty_spaces: Set[int],
+        z: float = 1.96,
+    ) -> Dict[str, float]:
+        """
+        Confidence half-widths of the EVs display_stats computes from sampled counts.
+
+        Bets use bet_ev_errors. A spectator tile's landings per leg are treated
+        as Poisson, so its half-width is z * sqrt(count) / sims; that is a slight
+        overestimate, since a camel rarely lands on one tile twice in a leg.
+        Rolling always pays its fixed EV, so its half-width is 0.
+
+        Args:
+            placement_dict: dict[color] -> [first_place_count, second_place_count]
+            tile_placement: Tile landing counts.
+            available_bets: dict[color] -> top payout value of the next ticket.
+            empty_spaces: Tiles where a spectator tile may be placed.
+            z: Normal quantile for the interval.
+
+        Returns:
+            dict[str, float]: label -> half-width, for every bet, every empty
+            tile as "spt_<index>", and "roll".
+        """
+        errors = AIPlayer.bet_ev_errors(placement_dict, available_bets, z)
+        sims = float(sum(counts[0] for counts in placement_dict.values()))
+        for index, count in enumerate(tile_placement):
+            if index in empty_spaces:
+                errors[f"spt_{index}"] = z * math.sqrt(count) / sims if sims > 0 else 0.0
+        errors["roll"] = 0.0
+        return errors
+
+    def run_race_simulation(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        amount_of_sims: Optional[int] = None,
+    ) -> Tuple[Dict[str, float], Dict[str, float], float]:
+        """
+        Estimate who wins and who loses the whole race, playing leg after leg.
+
+        Args:
+            race_track_simulatable_list: Current camel positions and spectator tiles.
+            remaining_die: Colors of dice still in the pyramid this leg.
+            amount_of_sims: Races to simulate; defaults to self.amount_of_sims.
+
+        Returns:
+            A tuple:
+              - winner_probs: dict[color] -> probability of winning the race
+              - loser_probs: dict[color] -> probability of finishing last
+              - expected_legs: expected legs until the race ends (current leg = 1)
+        """
+        amount_of_sims = self.amount_of_sims if amount_of_sims is None else amount_of_sims
+        rng = RandomSource(self._next_seed()) if self.seed is not None else self.rng
+        return RaceSimulator(rng=rng).simulate(race_track_simulatable_list, remaining_die, amount_of_sims)
+
+    @staticmethod
+    def bet_ev_errors(
+        placement_dict: Dict[str, List[int]],
+        available_bets: Dict[str, int],
+        z: float = 1.96,
+    ) -> Dict[str, float]:
+        """
+        Confidence half-width of each bet EV computed by display_stats.
+
+        A bet pays the ticket value for 1st, 1 for 2nd and -1 otherwise, so its
+        per-leg variance follows directly from the 1st/2nd counts.
+
+        Args:
+            placement_dict: dict[color] -> [first_place_count, second_place_count]
+            available_bets: dict[color] -> top payout value of the next ticket.
+            z: Normal quantile for the interval.
+
+        Returns:
+            dict[str, float]: color -> half-width (0.0 when no ticket is left).
+        """
+        sims = float(sum(counts[0] for counts in placement_dict.values()))
+        errors: Dict[str, float] = {}
+        for color, (first_count, second_count) in placement_dict.items():
+            top_bet_value = available_bets.get(color, 0)
+            if top_bet_value == 0 or sims <= 0:
+                errors[color] = 0.0
+                continue
+            remaining = sims - first_count - second_count
+            mean = (first_count * top_bet_value + second_count - remaining) / sims
+            second_moment = (first_count * top_bet_value ** 2 + second_count + remaining) / sims
+            variance = max(second_moment - mean ** 2, 0.0)
+            errors[color] = z * math.sqrt(variance / sims)
+        return errors
+
+    def _is_separated(
+        self,
+        placement_dict: Dict[str, List[int]],
+        tile_placement: List[int],
+        available_bets: Dict[str, int],
+        empty_spaces: Set[int],
+        unrolled_dice: List[str],
+        z: float,
+    ) -> bool:
+        """
+        True if the best action's lower bound beats every other action's upper bound.
+        """
+        evs = self.display_stats(placement_dict, tile_placement, available_bets, empty_spaces, unrolled_dice)
+        errors = self.hint_errors(placement_dict, tile_placement, available_bets, empty_spaces, z)
+        intervals = [(ev, errors.get(action, 0.0)) for action, ev in evs.items()]
+        intervals.sort(reverse=True)
+        best_ev, best_error = intervals[0]
+        return all(best_ev - best_error > ev + error for ev, error in intervals[1:])
+
+    @staticmethod
+    def merge_results(
+        results: List[Tuple[Dict[str, List[int]], List[int]]],
+    ) -> Tuple[Dict[str, List[int]], List[int]]:
+        """
+        Add up several (placement_counts, tile_placement) results.
+
+        Args:
+            results: Results from run_simulation-style calls on the same position.
+
+        Returns:
+            The summed (placement_counts, tile_placement).
+        """
+        placement_counts: Dict[str, List[int]] = {}
+        tile_placement: List[int] = []
+        for chunk_counts, chunk_tiles in results:
+            for color, (first, second) in chunk_counts.items():
+                counts = placement_counts.setdefault(color, [0, 0])
+                counts[0] += first
+                counts[1] += second
+            if not tile_placement:
+                tile_placement = [0] * len(chunk_tiles)
+            for i, count in enumerate(chunk_tiles):
+                tile_placement[i] += count
+        return placement_counts, tile_placement
+
+    def _simulate(
+        self,
+        race_track_simulatable_list: List[Tuple[str, int]],
+        remaining_die: List[str],
+        amount_of_sims: int,
+    ) -> Tuple[Dict[str, List[int]], List[int]]:
+        """
+        Run one uncached simulation with the configured mode, pool and seeding.
+        """
+        if self.mode == "exact":
+            return self.leg_enumerator.enumerate_leg(race_track_simulatable_list, remaining_die)
+        if self.workers > 1 or self._seed_stream is not None:
+            return self._run_seeded_chunks(race_track_simulatable_list, remaining_die, amount_of_sims)
+        return self._sample(race_track_simulatable_list, remaining_die, amount_of_sims)
+
+    def _run_seeded_chunks(
+        self,
+        race_track_simulatable_list: List[Tuple[str, int]],
+        remaining_die: List[str],
+        amount_of_sims: int,
+    ) -> Tuple[Dict[str, List[int]], List[int]]:
+        """
+        Split the sims into one seeded chunk per worker and merge the counts.
+
+        Seeds come from one master stream, so results are reproducible for a
+        given seed and worker count.
+        """
+        base, extra = divmod(amount_of_sims, self.workers)
+        chunks = [
+            (
+                self.mode,
+                race_track_simulatable_list,
+                list(remaining_die),
+                base + (1 if i < extra else 0),
+                self._next_seed(),
+            )
+            for i in range(self.workers)
+        ]
+
+        if self.workers > 1:
+            self.start_pool()
+            results = [future.result() for future in [self._pool.submit(_simulate_chunk, *c) for c in chunks]]
+        else:
+            results = [_simulate_chunk(*chunks[0])]
+        return AIPlayer.merge_results(results)
+
+    def _next_seed(self) -> int:
+        """
+        Seed for one pool task, from `seed` or, without one, from self.rng.
+        """
+        if self._seed_stream is None:
+            self._seed_stream = random.Random(self.rng.getrandbits(64))
+        return self._seed_stream.getrandbits(64)
+
+    def _sample(
+        self,
+        race_track_simulatable_list: List[Tuple[str, int]],
+        remaining_die: List[str],
+        amount_of_sims: int,
+    ) -> Tuple[Dict[str, List[int]], List[int]]:
+        """
+        Sample legs with the configured sampling mode.
+        """
+        if self.mode == "vectorized":
+            return self.batch_simulator.simulate(race_track_simulatable_list, remaining_die, amount_of_sims)
+        return self._run_monte_carlo(race_track_simulatable_list, remaining_die, amount_of_sims)
+
+    def _run_monte_carlo(
+        self,
+        race_track_simulatable_list: List[Tuple[str, int]],
+        remaining_die: List[str],
+        amount_of_sims: int,
+    ) -> Tuple[Dict[str, List[int]], List[int]]:
+        """
+        Sample `amount_of_sims` random legs. See run_simulation for the return shape.
+
+        Legs are drawn in bulk with RandomSource.legs and stepped through a
+        CompactBoard move table built once per position, with the spectator
+        tiles already folded in.
         """
         # Statistics: color -> [first_count, second_count]
         placement_counts: Dict[str, List[int]] = {
@@ -48,35 +713,67 @@ class AIPlayer:
             "purple": [0, 0],
         }
 
-        # Track how often each tile is landed on; default to track length 16
-        # (Matches default RaceTrack length.)
-        tile_placement: List[int] = [0] * 16
-
-        # Pre-copy of positions to avoid accidental mutation of callers' list
-        initial_positions = list(race_track_simulatable_list)
-
-        for _ in range(self.amount_of_sims):
-            sim_track = RaceTrack()
-            sim_track.set_up_camels(initial_positions)
-
-            sim_pyramid = Pyramid.from_simulatable(remaining_die)
+        # Track how often each tile is landed on (default RaceTrack length)
+        track_length = CompactBoard.TRACK_LENGTH
+        tile_placement: List[int] = [0] * track_length
+
+        # Start stacks and the move lookup (spectator tiles included), shared by every leg
+        start_stacks, start_tiles = CompactBoard.to_stacks(
+            CompactBoard.from_simulatable(race_track_simulatable_list), track_length
+        )
+        table = CompactBoard.move_table(
+            CompactBoard.spectator_effects(race_track_simulatable_list, track_length), track_length
+        )
+        move = CompactBoard.move_stacks
+        color_index = CompactBoard.COLOR_INDEX
+        regular_colors = CompactBoard.REGULAR_COLORS
+
+        # Phase times are summed locally and recorded once, to keep the loop cheap
+        clock = time.perf_counter if self.instrumentation.enabled else None
+        setup_seconds = roll_seconds = ranking_seconds = 0.0
+        moves = 0
+
+        # Every leg's dice order and faces, drawn a block at a time
+        for leg in self.rng.legs(remaining_die, amount_of_sims):
+            if clock:
+                started = clock()
+            stacks = start_stacks.copy()
+            tiles = start_tiles.copy()
+            if clock:
+                setup_done = clock()
 
             # Play out the rest of the leg
-            while sim_pyramid.unrolled_dice:
-                returned_dice_color, amount, _ = sim_pyramid.roll()
-
-                sim_track.location_update(returned_dice_color, amount)
-
-                index = sim_track.find_camel(returned_dice_color)
-                if index is not None and 0 <= index < len(tile_placement):
-                    tile_placement[index] += 1  # record landing tile
-
-            placements = sim_track.get_camel_placements()  # tuple of 5 colors: 1st..5th
-            color1 = placements[0]  # 1st place color
-            color2 = placements[1]  # 2nd place color
+            for returned_dice_color, amount in Pyramid.leg_moves(leg):
+                _, final, crossed = move(stacks, tiles, color_index[returned_dice_color], amount, table)
+                moves += 1
+
+                if final >= 0:
+                    tile_placement[final] += 1  # record landing tile
+                if crossed:
+                    # The race, and with it the leg, is over
+                    break
+            if clock:
+                rolls_done = clock()
+
+            ranking = CompactBoard.stack_ranking(stacks)  # regular camels, 1st..5th
+            color1 = regular_colors[ranking[0]]  # 1st place color
+            color2 = regular_colors[ranking[1]]  # 2nd place color
 
             placement_counts[color1][0] += 1
             placement_counts[color2][1] += 1
+            if clock:
+                ranked = clock()
+                setup_seconds += setup_done - started
+                roll_seconds += rolls_done - setup_done
+                ranking_seconds += ranked - rolls_done
+
+        if clock:
+            instrumentation = self.instrumentation
+            instrumentation.add_time("ai.setup", setup_seconds, amount_of_sims)
+            instrumentation.add_time("ai.roll_loop", roll_seconds, amount_of_sims)
+            instrumentation.add_time("ai.ranking", ranking_seconds, amount_of_sims)
+            instrumentation.count("ai.simulated_legs", amount_of_sims)
+            instrumentation.count("ai.simulated_moves", moves)
 
         return placement_counts, tile_placement
 
@@ -98,6 +795,7 @@ class AIPlayer:
 
         Args:
             placement_dict: dict[color] -> [first_place_count, second_place_count]
+                (counts or probabilities)
             tile_placement: list of tile landing counts from run_simulation
             available_bets: dict[color] -> top payout value of the next ticket
             empty_spaces: set of tile indices where tiles can be placed
@@ -109,8 +807,15 @@ class AIPlayer:
                 - "spt_<index>" -> EV of placing a spectator tile at that index
                 - "roll" -> heuristic EV of rolling
         """
+        started = self.instrumentation.start()
         evs: Dict[str, float] = {}
 
+        # Every simulated leg has exactly one winner, so the 1st-place counts add up
+        # to the number of sims (or to 1.0 for exact probabilities).
+        sims = float(sum(counts[0] for counts in placement_dict.values()))
+        if sims <= 0:
+            sims = float(self.amount_of_sims)
+
         # EV for each color bet
         for color, counts in placement_dict.items():
             first_count, second_count = counts
@@ -120,7 +825,6 @@ class AIPlayer:
                 evs[color] = 0.0
                 continue
 
-            sims = float(self.amount_of_sims)
             remaining = sims - first_count - second_count
 
             # EV formula:
@@ -144,10 +848,122 @@ class AIPlayer:
                 max_count = count
 
         if max_index >= 0:
-            ev_spectator_tile = max_count / float(self.amount_of_sims)
+            ev_spectator_tile = max_count / sims
             evs[f"spt_{max_index}"] = ev_spectator_tile
 
-        # Rough EV for rolling
+        evs["roll"] = self.roll_ev(unrolled_dice)
+
+        self.instrumentation.stop("ai.stats", started)
+        return evs
+
+    def evaluate_spectator_tiles(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        empty_spaces: Set[int],
+        open_bets: List[Tuple[str, Tuple[int, ...]]] = (),
+    ) -> Dict[Tuple[int, int], Dict[str, float]]:
+        """
+        Score every legal spectator tile with both signs; see SpectatorEvaluator.
+
+        All tiles share `spectator_sims` legs (a quarter of amount_of_sims by
+        default). Results are cached like run_simulation's.
+
+        Args:
+            race_track_simulatable_list: Current camel positions and spectator tiles.
+            remaining_die: Colors of dice still in the pyramid.
+            empty_spaces: Tiles where a spectator tile may be placed.
+            open_bets: The placing player's bets as (color, payouts by placement).
+
+        Returns:
+            dict[(tile, sign)] -> {"payout", "bets", "ev"}.
+        """
+        key = (
+            ("spectators", self.spectator_sims)
+            + SimulationCache.make_key(race_track_simulatable_list, remaining_die)
+            + (frozenset(empty_spaces), tuple(sorted((color, tuple(payouts)) for color, payouts in open_bets)))
+        )
+        cached = self.cache.get(key)
+        if cached is None:
+            rng = RandomSource(self._next_seed()) if self.seed is not None else self.rng
+            with self.instrumentation.phase("ai.spectators"):
+                cached = SpectatorEvaluator(rng=rng).evaluate(
+                    race_track_simulatable_list, remaining_die, empty_spaces, open_bets, self.spectator_sims
+                )
+            self.cache.put(key, cached)
+        return {option: dict(scores) for option, scores in cached.items()}
+
+    def score_spectator_tiles(
+        self,
+        evs: Dict[str, float],
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        empty_spaces: Set[int],
+        open_bets: List[Tuple[str, Tuple[int, ...]]] = (),
+    ) -> Dict[str, float]:
+        """
+        Replace display_stats' single "spt_<index>" suggestion with every legal tile.
+
+        Each tile gets its better sign as "spt_<index>+" or "spt_<index>-" (see
+        spectator_label), with the EV from evaluate_spectator_tiles.
+
+        Args:
+            evs: Output of display_stats.
+            race_track_simulatable_list: Current camel positions and spectator tiles.
+            remaining_die: Colors of dice still in the pyramid.
+            empty_spaces: Tiles where a spectator tile may be placed.
+            open_bets: The placing player's bets as (color, payouts by placement).
+
+        Returns:
+            dict[str, float]: The EVs with spectator tile options rescored.
+        """
+        scored = {label: ev for label, ev in evs.items() if not label.startswith("spt_")}
+        best: Dict[int, Tuple[float, int]] = {}
+        options = self.evaluate_spectator_tiles(race_track_simulatable_list, remaining_die, empty_spaces, open_bets)
+        for (tile, sign), scores in options.items():
+            if tile not in best or scores["ev"] > best[tile][0]:
+                best[tile] = (scores["ev"], sign)
+        for tile, (ev, sign) in sorted(best.items()):
+            scored[AIPlayer.spectator_label(tile, sign)] = ev
+        return scored
+
+    @staticmethod
+    def spectator_label(tile: int, sign: int) -> str:
+        """
+        EV label of a spectator tile option, e.g. "spt_7+" or "spt_7-".
+        """
+        return f"spt_{tile}{'+' if sign > 0 else '-'}"
+
+    @staticmethod
+    def parse_spectator_label(label: str) -> Tuple[int, int]:
+        """
+        Inverse of spectator_label. A bare "spt_<index>" from display_stats means
+        a negative tile, which is what the AI used to place.
+
+        Args:
+            label: An EV label starting with "spt_".
+
+        Returns:
+            tuple[int, int]: (tile, sign).
+        """
+        body = label[4:]
+        if body.endswith("+"):
+            return int(body[:-1]), 1
+        if body.endswith("-"):
+            return int(body[:-1]), -1
+        return int(body), -1
+
+    @staticmethod
+    def roll_ev(unrolled_dice: List[str]) -> float:
+        """
+        Rough EV of rolling a die, used by display_stats.
+
+        Args:
+            unrolled_dice: list of dice colors still in the pyramid
+
+        Returns:
+            float: Share of "good" (regular) dice, truncated to 2 decimals.
+        """
         good_dice = len(unrolled_dice)
         unrolled_set = set(unrolled_dice)
         if "black" in unrolled_set:
@@ -161,6 +977,41 @@ class AIPlayer:
         else:
             roll_ev = 0.0
 
-        evs["roll"] = roll_ev
+        return roll_ev
 
-        return evs
+
+def _warm_up() -> int:
+    """
+    No-op task used to spawn AIPlayer pool workers ahead of the first hint.
+    """
+    return 0
+
+
+def _simulate_positions(
+    mode: str,
+    amount_of_sims: int,
+    positions: List[Tuple[List[Tuple], List[str], int]],
+) -> List[Tuple[Dict[str, List[int]], List[int]]]:
+    """
+    Simulate a group of (race track list, remaining dice, seed) positions in a
+    pool worker, for AIPlayer.hint_batch.
+    """
+    if mode == "exact":
+        # One enumerator, so its memo is shared by the whole group
+        leg_enumerator = LegEnumerator()
+        return [leg_enumerator.enumerate_leg(track, dice) for track, dice, _ in positions]
+    return [_simulate_chunk(mode, track, dice, amount_of_sims, seed) for track, dice, seed in positions]
+
+
+def _simulate_chunk(
+    mode: str,
+    race_track_simulatable_list: List[Tuple[str, int]],
+    remaining_die: List[str],
+    amount_of_sims: int,
+    seed: int,
+) -> Tuple[Dict[str, List[int]], List[int]]:
+    """
+    Run one seeded chunk of simulations (in a pool worker or in-process).
+    """
+    ai = AIPlayer(amount_of_sims, mode=mode, cache_size=0, seed=seed, opening_book_path=None, rng=seed)
+    return ai._sample(race_track_simulatable_list, remaining_die, amount_of_sims)
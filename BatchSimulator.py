@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+
+class BatchSimulator:
+    """
+    Vectorized Monte Carlo leg simulator.
+
+    Keeps N boards as NumPy arrays and advances all of them with one roll per step,
+    instead of building a RaceTrack / Pyramid per simulation and stepping one die at
+    a time. Produces the same statistics as the Monte Carlo loop in
+    AIPlayer.run_simulation, with the same rules: spectator tiles (through a
+    per-tile effect array), crazy camels carrying their stacks backwards, and
+    each leg ending with its last regular die or a camel crossing the finish.
+
+    Board layout (one row per simulated board, one column per camel in
+    DICE_COLORS order):
+        tiles (int16[N, 7]): tile index of each camel, -1 if not on the track.
+        heights (int16[N, 7]): position within the tile stack (0 = bottom).
+        remaining (bool[N, 7]): dice still in the pyramid.
+        finished (bool[N]): a camel crossed the finish line.
+    """
+
+    REGULAR_COLORS = ("blue", "green", "yellow", "red", "purple")
+    DICE_COLORS = ("blue", "green", "yellow", "red", "purple", "black", "white")
+
+    def __init__(
+        self,
+        track_length: int = 16,
+        batch_size: int = 65536,
+        seed: Union[int, np.random.Generator, None] = None,
+    ) -> None:
+        self.track_length = track_length
+        self.batch_size = batch_size
+        self.rng = np.random.default_rng(seed)
+
+        n_dice = len(self.DICE_COLORS)
+        self._is_crazy = np.zeros(n_dice, dtype=bool)
+        self._is_crazy[self.DICE_COLORS.index("black")] = True
+        self._is_crazy[self.DICE_COLORS.index("white")] = True
+        self._is_regular = ~self._is_crazy
+
+    def simulate(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        amount_of_sims: int,
+    ) -> Tuple[Dict[str, List[int]], List[int]]:
+        """
+        Simulate `amount_of_sims` legs from the given position.
+
+        Args:
+            race_track_simulatable_list:
+                Output of RaceTrack.to_simulatable_list(), spectator tiles included.
+            remaining_die:
+                List of colors that are still in the pyramid (unrolled).
+            amount_of_sims:
+                Number of legs to simulate.
+
+        Returns:
+            Same shape as AIPlayer.run_simulation:
+              - placement_counts: dict[color] -> [first_place_count, second_place_count]
+              - tile_placement: list of landing counts per tile
+        """
+        start_tiles, start_heights = self._encode(race_track_simulatable_list)
+        start_remaining = np.array([color in remaining_die for color in self.DICE_COLORS], dtype=bool)
+        effects = np.zeros(self.track_length, dtype=np.int16)
+        for entry in race_track_simulatable_list:
+            if entry[0] == "spectator":
+                effects[entry[1]] = entry[2]
+
+        n_regular = len(self.REGULAR_COLORS)
+        first_counts = np.zeros(n_regular, dtype=np.int64)
+        second_counts = np.zeros(n_regular, dtype=np.int64)
+        tile_counts = np.zeros(self.track_length, dtype=np.int64)
+
+        done = 0
+        while done < amount_of_sims:
+            n = min(self.batch_size, amount_of_sims - done)
+            tiles = np.tile(start_tiles, (n, 1))
+            heights = np.tile(start_heights, (n, 1))
+            remaining = np.tile(start_remaining, (n, 1))
+
+            self._play_leg(tiles, heights, remaining, effects, tile_counts)
+
+            first, second = self._rank_top_two(tiles, heights)
+            valid = first >= 0
+            first_counts += np.bincount(first[valid], minlength=n_regular)
+            valid = second >= 0
+            second_counts += np.bincount(second[valid], minlength=n_regular)
+            done += n
+
+        placement_counts = {
+            color: [int(first_counts[i]), int(second_counts[i])]
+            for i, color in enumerate(self.REGULAR_COLORS)
+        }
+        return placement_counts, [int(count) for count in tile_counts]
+
+    def _encode(self, race_track_simulatable_list: List[Tuple]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert a simulatable list into per-camel tile and height rows.
+        """
+        tiles = np.full(len(self.DICE_COLORS), -1, dtype=np.int16)
+        heights = np.zeros(len(self.DICE_COLORS), dtype=np.int16)
+        stack_sizes: Dict[int, int] = {}
+        for entry in race_track_simulatable_list:
+            color, tile_idx = entry[0], entry[1]
+            if color not in self.DICE_COLORS:
+                continue
+            col = self.DICE_COLORS.index(color)
+            tiles[col] = tile_idx
+            heights[col] = stack_sizes.get(tile_idx, 0)
+            stack_sizes[tile_idx] = heights[col] + 1
+        return tiles, heights
+
+    def _play_leg(
+        self,
+        tiles: np.ndarray,
+        heights: np.ndarray,
+        remaining: np.ndarray,
+        effects: np.ndarray,
+        tile_counts: np.ndarray,
+    ) -> None:
+        """
+        Roll dice on every board until its leg ends, updating arrays in place.
+
+        A board's leg ends once no regular die is left in its pyramid, or when a
+        regular camel crosses the finish line.
+        """
+        n_boards, n_dice = tiles.shape
+        rows = np.arange(n_boards)
+        finished = np.zeros(n_boards, dtype=bool)
+        has_tiles = bool(effects.any())
+
+        while True:
+            active = ~finished & (remaining & self._is_regular).any(axis=1)
+            if not active.any():
+                return
+            n_left = remaining.sum(axis=1)
+
+            # Pick a uniformly random remaining die on each active board
+            pick = (self.rng.random(n_boards) * n_left).astype(np.int64)
+            die = (np.cumsum(remaining, axis=1) > pick[:, None]).argmax(axis=1)
+            face = self.rng.integers(1, 4, n_boards).astype(np.int16)
+
+            is_crazy = self._is_crazy[die]
+            # Dice whose camel is not on the track are removed without moving
+            moves = active & (tiles[rows, die] >= 0)
+
+            start_tile = tiles[rows, die]
+            start_height = heights[rows, die]
+            dest = start_tile + np.where(is_crazy, -face, face)
+            finished |= moves & ~is_crazy & (dest >= self.track_length)
+            dest = np.where(
+                is_crazy,
+                np.where(dest < 0, self.track_length - 1, np.where(dest >= self.track_length, 0, dest)),
+                np.clip(dest, 0, self.track_length - 1),
+            )
+
+            # The rolled camel carries everything stacked on top of it
+            moving = (
+                moves[:, None]
+                & (tiles == start_tile[:, None])
+                & (heights >= start_height[:, None])
+            )
+            staying_at_dest = (tiles == dest[:, None]) & ~moving & (tiles >= 0)
+            dest_size = staying_at_dest.sum(axis=1).astype(np.int16)
+
+            heights[:] = np.where(moving, dest_size[:, None] + heights - start_height[:, None], heights)
+            tiles[:] = np.where(moving, dest[:, None], tiles)
+
+            final = dest
+            if has_tiles:
+                final = self._bounce(tiles, heights, moving, moves, dest, effects)
+            tile_counts += np.bincount(final[moves], minlength=self.track_length)
+
+            # Take the die out of the pyramid; a crazy die removes its partner too
+            remaining[rows[active], die[active]] = False
+            crazy_rows = active & is_crazy
+            remaining[crazy_rows[:, None] & self._is_crazy[None, :]] = False
+
+    def _bounce(
+        self,
+        tiles: np.ndarray,
+        heights: np.ndarray,
+        moving: np.ndarray,
+        moves: np.ndarray,
+        dest: np.ndarray,
+        effects: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Apply spectator tiles to the stacks that just landed, in place.
+
+        A +1 tile puts the moving stack on top of the next tile, a -1 tile slides
+        it under the previous tile's stack, like RaceTrack.location_update.
+
+        Returns:
+            np.ndarray: Tile each moved stack ended on.
+        """
+        effect = np.where(moves, effects[dest], 0)
+        if not effect.any():
+            return dest
+        final = np.clip(dest + effect, 0, self.track_length - 1).astype(np.int16)
+        bounced = moving & (effect != 0)[:, None]
+        # Offsets within the moving stack, from its bottom camel
+        stack_base = np.where(moving, heights, np.iinfo(np.int16).max).min(axis=1)
+        offsets = heights - stack_base[:, None]
+        n_moving = moving.sum(axis=1).astype(np.int16)
+        others_at_final = (tiles == final[:, None]) & ~moving & (tiles >= 0)
+
+        forward = (effect > 0)[:, None]
+        final_size = others_at_final.sum(axis=1).astype(np.int16)
+        # Forward: on top of the next stack. Backward: underneath it
+        heights[:] = np.where(bounced & forward, final_size[:, None] + offsets, heights)
+        heights[:] = np.where(bounced & ~forward, offsets, heights)
+        heights[:] = np.where(
+            others_at_final & (effect < 0)[:, None], heights + n_moving[:, None], heights
+        )
+        tiles[:] = np.where(bounced, final[:, None], tiles)
+        return np.where(effect != 0, final, dest)
+
+    def _rank_top_two(self, tiles: np.ndarray, heights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the regular-camel index in 1st and 2nd place for each board (-1 if none).
+        """
+        n_regular = len(self.REGULAR_COLORS)
+        reg_tiles = tiles[:, :n_regular].astype(np.int32)
+        score = np.where(reg_tiles >= 0, reg_tiles * 16 + heights[:, :n_regular], -1)
+
+        order = np.argsort(-score, axis=1, kind="stable")
+        first = order[:, 0]
+        second = order[:, 1] if n_regular > 1 else np.full(len(tiles), -1)
+
+        rows = np.arange(len(tiles))
+        first = np.where(score[rows, first] >= 0, first, -1)
+        second = np.where(score[rows, second] >= 0, second, -1)
+        return first, second
@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from AIPlayer import AIPlayer
+from BettingTicketHolder import BettingTicketHolder
+from CamelPlayer import CamelPlayer
+from Pyramid import Pyramid
+from RaceTrack import RaceTrack
+from TerminalRenderer import TerminalRenderer
+
+
+class Benchmark:
+    """
+    Benchmark suite for the game's hot paths, with regression checks.
+
+    Every case runs on fixed, seeded inputs built from a handful of representative
+    boards, and only the measured call is timed (boards, pyramids and players are
+    prepared beforehand). Each case is timed `repeats` times and the best and
+    median time per operation are reported.
+
+    Raw timings depend on the machine and on how busy it is, so every timed repeat
+    is paired with a fixed pure-Python calibration loop run right before it, and
+    cases are compared on their time divided by the calibration time. That lets a
+    baseline recorded on one machine be checked on another (as long as the Python
+    version is similar) and absorbs CPU frequency changes during a run.
+
+    Usage:
+        python Benchmark.py                    # run, print JSON, compare to baseline
+        python Benchmark.py --update-baseline  # record a new baseline
+    """
+
+    DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+    # A case fails when it is this many times slower than the baseline
+    DEFAULT_THRESHOLD = 1.5
+
+    # name -> (camels as (color, tile_index) from bottom to top, spectator tiles, unrolled dice)
+    BOARDS: Dict[str, Tuple[List[Tuple[str, int]], Dict[int, int], List[str]]] = {
+        "spread": (
+            [("blue", 1), ("green", 3), ("yellow", 5), ("red", 7), ("purple", 9), ("white", 13), ("black", 15)],
+            {},
+            ["blue", "green", "yellow", "red", "purple", "black", "white"],
+        ),
+        "stacked": (
+            [("blue", 2), ("green", 2), ("yellow", 2), ("red", 2), ("purple", 2), ("black", 15), ("white", 15)],
+            {},
+            ["blue", "green", "yellow", "red", "purple", "black", "white"],
+        ),
+        "crazy_on_track": (
+            [("blue", 4), ("green", 4), ("black", 4), ("red", 6), ("white", 6), ("yellow", 8), ("purple", 10)],
+            {},
+            ["blue", "red", "purple", "black", "white"],
+        ),
+        "spectators": (
+            [("blue", 1), ("green", 1), ("yellow", 3), ("red", 5), ("purple", 5), ("black", 12), ("white", 15)],
+            {2: 1, 4: -1, 7: 1, 9: -1},
+            ["green", "yellow", "red", "black", "white"],
+        ),
+    }
+
+    def __init__(self, repeats: int = 5, scale: float = 1.0, seed: int = 1234) -> None:
+        """
+        Args:
+            repeats (int): Timed runs per case; the best and median are reported.
+            scale (float): Multiplier on the number of operations per run.
+            seed (int): Seed for every random choice made while preparing inputs.
+        """
+        if repeats < 1:
+            raise ValueError("repeats must be at least 1")
+        if scale <= 0:
+            raise ValueError("scale must be positive")
+        self.repeats = repeats
+        self.scale = scale
+        self.seed = seed
+
+    def run(self, names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Run the suite.
+
+        Args:
+            names (list[str] | None): Only run cases whose name starts with one of
+                these prefixes. Runs every case by default.
+
+        Returns:
+            dict: python version, calibration_seconds (best calibration time), and
+            benchmarks mapping each case name to ops, best_us and median_us
+            (microseconds per operation) and normalised (the lowest time per op
+            divided by the calibration time of the same repeat).
+        """
+        best_calibration = float("inf")
+        benchmarks: Dict[str, Dict[str, float]] = {}
+
+        for name, prepare, measure in self.cases():
+            if names and not any(name.startswith(prefix) for prefix in names):
+                continue
+            per_op: List[float] = []
+            normalised: List[float] = []
+            ops = 0
+            for repeat in range(self.repeats):
+                # Same inputs on every repeat, so repeats only differ by noise
+                state, ops = prepare(random.Random(self.seed))
+                calibration = self.calibrate()
+                best_calibration = min(best_calibration, calibration)
+                saved_state = random.getstate()
+                random.seed(self.seed + repeat)
+                try:
+                    start = time.perf_counter()
+                    measure(state)
+                    per_op.append((time.perf_counter() - start) / ops)
+                    normalised.append(per_op[-1] / calibration)
+                finally:
+                    random.setstate(saved_state)
+            best = min(per_op)
+            benchmarks[name] = {
+                "ops": ops,
+                "best_us": best * 1e6,
+                "median_us": statistics.median(per_op) * 1e6,
+                "normalised": min(normalised),
+            }
+
+        return {
+            "python": platform.python_version(),
+            "calibration_seconds": best_calibration,
+            "benchmarks": benchmarks,
+        }
+
+    def calibrate(self) -> float:
+        """
+        Time a fixed pure-Python workload, used to normalise case timings.
+
+        Returns:
+            float: Best of three runs of the workload, in seconds.
+        """
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            stacks: Dict[int, List[int]] = {}
+            total = 0
+            for i in range(20_000):
+                stacks.setdefault(i & 15, []).append(i)
+                total += i % 7
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    @staticmethod
+    def compare(
+        results: Dict[str, Any],
+        baseline: Dict[str, Any],
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> List[str]:
+        """
+        Compare a run against a baseline.
+
+        Args:
+            results (dict): Output of run.
+            baseline (dict): Output of an earlier run.
+            threshold (float): Allowed slowdown factor on the normalised time.
+
+        Returns:
+            list[str]: One message per case that got slower than the threshold.
+            Cases missing from either side are skipped.
+        """
+        regressions: List[str] = []
+        for name, current in results["benchmarks"].items():
+            reference = baseline.get("benchmarks", {}).get(name)
+            if reference is None or reference["normalised"] <= 0:
+                continue
+            ratio = current["normalised"] / reference["normalised"]
+            if ratio > threshold:
+                regressions.append(
+                    f"{name}: {ratio:.2f}x slower than baseline "
+                    f"({current['best_us']:.2f} us/op vs {reference['best_us']:.2f} us/op)"
+                )
+        return regressions
+
+    def cases(self) -> List[Tuple[str, Callable[[random.Random], Tuple[Any, int]], Callable[[Any], None]]]:
+        """
+        List every case as (name, prepare, measure).
+
+        `prepare(rng)` builds the inputs and returns (state, number of operations);
+        `measure(state)` performs those operations and is the only timed part.
+
+        Returns:
+            list[tuple]: The cases, in a stable order.
+        """
+        cases = []
+        for board in self.BOARDS:
+            cases.append((f"location_update/{board}", self._location_update_case(board), self._measure_moves))
+            cases.append((f"find_camel/{board}", self._track_case(board, 2000), self._measure_find_camel))
+            cases.append(
+                (f"get_camel_placements/{board}", self._track_case(board, 1000), self._measure_placements)
+            )
+            cases.append((f"run_simulation/{board}", self._simulation_case(board), self._measure_simulation))
+            cases.append((f"display_stats/{board}", self._display_stats_case(board), self._measure_display_stats))
+            cases.append((f"render_turn/{board}", self._render_case(board), self._measure_render))
+        cases.append(("pyramid_roll", self._pyramid_case, self._measure_rolls))
+        cases.append(("exchange_all_bets", self._bets_case, self._measure_bets))
+        return cases
+
+    def _ops(self, base: int) -> int:
+        return max(1, int(base * self.scale))
+
+    def _build_track(self, board: str) -> RaceTrack:
+        camels, spectators, _ = self.BOARDS[board]
+        race_track = RaceTrack()
+        race_track.set_up_camels(camels)
+        owner = CamelPlayer("benchmark")
+        for tile_idx, tile_type in spectators.items():
+            race_track.spectator_tiles[tile_idx] = (tile_type, owner)
+        return race_track
+
+    def _location_update_case(self, board: str) -> Callable[[random.Random], Tuple[Any, int]]:
+        def prepare(rng: random.Random) -> Tuple[Any, int]:
+            n = self._ops(300)
+            camels = [color for color, _ in self.BOARDS[board][0]]
+            moves = []
+            for _ in range(n):
+                color = rng.choice(camels)
+                amount = rng.randint(1, 3)
+                if color in {"black", "white"}:
+                    amount = -amount
+                moves.append((self._build_track(board), color, amount))
+            return moves, n
+
+        return prepare
+
+    @staticmethod
+    def _measure_moves(moves: List[Tuple[RaceTrack, str, int]]) -> None:
+        for race_track, color, amount in moves:
+            race_track.location_update(color, amount)
+
+    def _track_case(self, board: str, base_ops: int) -> Callable[[random.Random], Tuple[Any, int]]:
+        def prepare(rng: random.Random) -> Tuple[Any, int]:
+            n = self._ops(base_ops)
+            camels = [color for color, _ in self.BOARDS[board][0]]
+            return (self._build_track(board), [rng.choice(camels) for _ in range(n)]), n
+
+        return prepare
+
+    @staticmethod
+    def _measure_find_camel(state: Tuple[RaceTrack, List[str]]) -> None:
+        race_track, colors = state
+        for color in colors:
+            race_track.find_camel(color)
+
+    @staticmethod
+    def _measure_placements(state: Tuple[RaceTrack, List[str]]) -> None:
+        race_track, colors = state
+        for _ in colors:
+            race_track.get_camel_placements()
+
+    def _simulation_case(self, board: str) -> Callable[[random.Random], Tuple[Any, int]]:
+        def prepare(rng: random.Random) -> Tuple[Any, int]:
+            n = self._ops(3)
+            # No cache or opening book, so every call really simulates
+            ai_player = AIPlayer(200, cache_size=0, seed=rng.randrange(2**31), opening_book_path=None)
+            race_track = self._build_track(board)
+            dice = list(self.BOARDS[board][2])
+            return (ai_player, race_track.to_simulatable_list(), dice, n), n
+
+        return prepare
+
+    @staticmethod
+    def _measure_simulation(state: Tuple[AIPlayer, List[Tuple], List[str], int]) -> None:
+        ai_player, simulatable, dice, n = state
+        for _ in range(n):
+            ai_player.run_simulation(simulatable, dice)
+
+    def _display_stats_case(self, board: str) -> Callable[[random.Random], Tuple[Any, int]]:
+        def prepare(rng: random.Random) -> Tuple[Any, int]:
+            n = self._ops(2000)
+            ai_player = AIPlayer(200, cache_size=0, seed=rng.randrange(2**31), opening_book_path=None)
+            race_track = self._build_track(board)
+            dice = list(self.BOARDS[board][2])
+            placement_counts, tile_placement = ai_player.run_simulation(race_track.to_simulatable_list(), dice)
+            args = (
+                placement_counts,
+                tile_placement,
+                BettingTicketHolder().get_available_bets(),
+                race_track.empty_spaces(),
+                dice,
+            )
+            return (ai_player, args, n), n
+
+        return prepare
+
+    @staticmethod
+    def _measure_display_stats(state: Tuple[AIPlayer, Tuple, int]) -> None:
+        ai_player, args, n = state
+        for _ in range(n):
+            ai_player.display_stats(*args)
+
+    def _render_case(self, board: str) -> Callable[[random.Random], Tuple[Any, int]]:
+        def prepare(rng: random.Random) -> Tuple[Any, int]:
+            n = self._ops(300)
+            race_track = self._build_track(board)
+            renderer = TerminalRenderer(io.StringIO())
+            players = [CamelPlayer("Alice"), CamelPlayer("Bob")]
+            pyramid = Pyramid()
+            bets = BettingTicketHolder().get_available_bets()
+            renderer.render("\n".join(renderer.state_lines(bets, pyramid, race_track, players)))
+            # One coin change per turn, as after a roll
+            turns = [rng.choice(players) for _ in range(n)]
+            return (renderer, race_track, pyramid, bets, players, turns), n
+
+        return prepare
+
+    @staticmethod
+    def _measure_render(state: Tuple[Any, ...]) -> None:
+        renderer, race_track, pyramid, bets, players, turns = state
+        for player in turns:
+            player.amount_of_money += 1
+            renderer.render("\n".join(renderer.state_lines(bets, pyramid, race_track, players)))
+
+    def _pyramid_case(self, rng: random.Random) -> Tuple[Any, int]:
+        n = self._ops(400)
+        # Five rolls always fit in one leg: a crazy die removes at most one other die
+        return [Pyramid() for _ in range(n)], 5 * n
+
+    @staticmethod
+    def _measure_rolls(pyramids: List[Pyramid]) -> None:
+        for pyramid in pyramids:
+            pyramid.roll()
+            pyramid.roll()
+            pyramid.roll()
+            pyramid.roll()
+            pyramid.roll()
+
+    def _bets_case(self, rng: random.Random) -> Tuple[Any, int]:
+        n = self._ops(200)
+        ordering = ("blue", "green", "yellow", "red", "purple")
+        settlements = []
+        for _ in range(n):
+            holder = BettingTicketHolder()
+            players = [CamelPlayer(f"P{i}") for i in range(4)]
+            for _ in range(8):
+                holder.take_out_bet(rng.choice(ordering), rng.choice(players))
+            shuffled = list(ordering)
+            rng.shuffle(shuffled)
+            settlements.append((holder, players, tuple(shuffled)))
+        return settlements, n
+
+    @staticmethod
+    def _measure_bets(settlements: List[Tuple[BettingTicketHolder, List[CamelPlayer], Tuple[str, ...]]]) -> None:
+        for holder, players, ordering in settlements:
+            holder.exchange_all_bets(players, ordering)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the Camel Up hot paths.")
+    parser.add_argument("--output", help="also write the JSON results to this file")
+    parser.add_argument("--baseline", default=Benchmark.DEFAULT_BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=Benchmark.DEFAULT_THRESHOLD)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier on operations per case")
+    parser.add_argument("--only", nargs="*", help="run only cases starting with these prefixes")
+    args = parser.parse_args()
+
+    bench = Benchmark(repeats=args.repeats, scale=args.scale)
+    results = bench.run(args.only)
+    text = json.dumps(results, indent=2, sort_keys=True)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(text + "\n")
+
+    if args.update_baseline:
+        with open(args.baseline, "w") as baseline_file:
+            baseline_file.write(text + "\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+        sys.exit(0)
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one", file=sys.stderr)
+        sys.exit(0)
+
+    with open(args.baseline) as baseline_file:
+        regressions = Benchmark.compare(results, json.load(baseline_file), args.threshold)
+    if regressions:
+        print(f"PERFORMANCE REGRESSION ({len(regressions)} case(s) over {args.threshold}x):", file=sys.stderr)
+        for message in regressions:
+            print(f"  {message}", file=sys.stderr)
+        sys.exit(1)
+    print("No regressions against the baseline", file=sys.stderr)
@@ -0,0 +1,353 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+
+class CompactBoard:
+    """
+    Compact, immutable encoding of camel positions for simulation.
+
+    A board is a `bytes` object with two bytes per camel, in COLORS order:
+    (tile index, height in the tile's stack with 0 = bottom). Camels that are not
+    on the track use MISSING as their tile. Boards are hashable and copying one is a
+    single allocation, so simulators and caches can use them as keys directly.
+
+    Spectator tiles are passed to `move` as a per-tile effect lookup (see
+    `spectator_effects`): +1, -1 or 0 for each tile.
+
+    Samplers that play many legs from one position can instead step a mutable
+    stack form of a board (`to_stacks`, `move_stacks`, `stack_ranking`). It
+    looks every destination up in a `move_table` precomputed once per
+    position, with wrapping, clipping and spectator bounces already applied,
+    so a roll costs a few list operations.
+    """
+
+    COLORS = ("blue", "green", "yellow", "red", "purple", "black", "white")
+    REGULAR_COLORS = COLORS[:5]
+    COLOR_INDEX: Dict[str, int] = {color: i for i, color in enumerate(COLORS)}
+    N_REGULAR = 5
+    MISSING = 255
+    TRACK_LENGTH = 16
+
+    @staticmethod
+    def from_simulatable(race_track_simulatable_list: List[Tuple]) -> bytes:
+        """
+        Encode the output of RaceTrack.to_simulatable_list().
+
+        Args:
+            race_track_simulatable_list (list[tuple]): (color, tile_index) pairs from
+                bottom to top of each tile. Spectator entries are ignored.
+
+        Returns:
+            bytes: The encoded board.
+        """
+        cells = bytearray([CompactBoard.MISSING, 0] * len(CompactBoard.COLORS))
+        stack_sizes: Dict[int, int] = {}
+        for entry in race_track_simulatable_list:
+            i = CompactBoard.COLOR_INDEX.get(entry[0])
+            if i is None:
+                continue
+            tile_idx = entry[1]
+            cells[2 * i] = tile_idx
+            cells[2 * i + 1] = stack_sizes.get(tile_idx, 0)
+            stack_sizes[tile_idx] = cells[2 * i + 1] + 1
+        return bytes(cells)
+
+    @staticmethod
+    def to_simulatable(board: bytes) -> List[Tuple[str, int]]:
+        """
+        Decode a board into RaceTrack.to_simulatable_list() order.
+
+        Args:
+            board (bytes): Encoded board.
+
+        Returns:
+            list[tuple[str, int]]: (color, tile_index) pairs, by tile and then from
+            bottom to top, suitable for RaceTrack.set_up_camels.
+        """
+        camels = [
+            (board[2 * i], board[2 * i + 1], color)
+            for i, color in enumerate(CompactBoard.COLORS)
+            if board[2 * i] != CompactBoard.MISSING
+        ]
+        camels.sort()
+        return [(color, tile_idx) for tile_idx, _, color in camels]
+
+    @staticmethod
+    def spectator_effects(
+        spectator_tiles: Dict[int, int] | List[Tuple],
+        track_length: int = TRACK_LENGTH,
+    ) -> Tuple[int, ...]:
+        """
+        Build the per-tile effect lookup used by `move`.
+
+        Args:
+            spectator_tiles: Either a dict tile_index -> tile_type (+1 / -1), or a
+                simulatable list whose ("spectator", tile_index, tile_type, owner)
+                entries are used.
+            track_length (int): Number of tiles on the track.
+
+        Returns:
+            tuple[int, ...]: effects[i] is +1, -1 or 0 for tile i.
+        """
+        effects = [0] * track_length
+        if isinstance(spectator_tiles, dict):
+            for tile_idx, tile_type in spectator_tiles.items():
+                effects[int(tile_idx)] = tile_type
+        else:
+            for entry in spectator_tiles:
+                if entry[0] == "spectator":
+                    effects[entry[1]] = entry[2]
+        return tuple(effects)
+
+    @staticmethod
+    def move(
+        board: bytes,
+        color_index: int,
+        amount: int,
+        effects: Optional[Tuple[int, ...]] = None,
+        track_length: int = TRACK_LENGTH,
+    ) -> Tuple[bytes, int, int, bool]:
+        """
+        Move a camel and everything stacked on it, like RaceTrack.location_update.
+
+        Crazy camels (black/white) wrap around the track; regular camels are
+        clipped to it. If the camel lands on a spectator tile the moving stack is
+        bounced one tile: on top of the next tile for +1, under the previous tile's
+        stack for -1.
+
+        Args:
+            board (bytes): Encoded board.
+            color_index (int): Index of the moving camel in COLORS.
+            amount (int): Tiles to move (negative for crazy camels).
+            effects (tuple[int, ...] | None): Per-tile spectator effects.
+            track_length (int): Number of tiles on the track.
+
+        Returns:
+            tuple:
+                - new_board (bytes): Board after the move (the input if the camel
+                  is not on the track).
+                - landed (int): Tile the camel landed on before any spectator
+                  bounce (the triggered tile, if any); -1 if it did not move.
+                - final (int): Tile the camel ended on; -1 if it did not move.
+                - crossed (bool): True if a regular camel crossed the finish line.
+        """
+        start = board[2 * color_index]
+        if start == CompactBoard.MISSING:
+            return board, -1, -1, False
+        start_height = board[2 * color_index + 1]
+
+        new_pos = start + amount
+        crossed = False
+        if color_index >= CompactBoard.N_REGULAR:
+            if new_pos < 0:
+                new_pos = track_length - 1
+            elif new_pos >= track_length:
+                new_pos = 0
+        elif new_pos < 0:
+            new_pos = 0
+        elif new_pos >= track_length:
+            crossed = True
+            new_pos = track_length - 1
+
+        cells = bytearray(board)
+        n_camels = len(CompactBoard.COLORS)
+
+        # The moving stack: this camel and everything above it, with offsets
+        movers: List[Tuple[int, int]] = []
+        for j in range(n_camels):
+            if cells[2 * j] == start and cells[2 * j + 1] >= start_height:
+                movers.append((j, cells[2 * j + 1] - start_height))
+                cells[2 * j] = CompactBoard.MISSING
+
+        dest_size = 0
+        for j in range(n_camels):
+            if cells[2 * j] == new_pos:
+                dest_size += 1
+        for j, offset in movers:
+            cells[2 * j] = new_pos
+            cells[2 * j + 1] = dest_size + offset
+
+        final = new_pos
+        effect = effects[new_pos] if effects is not None else 0
+        if effect:
+            for j, _ in movers:
+                cells[2 * j] = CompactBoard.MISSING
+            if effect > 0:
+                final = min(new_pos + 1, track_length - 1)
+                dest_size = 0
+                for j in range(n_camels):
+                    if cells[2 * j] == final:
+                        dest_size += 1
+                for j, offset in movers:
+                    cells[2 * j] = final
+                    cells[2 * j + 1] = dest_size + offset
+            else:
+                final = max(new_pos - 1, 0)
+                # Slide the moving stack under whatever is already there
+                for j in range(n_camels):
+                    if cells[2 * j] == final:
+                        cells[2 * j + 1] += len(movers)
+                for j, offset in movers:
+                    cells[2 * j] = final
+                    cells[2 * j + 1] = offset
+
+        return bytes(cells), new_pos, final, crossed
+
+    @staticmethod
+    def move_table(
+        effects: Optional[Tuple[int, ...]] = None,
+        track_length: int = TRACK_LENGTH,
+    ) -> List[List[List[Optional[Tuple[int, int, int, bool]]]]]:
+        """
+        Precompute the outcome of every move for `move_stacks`.
+
+        Args:
+            effects (tuple[int, ...] | None): Per-tile spectator effects.
+            track_length (int): Number of tiles on the track.
+
+        Returns:
+            list: table[color_index][tile][amount + 3] is (landed, final, effect,
+            crossed) as in `move`, where effect is the spectator tile on `landed`
+            (0 for none). Crazy camels wrap and regular camels are clipped.
+        """
+        table = []
+        for color_index in range(len(CompactBoard.COLORS)):
+            is_crazy = color_index >= CompactBoard.N_REGULAR
+            rows = []
+            for tile in range(track_length):
+                row: List[Optional[Tuple[int, int, int, bool]]] = [None] * 7
+                for amount in (-3, -2, -1, 1, 2, 3):
+                    landed = tile + amount
+                    crossed = False
+                    if is_crazy:
+                        if landed < 0:
+                            landed = track_length - 1
+                        elif landed >= track_length:
+                            landed = 0
+                    elif landed < 0:
+                        landed = 0
+                    elif landed >= track_length:
+                        crossed = True
+                        landed = track_length - 1
+                    effect = effects[landed] if effects is not None else 0
+                    final = min(max(landed + effect, 0), track_length - 1)
+                    row[amount + 3] = (landed, final, effect, crossed)
+                rows.append(row)
+            table.append(rows)
+        return table
+
+    @staticmethod
+    def to_stacks(board: bytes, track_length: int = TRACK_LENGTH) -> Tuple[List[Tuple[int, ...]], List[int]]:
+        """
+        Convert a board into the mutable stack form used by `move_stacks`.
+
+        Stacks are tuples, so copying the outer list (and `tiles`) is enough to
+        start another leg from the same position.
+
+        Args:
+            board (bytes): Encoded board.
+            track_length (int): Number of tiles on the track.
+
+        Returns:
+            tuple:
+                - stacks (list[tuple[int, ...]]): Camel indices on each tile, from
+                  bottom to top.
+                - tiles (list[int]): Tile of each camel, MISSING if off the track.
+        """
+        stacks: List[Tuple[int, ...]] = [()] * track_length
+        for tile, _, color_index in sorted(
+            (board[2 * i], board[2 * i + 1], i)
+            for i in range(len(CompactBoard.COLORS))
+            if board[2 * i] != CompactBoard.MISSING
+        ):
+            stacks[tile] += (color_index,)
+        return stacks, list(board[0::2])
+
+    @staticmethod
+    def move_stacks(
+        stacks: List[Tuple[int, ...]],
+        tiles: List[int],
+        color_index: int,
+        amount: int,
+        table: List[List[List[Optional[Tuple[int, int, int, bool]]]]],
+    ) -> Tuple[int, int, bool]:
+        """
+        Same move as `move`, applied in place to the stack form of a board.
+
+        Args:
+            stacks, tiles: Output of `to_stacks`, updated in place.
+            color_index (int): Index of the moving camel in COLORS.
+            amount (int): Tiles to move, -3 to 3 (negative for crazy camels).
+            table: `move_table` for the position's spectator tiles.
+
+        Returns:
+            tuple: (landed, final, crossed), as in `move`.
+        """
+        tile = tiles[color_index]
+        if tile == CompactBoard.MISSING:
+            return -1, -1, False
+        stack = stacks[tile]
+        height = stack.index(color_index)
+        movers = stack[height:]
+        stacks[tile] = stack[:height]
+        landed, final, effect, crossed = table[color_index][tile][amount + 3]
+        if effect < 0:
+            # Slide the moving stack under whatever is already there
+            stacks[final] = movers + stacks[final]
+        else:
+            stacks[final] += movers
+        for mover in movers:
+            tiles[mover] = final
+        return landed, final, crossed
+
+    @staticmethod
+    def stack_ranking(stacks: List[Tuple[int, ...]]) -> List[int]:
+        """
+        Same as `ranking`, for the stack form of a board.
+
+        Args:
+            stacks (list[tuple[int, ...]]): Stacks from `to_stacks`.
+
+        Returns:
+            list[int]: Regular camel indices, frontmost first.
+        """
+        n_regular = CompactBoard.N_REGULAR
+        return [
+            color_index
+            for stack in reversed(stacks)
+            for color_index in reversed(stack)
+            if color_index < n_regular
+        ]
+
+    @staticmethod
+    def placements(board: bytes) -> Tuple[str, ...]:
+        """
+        Rank regular camels from first to last, like RaceTrack.get_camel_placements.
+
+        Args:
+            board (bytes): Encoded board.
+
+        Returns:
+            tuple[str, ...]: Regular camel colors on the track, frontmost first.
+        """
+        return tuple(CompactBoard.COLORS[i] for i in CompactBoard.ranking(board))
+
+    @staticmethod
+    def ranking(board: bytes) -> List[int]:
+        """
+        Same as `placements`, but as indices into COLORS.
+
+        Args:
+            board (bytes): Encoded board.
+
+        Returns:
+            list[int]: Regular camel indices, frontmost first.
+        """
+        entries = [
+            (board[2 * i], board[2 * i + 1], i)
+            for i in range(CompactBoard.N_REGULAR)
+            if board[2 * i] != CompactBoard.MISSING
+        ]
+        entries.sort(reverse=True)
+        return [i for _, _, i in entries]
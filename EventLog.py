@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from GameSnapshot import GameSnapshot
+from TheGame import TheGame
+
+
+class EventLog:
+    """
+    Append-only JSON-lines log of every action in a game, with per-leg checkpoints.
+
+    Each line is one self-contained JSON object, flushed as soon as it is written,
+    so a log can be tailed or streamed line by line while the game is running.
+    Every line has a "turn" (the number of turns played before it) and a "type":
+
+        start       seats (names in seating order); written once by begin()
+        checkpoint  snapshot (base64 GameSnapshot of the game before this turn)
+        roll        player (seat index), color, value (die face, 1 to 3)
+        bet         player, color
+        tile        player, tile, tile_type (+1 or -1)
+        leg_end     placements and every seat's money after settlement
+        game_end    final placements and money
+
+    roll, bet and tile are the turns; the others are informational. A
+    checkpoint is written at the start and at the first turn of every leg, so
+    `replay` only has to apply the turns of a single leg on top of one.
+
+    Attributes:
+        turn (int): Turns logged so far.
+    """
+
+    TURN_TYPES = ("roll", "bet", "tile")
+
+    def __init__(self, path: str) -> None:
+        """
+        Args:
+            path (str): Log file for one game; an existing file is replaced.
+        """
+        self.path = path
+        self.turn = 0
+        self._file: Optional[TextIO] = open(path, "w", encoding="utf-8")
+        self._checkpoint_due = True
+
+    def begin(self, game: TheGame) -> None:
+        """
+        Record the seats and the initial checkpoint. Call once the turn order is set.
+
+        Args:
+            game (TheGame): The game being logged.
+
+        Returns:
+            None
+        """
+        self._write({"type": "start", "seats": [player.name for player in game.all_players]})
+        self.turn_started(game)
+
+    def turn_started(self, game: TheGame) -> None:
+        """
+        Checkpoint the game if a new leg has begun since the last checkpoint.
+
+        Must be called between turns, while every player is in game.players.
+
+        Args:
+            game (TheGame): The game being logged.
+
+        Returns:
+            None
+        """
+        if self._checkpoint_due:
+            snapshot = base64.b64encode(GameSnapshot.dumps(game)).decode("ascii")
+            self._write({"type": "checkpoint", "snapshot": snapshot})
+            self._checkpoint_due = False
+
+    def roll(self, game: TheGame, player: Any, color: str, value: int) -> None:
+        """
+        Record a roll.
+
+        Args:
+            game (TheGame): The game being logged.
+            player (CamelPlayer): The roller.
+            color (str): Color of the die.
+            value (int): Face shown, 1 to 3 (also for crazy camels).
+
+        Returns:
+            None
+        """
+        self._turn({"type": "roll", "player": self._seat(game, player), "color": color, "value": value})
+
+    def bet(self, game: TheGame, player: Any, color: str) -> None:
+        """
+        Record a betting ticket taken.
+
+        Returns:
+            None
+        """
+        self._turn({"type": "bet", "player": self._seat(game, player), "color": color})
+
+    def tile(self, game: TheGame, player: Any, tile: int, tile_type: int) -> None:
+        """
+        Record a spectator tile placed.
+
+        Returns:
+            None
+        """
+        self._turn({"type": "tile", "player": self._seat(game, player), "tile": tile, "tile_type": tile_type})
+
+    def leg_end(self, game: TheGame) -> None:
+        """
+        Record a leg settlement; the next turn gets a checkpoint.
+
+        Returns:
+            None
+        """
+        self._write({"type": "leg_end", **self._standings(game)})
+        self._checkpoint_due = True
+
+    def game_end(self, game: TheGame) -> None:
+        """
+        Record the final result.
+
+        Returns:
+            None
+        """
+        self._write({"type": "game_end", **self._standings(game)})
+
+    def close(self) -> None:
+        """
+        Close the log file.
+
+        Returns:
+            None
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def events(path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the events of a log without loading the whole file.
+
+        A trailing line that is still being written is not returned.
+
+        Args:
+            path (str): Log file.
+
+        Returns:
+            Iterator[dict]: Events in the order they happened.
+        """
+        with open(path, "r", encoding="utf-8") as log_file:
+            for line in log_file:
+                if not line.endswith("\n"):
+                    break
+                if line.strip():
+                    yield json.loads(line)
+
+    @staticmethod
+    def replay(path: str, turn: Optional[int] = None, game: Optional[TheGame] = None) -> TheGame:
+        """
+        Rebuild the game as it was before a given turn.
+
+        Loads the last checkpoint at or before `turn` and applies only the turns
+        logged after it.
+
+        Args:
+            path (str): Log file.
+            turn (int | None): Number of turns to have been played; defaults to
+                the whole log.
+            game (TheGame | None): Game to restore into; see GameSnapshot.loads.
+
+        Raises:
+            ValueError: If the log has no checkpoint, does not reach `turn`, or
+                its turns do not apply to the checkpointed game.
+
+        Returns:
+            TheGame: The game before turn `turn`.
+        """
+        snapshot: Optional[str] = None
+        pending: List[Dict[str, Any]] = []
+        played = 0
+        for event in EventLog.events(path):
+            if event["type"] == "checkpoint":
+                if turn is not None and event["turn"] > turn:
+                    break
+                snapshot, pending = event["snapshot"], []
+            elif event["type"] in EventLog.TURN_TYPES:
+                if turn is not None and event["turn"] >= turn:
+                    break
+                pending.append(event)
+                played = event["turn"] + 1
+        if snapshot is None:
+            raise ValueError(f"{path} has no checkpoint")
+        if turn is not None and played < turn:
+            raise ValueError(f"{path} ends after {played} turns, before turn {turn}")
+
+        game = GameSnapshot.loads(base64.b64decode(snapshot), game)
+        for event in pending:
+            EventLog.apply(game, event)
+        return game
+
+    @staticmethod
+    def apply(game: TheGame, event: Dict[str, Any]) -> None:
+        """
+        Play a logged turn on a game, without any randomness.
+
+        Args:
+            game (TheGame): Game positioned just before the turn.
+            event (dict): A roll, bet or tile event.
+
+        Raises:
+            ValueError: If it is not that player's turn or the action is not possible.
+
+        Returns:
+            None
+        """
+        player = game.all_players[event["player"]]
+        if not game.players or game.players[0] is not player:
+            raise ValueError(f"turn {event['turn']}: it is not {player.name}'s turn")
+        if event["type"] == "roll":
+            game.take_roll_turn(player, (event["color"], event["value"]))
+        elif event["type"] == "bet":
+            if not game.take_bet(player, event["color"]):
+                raise ValueError(f"turn {event['turn']}: no bets left on {event['color']}")
+        elif event["type"] == "tile":
+            game.set_spectator_tile(player, event["tile"], event["tile_type"])
+        else:
+            raise ValueError(f"turn {event['turn']}: {event['type']} is not a turn")
+        game.players.append(game.players.pop(0))
+
+    def _turn(self, event: Dict[str, Any]) -> None:
+        """
+        Write a turn event and advance the turn counter.
+        """
+        self._write(event)
+        self.turn += 1
+
+    def _write(self, event: Dict[str, Any]) -> None:
+        """
+        Append one event line and flush it.
+        """
+        self._file.write(json.dumps({"turn": self.turn, **event}, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    @staticmethod
+    def _seat(game: TheGame, player: Any) -> int:
+        """
+        Seat index of a player (names need not be unique).
+        """
+        return next(idx for idx, seat in enumerate(game.all_players) if seat is player)
+
+    @staticmethod
+    def _standings(game: TheGame) -> Dict[str, Any]:
+        """
+        Camel placements and every seat's money.
+        """
+        return {
+            "placements": list(game.race_track.get_camel_placements()),
+            "money": [player.amount_of_money for player in game.all_players],
+        }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a Camel Up event log.")
+    parser.add_argument("log", help="event log written by TheGame.py --log")
+    parser.add_argument("--turn", type=int, default=None, help="show the game before this turn (default: the end)")
+    args = parser.parse_args()
+
+    replayed = EventLog.replay(args.log, args.turn)
+    print(replayed.get_game_state_str())
+    print("Turn order: " + ", ".join(player.name for player in replayed.players))
@@ -0,0 +1,512 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from AIPlayer import AIPlayer
+from CamelPlayer import CamelPlayer
+from CompactBoard import CompactBoard
+from Instrumentation import Instrumentation
+from RandomSource import RandomSource
+
+if TYPE_CHECKING:
+    from TheGame import TheGame
+
+
+class _BudgetExceeded(Exception):
+    """
+    Raised inside a search iteration once the node budget is spent.
+    """
+
+
+class ExpectimaxPlayer:
+    """
+    Depth-limited expectimax search over the real action set of a turn.
+
+    Where AIPlayer scores each action on its own, this searches sequences of
+    turns: the AI's own (max) nodes, the other seats' turns and, whenever
+    somebody rolls, a chance node over every (die, face) the Pyramid can
+    produce. Each turn offers rolling, a bet on every color with tickets left,
+    and both signs of a spectator tile on every legal tile.
+
+    The value of a node is the AI's expected coin margin: its own coins minus
+    the average of the other seats' coins. Other seats are assumed to play
+    against the AI and minimise it. Coins are counted when they are earned:
+    1 for rolling a regular die, 1 to a tile's owner when a camel lands on it,
+    and the exact ticket payouts when the leg ends (after the last regular die,
+    or when a camel crosses the finish line), which is a terminal leaf. At the
+    depth limit, open tickets and spectator tiles are scored by their expected
+    value over the rest of the leg: computed exactly by enumeration when at
+    most `exact_dice` dice remain, and otherwise over `leaf_sims` legs drawn
+    once per decision and shared by every leaf (common random numbers).
+
+    Search state (all hashable, so nodes are memoised in a transposition
+    table keyed on the whole state and the depth left):
+        board: CompactBoard encoding of the camels
+        dice: bitmask over CompactBoard.COLORS of the dice still in the pyramid
+        tiles: sorted (tile, +1/-1, owner seat) spectator tiles
+        tickets: per regular color (CompactBoard order), the payouts of the
+                 tickets left, top of the stack last
+        bets: per seat, sorted (color index, payouts) tickets held
+        seat: seat to move; seat 0 is the AI, the others follow in turn order
+
+    Dominated actions are pruned when the leaf statistics of the position are
+    exact (at most `exact_dice` dice left). Spectator tiles that no camel can
+    land on this leg change nothing, so only one of them is searched. A ticket
+    on a camel that cannot finish 1st or 2nd loses a coin for certain, and is
+    dropped whenever such a do-nothing tile is available instead. Sampled
+    statistics cannot show that something never happens, so with more dice
+    left every action is searched.
+
+    Search deepens iteratively, one turn at a time, up to `depth` turns, and
+    stops early once `node_budget` nodes have been expanded; the values of the
+    deepest completed iteration are returned. The first iteration always
+    completes.
+    """
+
+    REGULAR_MASK = (1 << CompactBoard.N_REGULAR) - 1
+    # Leaf statistics kept between decisions before the memo is cleared
+    LEAF_MEMO_SIZE = 200000
+
+    def __init__(
+        self,
+        depth: int = 2,
+        node_budget: Optional[int] = 2500,
+        exact_dice: int = 3,
+        leaf_sims: int = 100,
+        rng: Any = None,
+        instrumentation: Optional[Instrumentation] = None,
+        track_length: int = 16,
+    ) -> None:
+        """
+        Args:
+            depth (int): Maximum number of turns to look ahead (1 = only the
+                AI's own turn, scored at the leaves).
+            node_budget (int | None): Nodes (decisions, rolls and scored
+                leaves) to expand per decision before search stops deepening;
+                None for no limit.
+            exact_dice (int): Enumerate leaf positions exactly when at most
+                this many dice remain.
+            leaf_sims (int): Legs drawn per decision to score the other leaves.
+            rng: Source of those legs; anything RandomSource accepts.
+            instrumentation (Instrumentation | None): Records the
+                "ai.expectimax" phase and node counts when enabled.
+            track_length (int): Number of tiles on the track.
+
+        Raises:
+            ValueError: For a depth, budget or leaf_sims below 1, or a negative
+                exact_dice.
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+        if node_budget is not None and node_budget < 1:
+            raise ValueError("node_budget must be at least 1")
+        if leaf_sims < 1:
+            raise ValueError("leaf_sims must be at least 1")
+        if exact_dice < 0:
+            raise ValueError("exact_dice must not be negative")
+        self.depth = depth
+        self.node_budget = node_budget
+        self.exact_dice = exact_dice
+        self.leaf_sims = leaf_sims
+        self.rng = RandomSource.coerce(rng)
+        self.instrumentation = instrumentation or Instrumentation()
+        self.track_length = track_length
+        # Search depth reached, nodes expanded and leaves scored by the last decision
+        self.last_report: Dict[str, int] = {}
+
+        self._table: Dict[Tuple, float] = {}
+        self._leaf_memo: Dict[Tuple, Tuple[List[List[float]], List[float]]] = {}
+        self._move_tables: Dict[Tuple[int, ...], List] = {}
+        self._legs: List[List[Tuple[int, int]]] = []
+        self._weights: Tuple[float, ...] = (1.0,)
+        self._n_seats = 1
+        self._nodes = 0
+        self._leaves = 0
+        self._abortable = False
+
+    def action_values(self, game: "TheGame", player: CamelPlayer) -> Dict[str, float]:
+        """
+        Search the game's position for `player`, who is about to move.
+
+        Args:
+            game (TheGame): The game; the other players move in the order of
+                game.players.
+            player (CamelPlayer): The player to move.
+
+        Returns:
+            dict[str, float]: Expected coin margin of each searched action, with
+            AIPlayer's labels ("roll", a color, "spt_<i>+" / "spt_<i>-"), so it
+            can be passed to TheGame.choose_ai_action.
+        """
+        state, n_seats = self.state_from_game(game, player)
+        return self.search(state, n_seats)
+
+    @staticmethod
+    def state_from_game(game: "TheGame", player: CamelPlayer) -> Tuple[Tuple, int]:
+        """
+        Build the search state of a game, with `player` in seat 0.
+
+        Args:
+            game (TheGame): The game.
+            player (CamelPlayer): The player to move.
+
+        Returns:
+            tuple: (state, number of seats); see the class docstring for the state.
+        """
+        seats = [player] + [other for other in game.players if other is not player]
+        seat_of = {id(seat): idx for idx, seat in enumerate(seats)}
+        race_track = game.race_track
+        color_index = CompactBoard.COLOR_INDEX
+
+        dice = 0
+        for color in game.pyramid.unrolled_dice:
+            dice |= 1 << color_index[color]
+        # Tiles of players who are not seated pay nobody (seat len(seats))
+        tiles = tuple(sorted(
+            (tile, tile_type, seat_of.get(id(owner), len(seats)))
+            for tile, (tile_type, owner) in race_track.spectator_tiles.items()
+        ))
+        tickets = tuple(
+            tuple(tuple(ticket.money_for_placements) for ticket in game.betting_tents.ticket_amounts.get(color, []))
+            for color in CompactBoard.REGULAR_COLORS
+        )
+        bets = tuple(
+            tuple(sorted((color_index[bet.color], tuple(bet.money_for_placements)) for bet in seat.bets))
+            for seat in seats
+        )
+        board = CompactBoard.from_simulatable(race_track.to_simulatable_list())
+        return (board, dice, tiles, tickets, bets, 0), len(seats)
+
+    def search(self, state: Tuple, n_seats: int) -> Dict[str, float]:
+        """
+        Value every root action of a search state.
+
+        Args:
+            state (tuple): Search state with the AI to move (seat 0).
+            n_seats (int): Number of seats in the game.
+
+        Returns:
+            dict[str, float]: Expected coin margin per action label.
+        """
+        with self.instrumentation.phase("ai.expectimax"):
+            if n_seats > 1:
+                self._weights = (1.0,) + (-1.0 / (n_seats - 1),) * (n_seats - 1) + (0.0,)
+            else:
+                self._weights = (1.0, 0.0)
+            self._n_seats = n_seats
+            self._nodes = self._leaves = 0
+            self._legs = [
+                [(CompactBoard.COLOR_INDEX[color], face) for color, face in leg]
+                for leg in self.rng.legs(CompactBoard.COLORS, self.leaf_sims)
+            ]
+            if len(self._leaf_memo) > self.LEAF_MEMO_SIZE:
+                self._leaf_memo = {}
+
+            values: Dict[str, float] = {}
+            completed = 0
+            for depth in range(1, self.depth + 1):
+                self._table = {}
+                self._abortable = depth > 1
+                try:
+                    iteration = {
+                        self.action_label(action): self._action_value(state, action, depth)
+                        for action in self._actions(state)
+                    }
+                except _BudgetExceeded:
+                    break
+                values, completed = iteration, depth
+                if self.node_budget is not None and self._nodes >= self.node_budget:
+                    break
+            self._table = {}
+
+        self.last_report = {"depth": completed, "nodes": self._nodes, "leaves": self._leaves}
+        self.instrumentation.count("ai.expectimax_nodes", self._nodes)
+        return values
+
+    @staticmethod
+    def action_label(action: Tuple) -> str:
+        """
+        AIPlayer-style EV label of a search action.
+
+        Args:
+            action (tuple): ("roll",), ("bet", color index) or ("tile", tile, sign).
+
+        Returns:
+            str: "roll", the color, or AIPlayer.spectator_label(tile, sign).
+        """
+        if action[0] == "roll":
+            return "roll"
+        if action[0] == "bet":
+            return CompactBoard.COLORS[action[1]]
+        return AIPlayer.spectator_label(action[1], action[2])
+
+    def _expand(self) -> None:
+        """
+        Count a node, and abort the iteration once the budget is spent.
+        """
+        self._nodes += 1
+        if self._abortable and self.node_budget is not None and self._nodes > self.node_budget:
+            raise _BudgetExceeded()
+
+    def _value(self, state: Tuple, depth: int) -> float:
+        """
+        Value of a decision node with `depth` turns left to search.
+        """
+        if depth == 0:
+            return self._leaf(state)
+        key = (state, depth)
+        cached = self._table.get(key)
+        if cached is not None:
+            return cached
+        self._expand()
+        values = [self._action_value(state, action, depth) for action in self._actions(state)]
+        value = max(values) if state[5] == 0 else min(values)
+        self._table[key] = value
+        return value
+
+    def _action_value(self, state: Tuple, action: Tuple, depth: int) -> float:
+        """
+        Value of taking `action` in `state`, the mover's turn included.
+        """
+        if action[0] == "roll":
+            return self._chance(state, depth)
+        board, dice, tiles, tickets, bets, seat = state
+        if action[0] == "bet":
+            color = action[1]
+            stack = tickets[color]
+            tickets = tickets[:color] + (stack[:-1],) + tickets[color + 1:]
+            seat_bets = tuple(sorted(bets[seat] + ((color, stack[-1]),)))
+            bets = bets[:seat] + (seat_bets,) + bets[seat + 1:]
+        else:
+            tiles = tuple(sorted(tiles + ((action[1], action[2], seat),)))
+        return self._value((board, dice, tiles, tickets, bets, (seat + 1) % self._n_seats), depth - 1)
+
+    def _chance(self, state: Tuple, depth: int) -> float:
+        """
+        Expected value of rolling: every remaining die and face is equally likely.
+        """
+        key = ("roll", state, depth)
+        cached = self._table.get(key)
+        if cached is not None:
+            return cached
+        self._expand()
+        board, dice, tiles, tickets, bets, seat = state
+        effects = self._effects(tiles)
+        owners = {tile: owner for tile, _, owner in tiles}
+        weights = self._weights
+        n_regular = CompactBoard.N_REGULAR
+        next_seat = (seat + 1) % self._n_seats
+
+        total = 0.0
+        outcomes = 0
+        for color_index in range(len(CompactBoard.COLORS)):
+            if not dice >> color_index & 1:
+                continue
+            is_crazy = color_index >= n_regular
+            # Rolling one crazy die takes the other one out of the pyramid
+            next_dice = dice & self.REGULAR_MASK if is_crazy else dice & ~(1 << color_index)
+            for face in (1, 2, 3):
+                outcomes += 1
+                next_board, landed, _, crossed = CompactBoard.move(
+                    board, color_index, -face if is_crazy else face, effects, self.track_length
+                )
+                reward = 0.0 if is_crazy else weights[seat]
+                if landed >= 0 and effects[landed]:
+                    reward += weights[owners[landed]]
+                if crossed or not next_dice & self.REGULAR_MASK:
+                    # The leg is over: settle every ticket
+                    reward += self._settle(next_board, bets)
+                else:
+                    reward += self._value((next_board, next_dice, tiles, tickets, bets, next_seat), depth - 1)
+                total += reward
+
+        value = total / outcomes if outcomes else 0.0
+        self._table[key] = value
+        return value
+
+    def _actions(self, state: Tuple) -> List[Tuple]:
+        """
+        Legal actions of the seat to move, without dominated ones.
+        """
+        board, dice, tiles, tickets, _, _ = state
+        # Only exact statistics prove that a tile or a placing is impossible
+        exact = bin(dice).count("1") <= self.exact_dice
+        if exact:
+            rank_probs, landings = self._leaf_stats(board, dice, self._effects(tiles))
+        actions: List[Tuple] = [("roll",)]
+
+        # Tiles with no camel, and no spectator tile on or next to them (RaceTrack.empty_spaces)
+        blocked = set()
+        for tile, _, _ in tiles:
+            blocked.update((tile - 1, tile, tile + 1))
+        for i in range(len(CompactBoard.COLORS)):
+            blocked.add(board[2 * i])
+        null_tile = None
+        for tile in range(self.track_length):
+            if tile in blocked:
+                continue
+            if not exact or landings[tile] > 0:
+                actions.append(("tile", tile, 1))
+                actions.append(("tile", tile, -1))
+            elif null_tile is None:
+                # No camel lands here this leg: every such tile is the same do-nothing move
+                null_tile = ("tile", tile, 1)
+        if null_tile is not None:
+            actions.append(null_tile)
+
+        for color, stack in enumerate(tickets):
+            if not stack:
+                continue
+            if exact and null_tile is not None and rank_probs[color][0] + rank_probs[color][1] <= 0:
+                # A certain loss of a coin; doing nothing is better
+                continue
+            actions.append(("bet", color))
+        return actions
+
+    def _leaf(self, state: Tuple) -> float:
+        """
+        Expected margin of the open tickets and spectator tiles over the rest of the leg.
+        """
+        self._leaves += 1
+        self._expand()
+        board, dice, tiles, _, bets, _ = state
+        rank_probs, landings = self._leaf_stats(board, dice, self._effects(tiles))
+        weights = self._weights
+        value = 0.0
+        for seat, seat_bets in enumerate(bets):
+            for color, payouts in seat_bets:
+                value += weights[seat] * sum(p * payout for p, payout in zip(rank_probs[color], payouts))
+        for tile, _, owner in tiles:
+            value += weights[owner] * landings[tile]
+        return value
+
+    def _settle(self, board: bytes, bets: Tuple) -> float:
+        """
+        Margin paid out by every ticket on the final board of a leg.
+        """
+        rank = {color: place for place, color in enumerate(CompactBoard.ranking(board))}
+        weights = self._weights
+        value = 0.0
+        for seat, seat_bets in enumerate(bets):
+            for color, payouts in seat_bets:
+                value += weights[seat] * payouts[rank.get(color, len(payouts) - 1)]
+        return value
+
+    def _effects(self, tiles: Tuple) -> Tuple[int, ...]:
+        """
+        Per-tile spectator effects of the search state's tiles.
+        """
+        effects = [0] * self.track_length
+        for tile, tile_type, _ in tiles:
+            effects[tile] = tile_type
+        return tuple(effects)
+
+    def _leaf_stats(
+        self,
+        board: bytes,
+        dice: int,
+        effects: Tuple[int, ...],
+    ) -> Tuple[List[List[float]], List[float]]:
+        """
+        Distribution of the rest of the leg with nobody acting but the dice.
+
+        Returns:
+            tuple:
+                - rank_probs[color][place]: probability that the regular camel
+                  finishes the leg in that place (0 = 1st)
+                - landings[tile]: expected number of rolls landing on the tile,
+                  before any spectator bounce (so, for a spectator tile, the
+                  coins it pays)
+        """
+        key = (board, dice, effects)
+        stats = self._leaf_memo.get(key)
+        if stats is None:
+            if bin(dice).count("1") <= self.exact_dice:
+                vector = self._exact(board, dice, effects)
+            else:
+                vector = self._sampled(board, dice, effects)
+            n_regular = CompactBoard.N_REGULAR
+            rank_probs = [vector[color * n_regular:(color + 1) * n_regular] for color in range(n_regular)]
+            stats = self._leaf_memo[key] = (rank_probs, vector[n_regular * n_regular:])
+        return stats
+
+    def _exact(self, board: bytes, dice: int, effects: Tuple[int, ...]) -> List[float]:
+        """
+        Flat leaf statistics by enumerating every remaining roll, like LegEnumerator.
+        """
+        n_regular = CompactBoard.N_REGULAR
+        key = ("exact", board, dice, effects)
+        cached = self._leaf_memo.get(key)
+        if cached is not None:
+            return cached
+
+        result = [0.0] * (n_regular * n_regular + self.track_length)
+        if not dice & self.REGULAR_MASK:
+            for place, color in enumerate(CompactBoard.ranking(board)):
+                result[color * n_regular + place] = 1.0
+            self._leaf_memo[key] = result
+            return result
+
+        branches = 0
+        for color_index in range(len(CompactBoard.COLORS)):
+            if not dice >> color_index & 1:
+                continue
+            is_crazy = color_index >= n_regular
+            next_dice = dice & self.REGULAR_MASK if is_crazy else dice & ~(1 << color_index)
+            for face in (1, 2, 3):
+                branches += 1
+                next_board, landed, _, crossed = CompactBoard.move(
+                    board, color_index, -face if is_crazy else face, effects, self.track_length
+                )
+                sub = self._exact(next_board, 0 if crossed else next_dice, effects)
+                for i, value in enumerate(sub):
+                    result[i] += value
+                if landed >= 0:
+                    result[n_regular * n_regular + landed] += 1.0
+
+        result = [value / branches for value in result]
+        self._leaf_memo[key] = result
+        return result
+
+    def _sampled(self, board: bytes, dice: int, effects: Tuple[int, ...]) -> List[float]:
+        """
+        Flat leaf statistics averaged over the decision's shared legs.
+        """
+        n_regular = CompactBoard.N_REGULAR
+        table = self._move_tables.get(effects)
+        if table is None:
+            table = self._move_tables[effects] = CompactBoard.move_table(effects, self.track_length)
+        start_stacks, start_tiles = CompactBoard.to_stacks(board, self.track_length)
+        regular_dice = bin(dice & self.REGULAR_MASK).count("1")
+        move = CompactBoard.move_stacks
+        offset = n_regular * n_regular
+
+        result = [0.0] * (offset + self.track_length)
+        for leg in self._legs:
+            stacks = start_stacks.copy()
+            tiles = start_tiles.copy()
+            regular_left = regular_dice
+            crazy_rolled = False
+            # Same rules as Pyramid.leg_moves, on this leg's subset of the dice
+            for color_index, face in leg:
+                if not regular_left:
+                    break
+                if not dice >> color_index & 1:
+                    continue
+                if color_index >= n_regular:
+                    if crazy_rolled:
+                        continue
+                    crazy_rolled = True
+                    face = -face
+                else:
+                    regular_left -= 1
+                landed, _, crossed = move(stacks, tiles, color_index, face, table)
+                if landed >= 0:
+                    result[offset + landed] += 1.0
+                if crossed:
+                    break
+            for place, color in enumerate(CompactBoard.stack_ranking(stacks)):
+                result[color * n_regular + place] += 1.0
+
+        n_legs = float(len(self._legs))
+        return [value / n_legs for value in result]
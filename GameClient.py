@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
+
+
+class GameClient:
+    """
+    Small asyncio client for GameServer's line protocol.
+
+    `request` sends one command and returns the decoded "OK" payload, raising
+    ValueError with the server's message on "ERR". "EVENT" lines pushed by the
+    server (other players' moves) are collected in `events` as they arrive.
+
+    Example:
+        client = await GameClient.connect("127.0.0.1", 8765)
+        table = await client.request("CREATE alice AI")
+        await client.request(f"JOIN {table['session']} alice")
+        await client.request("ROLL")
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.events: List[Dict[str, Any]] = []
+
+    @classmethod
+    async def connect(cls, host: str = "127.0.0.1", port: int = 8765) -> "GameClient":
+        """
+        Open a connection to a GameServer.
+
+        Args:
+            host (str): Server host.
+            port (int): Server port.
+
+        Returns:
+            GameClient: A connected client.
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, command: str) -> Dict[str, Any]:
+        """
+        Send a command and wait for its reply.
+
+        Args:
+            command (str): One protocol command, e.g. "BET blue".
+
+        Raises:
+            ValueError: If the server rejects the command.
+            ConnectionError: If the server closes the connection.
+
+        Returns:
+            dict: The reply payload.
+        """
+        self.writer.write(command.strip().encode() + b"\n")
+        await self.writer.drain()
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                raise ConnectionError("server closed the connection")
+            kind, _, body = line.decode().rstrip("\n").partition(" ")
+            if kind == "EVENT":
+                self.events.append(json.loads(body))
+            elif kind == "OK":
+                return json.loads(body)
+            elif kind == "ERR":
+                raise ValueError(body)
+
+    async def poll_events(self, timeout: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Collect events that arrive within `timeout` seconds, without sending anything.
+
+        Args:
+            timeout (float): How long to wait for the first event.
+
+        Returns:
+            list[dict]: Every event received so far; `events` is emptied.
+        """
+        try:
+            while True:
+                line = await asyncio.wait_for(self.reader.readline(), timeout)
+                if not line:
+                    break
+                kind, _, body = line.decode().rstrip("\n").partition(" ")
+                if kind == "EVENT":
+                    self.events.append(json.loads(body))
+                timeout = 0.01
+        except asyncio.TimeoutError:
+            pass
+        events, self.events = self.events, []
+        return events
+
+    async def close(self) -> None:
+        """
+        Close the connection.
+
+        Returns:
+            None
+        """
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def _interactive(host: str, port: int) -> None:
+    """
+    Read commands from the terminal and print the replies.
+    """
+    client = await GameClient.connect(host, port)
+    loop = asyncio.get_running_loop()
+    print(f"Connected to {host}:{port}. Type HELP for commands, QUIT to leave.")
+    try:
+        while True:
+            command: Optional[str] = await loop.run_in_executor(None, input, "> ")
+            if not command or not command.strip():
+                continue
+            if command.strip().upper() == "HELP":
+                print("CREATE <seat>..., JOIN <table> <seat>, STATE, ROLL, BET <color>, TILE <pos> <+|->, HINT, LIST, QUIT")
+                continue
+            try:
+                reply = await client.request(command)
+            except ValueError as error:
+                print(f"Error: {error}")
+                continue
+            for event in await client.poll_events():
+                for message in event.get("messages", []):
+                    print(f"* {message}")
+            for message in reply.get("messages", []):
+                print(message)
+            print(json.dumps({k: v for k, v in reply.items() if k != "messages"}, indent=2))
+            if command.strip().upper() == "QUIT":
+                break
+    except (EOFError, ConnectionError):
+        pass
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play Camel Up on a GameServer.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(_interactive(args.host, args.port))
@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from AIPlayer import AIPlayer
+from GameSession import GameSession
+
+logger = logging.getLogger(__name__)
+
+
+class GameServer:
+    """
+    asyncio TCP server hosting many independent Camel Up tables in one process.
+
+    The protocol is line oriented UTF-8. A client sends one command per line and
+    gets exactly one reply line, "OK <json>" or "ERR <message>" (for an
+    unexpected failure, e.g. a crashed hint worker, the error is logged and the
+    reply is "ERR internal error"; the connection stays open). Other clients
+    at the same table receive "EVENT <json>" lines (messages and new state) after
+    every action.
+
+    Commands:
+        CREATE <seat> [<seat> ...]   new table; seats named AI are played by the server
+        JOIN <table> <seat>          play the named human seat at a table
+        STATE                        state of the joined table
+        ROLL                         roll a die
+        BET <color>                  take the top ticket for a camel
+        TILE <position> <+|->        place a spectator tile
+        HINT                         AI suggestions (EV per action) for the position
+        LIST                         open tables
+        QUIT                         close the connection
+
+    Table logic runs on the event loop and is cheap. AI hints (for HINT and AI
+    seats) run in an executor, a process pool by default, so one slow simulation
+    never stalls the other tables. Actions on one table are serialised by a
+    per-table lock, which is held while that table's AI seats move.
+
+    With a snapshot directory, every table is checkpointed as a GameSnapshot
+    (`<table>.snap`) after each action and reloaded when the server starts.
+    """
+
+    COMMANDS = ("CREATE", "JOIN", "STATE", "ROLL", "BET", "TILE", "HINT", "LIST", "QUIT")
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        amount_of_sims: int = 1000,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        snapshot_dir: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port; 0 picks a free one (see `port` after start()).
+            amount_of_sims (int): Simulations per AI hint.
+            workers (int | None): Hint worker processes; defaults to the CPU count.
+            executor (Executor | None): Run hints here instead of a new process pool.
+            snapshot_dir (str | None): Checkpoint tables here and resume them at start().
+        """
+        self.host = host
+        self.port = port
+        self.amount_of_sims = amount_of_sims
+        self.sessions: Dict[str, GameSession] = {}
+        self._owns_executor = executor is None
+        self._executor = executor or ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._subscribers: Dict[str, Set[asyncio.StreamWriter]] = {}
+        self._handlers: Set[asyncio.Task] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._next_id = 1
+        self.snapshot_dir = snapshot_dir
+
+    async def start(self) -> None:
+        """
+        Resume checkpointed tables and start listening. Sets `port` to the bound port.
+
+        Returns:
+            None
+        """
+        if self.snapshot_dir is not None:
+            self._load_snapshots()
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """
+        Start (if needed) and serve until cancelled.
+
+        Returns:
+            None
+        """
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Stop listening, disconnect every client and shut down the executor.
+
+        Returns:
+            None
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for handler in list(self._handlers):
+            handler.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one connection until it sends QUIT or disconnects.
+        """
+        handler = asyncio.current_task()
+        self._handlers.add(handler)
+        # Table and seat this connection has joined
+        seat: Dict[str, Optional[str]] = {"session": None, "name": None}
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode("utf-8", errors="replace").strip()
+                if not command:
+                    continue
+                try:
+                    reply = await self._dispatch(seat, command, writer)
+                except ValueError as error:
+                    writer.write(f"ERR {error}\n".encode())
+                except Exception:
+                    logger.exception("command %r failed", command)
+                    writer.write(b"ERR internal error\n")
+                else:
+                    writer.write(f"OK {json.dumps(reply)}\n".encode())
+                await writer.drain()
+                if command.split()[0].upper() == "QUIT":
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(handler)
+            if seat["session"] is not None:
+                self._subscribers[seat["session"]].discard(writer)
+            writer.close()
+
+    async def _dispatch(
+        self,
+        seat: Dict[str, Optional[str]],
+        command: str,
+        writer: asyncio.StreamWriter,
+    ) -> Dict[str, Any]:
+        """
+        Run one command and return its reply payload.
+
+        Raises:
+            ValueError: For unknown or disallowed commands.
+        """
+        verb, *args = command.split()
+        verb = verb.upper()
+        if verb not in self.COMMANDS:
+            raise ValueError(f"unknown command {verb}")
+
+        if verb == "QUIT":
+            return {"bye": True}
+        if verb == "LIST":
+            return {
+                "tables": [
+                    {"session": sid, "seats": [p.name for p in s.seats], "finished": s.finished}
+                    for sid, s in self.sessions.items()
+                ]
+            }
+        if verb == "CREATE":
+            return await self._create(args)
+        if verb == "JOIN":
+            if len(args) != 2:
+                raise ValueError("usage: JOIN <table> <seat>")
+            session = self._session(args[0])
+            session.human_seat(args[1])
+            if seat["session"] is not None:
+                self._subscribers[seat["session"]].discard(writer)
+            seat["session"], seat["name"] = args[0], args[1]
+            self._subscribers[args[0]].add(writer)
+            return {"state": session.state()}
+
+        if seat["session"] is None:
+            raise ValueError("join a table first")
+        session = self.sessions[seat["session"]]
+        name = seat["name"]
+
+        if verb == "STATE":
+            return {"state": session.state()}
+        if verb == "HINT":
+            return {"hint": await self._hint(session, name)}
+        if verb == "ROLL":
+            return await self._act(session, writer, lambda: session.roll(name))
+        if verb == "BET":
+            if len(args) != 1:
+                raise ValueError("usage: BET <color>")
+            return await self._act(session, writer, lambda: session.bet(name, args[0].lower()))
+        if verb == "TILE":
+            if len(args) != 2 or not args[0].isdigit():
+                raise ValueError("usage: TILE <position> <+|->")
+            return await self._act(session, writer, lambda: session.place_tile(name, int(args[0]), args[1].lower()))
+        raise ValueError(f"unknown command {verb}")
+
+    async def _create(self, seat_names: List[str]) -> Dict[str, Any]:
+        """
+        Open a table and play its AI seats until a human is up.
+        """
+        session_id = str(self._next_id)
+        session = GameSession(session_id, seat_names)
+        self._next_id += 1
+        self._add_session(session)
+        async with self._locks[session_id]:
+            messages = await self._play_ai_seats(session)
+            self._checkpoint(session)
+        return {"session": session_id, "messages": messages, "state": session.state()}
+
+    def _add_session(self, session: GameSession) -> None:
+        """
+        Register a table.
+        """
+        self.sessions[session.session_id] = session
+        self._locks[session.session_id] = asyncio.Lock()
+        self._subscribers[session.session_id] = set()
+
+    def _load_snapshots(self) -> None:
+        """
+        Resume every table checkpointed in snapshot_dir.
+        """
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        for file_name in sorted(os.listdir(self.snapshot_dir)):
+            session_id, extension = os.path.splitext(file_name)
+            if extension != ".snap" or session_id in self.sessions:
+                continue
+            with open(os.path.join(self.snapshot_dir, file_name), "rb") as snapshot_file:
+                self._add_session(GameSession(session_id, [], snapshot_file.read()))
+            if session_id.isdigit():
+                self._next_id = max(self._next_id, int(session_id) + 1)
+
+    def _checkpoint(self, session: GameSession) -> None:
+        """
+        Atomically write a table's snapshot, if a snapshot directory is set.
+        """
+        if self.snapshot_dir is None:
+            return
+        path = os.path.join(self.snapshot_dir, f"{session.session_id}.snap")
+        with open(path + ".tmp", "wb") as snapshot_file:
+            snapshot_file.write(session.snapshot())
+        os.replace(path + ".tmp", path)
+
+    def _session(self, session_id: str) -> GameSession:
+        """
+        Look up a table by id.
+
+        Raises:
+            ValueError: If there is no such table.
+        """
+        session = self.sessions.get(session_id)
+        if session is None:
+            raise ValueError(f"no table {session_id!r}")
+        return session
+
+    async def _act(self, session: GameSession, writer: asyncio.StreamWriter, action) -> Dict[str, Any]:
+        """
+        Apply a human action, let the AI seats respond and notify the table.
+        """
+        async with self._locks[session.session_id]:
+            messages = [action()]
+            messages += await self._play_ai_seats(session)
+            self._checkpoint(session)
+            state = session.state()
+        payload = {"messages": messages, "state": state}
+        event = f"EVENT {json.dumps(payload)}\n".encode()
+        for subscriber in self._subscribers[session.session_id]:
+            if subscriber is not writer:
+                subscriber.write(event)
+        return payload
+
+    async def _play_ai_seats(self, session: GameSession) -> List[str]:
+        """
+        Play AI seats until a human is up or the race is over.
+        """
+        messages = []
+        while session.ai_to_move():
+            messages.append(session.play_ai(await self._hint(session)))
+        return messages
+
+    async def _hint(self, session: GameSession, name: Optional[str] = None) -> Dict[str, float]:
+        """
+        Compute the EVs for a table's position in the executor, for the human
+        seat `name`, or for the current player (an AI seat) by default.
+        """
+        loop = asyncio.get_running_loop()
+        request = session.hint_request(name)
+        return await loop.run_in_executor(self._executor, _hint_job, self.amount_of_sims, *request)
+
+
+# One AIPlayer per worker (process or thread) and simulation count, so its cache
+# serves every table without being shared between threads
+_WORKER_AI = threading.local()
+
+
+def _hint_job(
+    amount_of_sims: int,
+    race_track_simulatable_list: List[Tuple],
+    remaining_die: List[str],
+    available_bets: Dict[str, int],
+    empty_spaces: set,
+    unrolled_dice: List[str],
+    open_bets: List[Tuple],
+) -> Dict[str, float]:
+    """
+    Executor entry point: simulate a position and score every action, including
+    every spectator tile option for the player to move.
+    """
+    players: Dict[int, AIPlayer] = _WORKER_AI.__dict__.setdefault("players", {})
+    ai_player = players.get(amount_of_sims)
+    if ai_player is None:
+        ai_player = players[amount_of_sims] = AIPlayer(amount_of_sims)
+    placement_counts, tile_placement = ai_player.run_simulation(race_track_simulatable_list, remaining_die)
+    evs = ai_player.display_stats(placement_counts, tile_placement, available_bets, empty_spaces, unrolled_dice)
+    return ai_player.score_spectator_tiles(
+        evs, race_track_simulatable_list, remaining_die, empty_spaces, open_bets
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Host Camel Up tables over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sims", type=int, default=1000, help="simulations per AI hint")
+    parser.add_argument("--workers", type=int, default=None, help="hint worker processes")
+    parser.add_argument("--snapshots", default=None, help="directory to checkpoint and resume tables in")
+    args = parser.parse_args()
+
+    async def main() -> None:
+        server = GameServer(args.host, args.port, args.sims, args.workers, snapshot_dir=args.snapshots)
+        await server.start()
+        print(f"Serving Camel Up on {server.host}:{server.port}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+from CamelPlayer import CamelPlayer
+from GameSnapshot import GameSnapshot
+from TheGame import TheGame
+
+
+class GameSession:
+    """
+    One Camel Up table, driven by commands instead of input() and print().
+
+    Wraps TheGame and its turn methods (take_roll_turn, play_ai_turn, ...) for
+    GameServer. Seats play in the order given; seats named "AI" are played by
+    the server, every other seat belongs to the client that joins under its name.
+    Every method raises ValueError with a player-facing message when a command is
+    not allowed.
+
+    Attributes:
+        session_id (str): Identifier used by clients to join.
+        game (TheGame): The wrapped game.
+        seats (list[CamelPlayer]): Players in seating order.
+    """
+
+    MAX_SEATS = 8
+    TILE_TYPES = {"+": 1, "+1": 1, "p": 1, "-": -1, "-1": -1, "n": -1}
+
+    def __init__(self, session_id: str, seat_names: List[str], snapshot: bytes | None = None) -> None:
+        """
+        Args:
+            session_id (str): Identifier of the table.
+            seat_names (list[str]): Seat names in turn order; "AI" seats are
+                played by the server. Ignored when restoring a snapshot.
+            snapshot (bytes | None): Output of snapshot(), to resume a table.
+
+        Raises:
+            ValueError: For no seats, too many seats, duplicate human names,
+                names too long to snapshot, or an invalid snapshot.
+        """
+        self.session_id = session_id
+        self.game = TheGame()
+        # Hints come from GameServer's executor; release the in-process AI's book
+        self.game.ai_player.close()
+        if snapshot is not None:
+            GameSnapshot.loads(snapshot, self.game)
+            seat_names = [player.name for player in self.game.all_players]
+        if not 1 <= len(seat_names) <= self.MAX_SEATS:
+            raise ValueError(f"a table needs 1 to {self.MAX_SEATS} seats")
+        for name in seat_names:
+            if len(name.encode("utf-8")) > GameSnapshot.MAX_NAME_BYTES:
+                raise ValueError(f"seat names are limited to {GameSnapshot.MAX_NAME_BYTES} UTF-8 bytes")
+        humans = [name for name in seat_names if name.lower() != "ai"]
+        if len(set(humans)) != len(humans):
+            raise ValueError("human seat names must be unique")
+
+        if snapshot is not None:
+            self.seats = self.game.all_players
+            return
+        self.seats = [CamelPlayer(name) for name in seat_names]
+        self.game.players = self.seats.copy()
+        self.game.all_players = self.seats.copy()
+
+    def snapshot(self) -> bytes:
+        """
+        Save the table; pass the result to GameSession(..., snapshot=...) to resume.
+
+        Returns:
+            bytes: A GameSnapshot of the game.
+        """
+        return GameSnapshot.dumps(self.game)
+
+    @property
+    def finished(self) -> bool:
+        """
+        True once a camel has crossed the finish line.
+        """
+        return self.game.race_track.has_camel_won
+
+    @property
+    def current_player(self) -> CamelPlayer:
+        """
+        The player whose turn it is.
+        """
+        return self.game.players[0]
+
+    def human_seat(self, name: str) -> CamelPlayer:
+        """
+        Find a human seat by name.
+
+        Args:
+            name (str): Seat name.
+
+        Raises:
+            ValueError: If there is no such human seat.
+
+        Returns:
+            CamelPlayer: The seat.
+        """
+        for player in self.seats:
+            if player.name == name and not player.is_ai:
+                return player
+        raise ValueError(f"no human seat named {name!r} at table {self.session_id}")
+
+    def roll(self, name: str) -> str:
+        """
+        Roll a die for `name`, settling the leg if it ends.
+
+        Returns:
+            str: Summary of the roll.
+        """
+        player = self._start_turn(name)
+        msg = self.game.take_roll_turn(player)
+        self._end_turn()
+        return f"{name}: {msg.strip()}"
+
+    def bet(self, name: str, color: str) -> str:
+        """
+        Take the top betting ticket for `color`.
+
+        Returns:
+            str: Summary of the bet.
+        """
+        player = self._start_turn(name)
+        if color not in self.game.betting_tents.ticket_amounts:
+            raise ValueError(f"unknown camel color {color!r}")
+        if not self.game.take_bet(player, color):
+            raise ValueError(f"no bets left on {color!r}")
+        self._end_turn()
+        return f"{name} has taken out a bet on {color}."
+
+    def place_tile(self, name: str, position: int, tile_type: str) -> str:
+        """
+        Place a spectator tile for `name`.
+
+        Args:
+            name (str): Seat name.
+            position (int): Tile index; must be in RaceTrack.empty_spaces().
+            tile_type (str): "+" or "-" (also "+1"/"-1" or "p"/"n").
+
+        Returns:
+            str: Summary of the placement.
+        """
+        player = self._start_turn(name)
+        if tile_type not in self.TILE_TYPES:
+            raise ValueError("tile type must be + or -")
+        if position not in self.game.race_track.empty_spaces():
+            raise ValueError(f"cannot place a spectator tile on tile {position}")
+        self.game.set_spectator_tile(player, position, self.TILE_TYPES[tile_type])
+        self._end_turn()
+        sign_label = "positive" if self.TILE_TYPES[tile_type] == 1 else "negative"
+        return f"{name} has placed a {sign_label} spectator tile on tile {position}."
+
+    def ai_to_move(self) -> bool:
+        """
+        True if the game is running and an AI seat is next.
+        """
+        return not self.finished and self.current_player.is_ai
+
+    def hint_request(
+        self,
+        name: str | None = None,
+    ) -> Tuple[List[Tuple], List[str], Dict[str, int], set, List[str], List[Tuple]]:
+        """
+        Snapshot what a hint needs, as plain picklable values.
+
+        Args:
+            name (str | None): Human seat asking for the hint, whose open bets
+                weigh the spectator tiles; None for the current player (an AI
+                seat about to move).
+
+        Raises:
+            ValueError: If there is no human seat named `name`.
+
+        Returns:
+            tuple: (race track list, remaining dice, available bets, empty spaces,
+            unrolled dice, open bets), the arguments of AIPlayer.run_simulation and
+            display_stats followed by the seat's bets as (color, payouts).
+        """
+        player = self.current_player if name is None else self.human_seat(name)
+        game = self.game
+        remaining_die = list(game.pyramid.to_simulatable())
+        return (
+            game.race_track.to_simulatable_list(),
+            remaining_die,
+            game.betting_tents.get_available_bets(),
+            game.race_track.empty_spaces(),
+            list(remaining_die),
+            [(bet.color, tuple(bet.money_for_placements)) for bet in player.bets],
+        )
+
+    def play_ai(self, evs: Dict[str, float]) -> str:
+        """
+        Play the current AI seat's turn from a hint computed elsewhere.
+
+        Args:
+            evs (dict[str, float]): Output of AIPlayer.display_stats for the
+                current position.
+
+        Returns:
+            str: Summary of what the AI did.
+        """
+        if not self.ai_to_move():
+            raise ValueError("it is not an AI's turn")
+        _, msg = self.game.play_ai_turn(self.current_player, evs)
+        self._end_turn()
+        return msg.strip()
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Everything a client needs to draw the table, as JSON-ready values.
+
+        Returns:
+            dict: session, finished, turn (seat name, or null once finished),
+            board (camels per tile, bottom to top), spectator_tiles (tile ->
+            +1/-1), rolled and unrolled dice, available_bets, placements, and
+            players (name, coins and open bets, in seating order).
+        """
+        game = self.game
+        race_track = game.race_track
+        return {
+            "session": self.session_id,
+            "finished": self.finished,
+            "turn": None if self.finished else self.current_player.name,
+            "board": [[camel[0] for camel in tile.to_list()] for tile in race_track.camel_and_tile_locations],
+            "spectator_tiles": {str(tile): tile_type for tile, (tile_type, _) in race_track.spectator_tiles.items()},
+            "rolled": [list(die) for die in game.pyramid.rolled_dice],
+            "unrolled": list(game.pyramid.unrolled_dice),
+            "available_bets": game.betting_tents.get_available_bets(),
+            "placements": list(race_track.get_camel_placements()),
+            "players": [
+                {
+                    "name": player.name,
+                    "coins": player.amount_of_money,
+                    "bets": [[bet.color, bet.money_for_placements[0]] for bet in player.bets],
+                }
+                for player in self.seats
+            ],
+        }
+
+    def _start_turn(self, name: str) -> CamelPlayer:
+        """
+        Check that `name` may act now and return their seat.
+        """
+        if self.finished:
+            raise ValueError("the race is over")
+        player = self.human_seat(name)
+        if player is not self.current_player:
+            raise ValueError(f"it is {self.current_player.name}'s turn")
+        return player
+
+    def _end_turn(self) -> None:
+        """
+        Pass the turn to the next seat.
+        """
+        self.game.players.append(self.game.players.pop(0))
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import struct
+from typing import List, Optional, Tuple
+
+from BettingTicketHolder import BettingTicketHolder
+from CamelPlayer import CamelPlayer
+from CompactBoard import CompactBoard
+from Pyramid import Pyramid
+from RaceTrack import RaceTrack
+from TheGame import TheGame
+
+
+class GameSnapshot:
+    """
+    Compact, versioned binary snapshot of a whole game.
+
+    Unlike RaceTrack.to_simulatable_list, a snapshot keeps everything needed to
+    carry on playing: camel stacks and finishers, spectator tiles with their
+    owners, the pyramid (rolled dice and the order of the unrolled ones), the
+    ticket stacks, and every player's money, open bets and place in the turn
+    order. A typical snapshot is well under 200 bytes, so it can be written
+    after every turn.
+
+    Layout (little-endian; colors are CompactBoard.COLORS indices, players are
+    seat indices into all_players):
+        header: magic b"CUGS", format version (u16), track length (u8)
+        players: count (u8), then per player: name length (u8), UTF-8 name,
+                 money (i16), open bets (u8), then per bet: color (u8) and the
+                 five payouts (5 x i8)
+        turn order: count (u8), seat indices (u8 each)
+        camels: CompactBoard encoding (14 bytes), race won flag (u8), then for
+                each of the three overshoot groups: count (u8), colors (u8 each)
+        spectator tiles: count (u8), then per tile: tile (u8), type (i8),
+                owner seat (u8, 255 if the owner is not seated)
+        pyramid: unrolled count (u8), colors (u8 each), rolled count (u8),
+                then per die: color (u8) and value (i8)
+        tickets: per color in BettingTicketHolder order: count (u8), then the
+                five payouts of each ticket from bottom to top (5 x i8)
+
+    Bump FORMAT_VERSION whenever the layout changes; `loads` rejects other versions.
+    """
+
+    MAGIC = b"CUGS"
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct("<4sHB")
+    NO_OWNER = 255
+    # Names are stored with a one-byte length
+    MAX_NAME_BYTES = 255
+    TICKET_COLORS = ("blue", "green", "red", "yellow", "purple")
+
+    @staticmethod
+    def dumps(game: TheGame) -> bytes:
+        """
+        Encode a game between turns.
+
+        Every seated player must be in both all_players and players (the turn
+        order), which holds between turns in TheGame.start_game and at all times
+        in GameSession.
+
+        Args:
+            game (TheGame): The game to save.
+
+        Raises:
+            ValueError: If the turn order does not match the seated players, or
+                a player name is longer than MAX_NAME_BYTES in UTF-8.
+
+        Returns:
+            bytes: The snapshot.
+        """
+        seats = game.all_players
+        seat_index = {id(player): idx for idx, player in enumerate(seats)}
+        if len(game.players) != len(seats) or any(id(player) not in seat_index for player in game.players):
+            raise ValueError("snapshots can only be taken between turns")
+        color_index = CompactBoard.COLOR_INDEX
+        race_track = game.race_track
+
+        out = bytearray(
+            GameSnapshot.HEADER.pack(GameSnapshot.MAGIC, GameSnapshot.FORMAT_VERSION, race_track.race_track_length)
+        )
+
+        out.append(len(seats))
+        for player in seats:
+            name = player.name.encode("utf-8")
+            if len(name) > GameSnapshot.MAX_NAME_BYTES:
+                raise ValueError(
+                    f"player name {player.name[:20]!r}... is longer than {GameSnapshot.MAX_NAME_BYTES} UTF-8 bytes"
+                )
+            out.append(len(name))
+            out += name
+            out += struct.pack("<hB", player.amount_of_money, len(player.bets))
+            for bet in player.bets:
+                out.append(color_index[bet.color])
+                out += struct.pack("<5b", *bet.money_for_placements)
+
+        out.append(len(game.players))
+        out += bytes(seat_index[id(player)] for player in game.players)
+
+        out += CompactBoard.from_simulatable(race_track.to_simulatable_list())
+        out.append(1 if race_track.has_camel_won else 0)
+        for group in race_track.won_camels:
+            out.append(len(group))
+            out += bytes(color_index[color] for color in group)
+
+        out.append(len(race_track.spectator_tiles))
+        for tile, (tile_type, owner) in race_track.spectator_tiles.items():
+            out += struct.pack("<BbB", tile, tile_type, seat_index.get(id(owner), GameSnapshot.NO_OWNER))
+
+        pyramid = game.pyramid
+        out.append(len(pyramid.unrolled_dice))
+        out += bytes(color_index[color] for color in pyramid.unrolled_dice)
+        out.append(len(pyramid.rolled_dice))
+        for color, value in pyramid.rolled_dice:
+            out += struct.pack("<Bb", color_index[color], value)
+
+        for color in GameSnapshot.TICKET_COLORS:
+            stack = game.betting_tents.ticket_amounts[color]
+            out.append(len(stack))
+            for ticket in stack:
+                out += struct.pack("<5b", *ticket.money_for_placements)
+
+        return bytes(out)
+
+    @staticmethod
+    def loads(data: bytes, game: Optional[TheGame] = None) -> TheGame:
+        """
+        Restore a game from a snapshot.
+
+        Args:
+            data (bytes): Output of dumps.
+            game (TheGame | None): Game to restore into (its AI player,
+                random source and settings are kept). A new TheGame is
+                created by default.
+
+        Raises:
+            ValueError: If the data is not a snapshot of this format version.
+
+        Returns:
+            TheGame: The restored game.
+        """
+        try:
+            return GameSnapshot._decode(memoryview(data), game)
+        except (struct.error, IndexError, KeyError, UnicodeDecodeError) as error:
+            raise ValueError(f"corrupt game snapshot: {error}") from None
+
+    @staticmethod
+    def _decode(data: memoryview, game: Optional[TheGame]) -> TheGame:
+        """
+        Body of loads; malformed data surfaces as struct/index errors.
+        """
+        magic, version, track_length = GameSnapshot.HEADER.unpack_from(data, 0)
+        if magic != GameSnapshot.MAGIC or version != GameSnapshot.FORMAT_VERSION:
+            raise ValueError("not a game snapshot of a supported version")
+        offset = GameSnapshot.HEADER.size
+        colors = CompactBoard.COLORS
+
+        def read(fmt: str) -> Tuple:
+            nonlocal offset
+            values = struct.unpack_from(fmt, data, offset)
+            offset += struct.calcsize(fmt)
+            return values
+
+        def read_bytes(count: int) -> bytes:
+            nonlocal offset
+            if offset + count > len(data):
+                raise IndexError("snapshot is truncated")
+            chunk = bytes(data[offset:offset + count])
+            offset += count
+            return chunk
+
+        seats: List[CamelPlayer] = []
+        for _ in range(read("<B")[0]):
+            name = read_bytes(read("<B")[0]).decode("utf-8")
+            money, n_bets = read("<hB")
+            player = CamelPlayer(name, money)
+            for _ in range(n_bets):
+                color = colors[read("<B")[0]]
+                player.bets.append(BettingTicketHolder.BettingTicket(color, read("<5b")))
+            seats.append(player)
+        turn_order = [seats[idx] for idx in read_bytes(read("<B")[0])]
+
+        race_track = RaceTrack(track_length)
+        race_track.set_up_camels(CompactBoard.to_simulatable(read_bytes(2 * len(colors))))
+        race_track.has_camel_won = bool(read("<B")[0])
+        race_track.won_camels = [
+            [colors[idx] for idx in read_bytes(read("<B")[0])] for _ in range(len(race_track.won_camels))
+        ]
+        for _ in range(read("<B")[0]):
+            tile, tile_type, owner = read("<BbB")
+            race_track.spectator_tiles[tile] = (tile_type, seats[owner] if owner != GameSnapshot.NO_OWNER else None)
+
+        if game is None:
+            game = TheGame()
+        # The restored pyramid keeps rolling from the game's own stream
+        pyramid = Pyramid(game.rng)
+        pyramid.unrolled_dice = [colors[idx] for idx in read_bytes(read("<B")[0])]
+        pyramid.rolled_dice = []
+        for _ in range(read("<B")[0]):
+            color, value = read("<Bb")
+            pyramid.rolled_dice.append((colors[color], value))
+
+        betting_tents = BettingTicketHolder()
+        for color in GameSnapshot.TICKET_COLORS:
+            betting_tents.ticket_amounts[color] = [
+                BettingTicketHolder.BettingTicket(color, read("<5b")) for _ in range(read("<B")[0])
+            ]
+        if offset != len(data):
+            raise ValueError("unexpected data after the game snapshot")
+
+        game.race_track = race_track
+        game.pyramid = pyramid
+        game.betting_tents = betting_tents
+        game.all_players = seats
+        game.players = turn_order
+        return game
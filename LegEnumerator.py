@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from operator import add
+from typing import Dict, List, Tuple
+
+from CompactBoard import CompactBoard
+
+
+class LegEnumerator:
+    """
+    Exact alternative to the Monte Carlo loop in AIPlayer.run_simulation.
+
+    Instead of sampling legs, every remaining (die order x face value) sequence is
+    walked depth-first. Sequences that share a prefix share the work for that prefix,
+    and positions reached through different orders (e.g. two camels that never touch
+    moving in either order) are solved once through a memo keyed on the
+    CompactBoard encoding and a bitmask of the remaining dice.
+
+    The result has the same shape as AIPlayer.run_simulation, but holds exact
+    probabilities instead of counts:
+      - placement_counts[color] -> [P(1st), P(2nd)]
+      - tile_placement[i] -> expected number of rolls ending on tile i
+
+    Legs follow the game's rules, like the Monte Carlo path: spectator tiles
+    bounce the camels landing on them (CompactBoard.move with the position's
+    per-tile effects), a crazy die moves its camel backwards and takes its
+    partner out of the pyramid, and a sequence ends with the last regular die
+    or when a camel crosses the finish line.
+
+    The memo is kept after a call. Once a die is actually rolled, the next position
+    is a child of the one just solved and is answered straight from the retained
+    tree; a position outside the tree (new leg, new spectator tile) starts a
+    fresh one.
+    """
+
+    REGULAR_MASK = (1 << CompactBoard.N_REGULAR) - 1
+
+    def __init__(self, track_length: int = 16, retain_tree: bool = True) -> None:
+        self.track_length = track_length
+        self.retain_tree = retain_tree
+        # Number of calls answered directly from the retained tree
+        self.tree_hits = 0
+        # Memo: (board, dice mask) -> flat result vector (see _solve)
+        self._memo: Dict[Tuple[bytes, int], List[float]] = {}
+        # Spectator tile effects the memo was built with
+        self._effects: Tuple[int, ...] = (0,) * track_length
+
+    def enumerate_leg(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+    ) -> Tuple[Dict[str, List[float]], List[float]]:
+        """
+        Compute exact leg statistics for the given position.
+
+        Args:
+            race_track_simulatable_list:
+                Output of RaceTrack.to_simulatable_list(): (color, tile_index) pairs
+                from bottom to top of each tile, plus its spectator tiles.
+            remaining_die:
+                List of colors that are still in the pyramid (unrolled).
+
+        Returns:
+            A tuple:
+              - placement_counts: dict[color] -> [first_place_probability,
+                second_place_probability]
+              - tile_placement: list where tile_placement[i] is the expected number
+                of rolls ending on tile i during the rest of the leg.
+        """
+        board = CompactBoard.from_simulatable(race_track_simulatable_list)
+        effects = CompactBoard.spectator_effects(race_track_simulatable_list, self.track_length)
+
+        # Dice as a bitmask over CompactBoard.COLORS, so equivalent pyramids share entries
+        dice = 0
+        for color in remaining_die:
+            dice |= 1 << CompactBoard.COLOR_INDEX[color]
+
+        if effects == self._effects and (board, dice) in self._memo:
+            self.tree_hits += 1
+        else:
+            # Not a descendant of the previous position: start a new tree
+            self._memo = {}
+            self._effects = effects
+        try:
+            result = self._solve(board, dice)
+        finally:
+            if not self.retain_tree:
+                self._memo = {}
+
+        n_regular = CompactBoard.N_REGULAR
+        placement_counts: Dict[str, List[float]] = {
+            color: [result[i], result[n_regular + i]]
+            for i, color in enumerate(CompactBoard.REGULAR_COLORS)
+        }
+        tile_placement = result[2 * n_regular:]
+        return placement_counts, tile_placement
+
+    def _solve(self, board: bytes, dice: int) -> List[float]:
+        """
+        Solve the sub-leg starting at (board, dice).
+
+        Returns:
+            Flat vector of P(1st) per regular color, P(2nd) per regular color,
+            then expected landings per tile.
+        """
+        key = (board, dice)
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
+        n_regular = CompactBoard.N_REGULAR
+        result = [0.0] * (2 * n_regular + self.track_length)
+
+        if not dice & self.REGULAR_MASK:
+            # The leg is over (or the race was won): rank the board
+            ranking = CompactBoard.ranking(board)
+            if ranking:
+                result[ranking[0]] = 1.0
+            if len(ranking) > 1:
+                result[n_regular + ranking[1]] = 1.0
+            self._memo[key] = result
+            return result
+
+        # Every (die, face) branch is equally likely, so sum first and scale once
+        n_branches = 0
+        for color_index in range(len(CompactBoard.COLORS)):
+            if not dice & (1 << color_index):
+                continue
+            n_branches += 3
+            is_crazy = color_index >= n_regular
+            if is_crazy:
+                # Rolling one crazy die takes the other one out of the pyramid
+                next_dice = dice & self.REGULAR_MASK
+            else:
+                next_dice = dice & ~(1 << color_index)
+
+            for face in (1, 2, 3):
+                amount = -face if is_crazy else face
+                next_board, _, landing, crossed = CompactBoard.move(
+                    board, color_index, amount, self._effects, self.track_length
+                )
+                # Crossing the finish line ends the race, and so the leg
+                result = list(map(add, result, self._solve(next_board, 0 if crossed else next_dice)))
+                if landing >= 0:
+                    result[2 * n_regular + landing] += 1.0
+
+        weight = 1.0 / n_branches
+        result = [value * weight for value in result]
+        self._memo[key] = result
+        return result
@@ -8,6 +8,9 @@ class LinkedList:
 
     Each node's `data` is typically a tuple like ('blue',) representing
     a camel on the track.
+
+    The list keeps `tail` and `length` up to date so appending and splitting
+    stacks does not have to walk the whole list.
     """
 
     class Node:
@@ -38,6 +41,28 @@ class LinkedList:
         Initialize an empty linked list.
         """
         self.head: Optional[LinkedList.Node] = None
+        self.tail: Optional[LinkedList.Node] = None
+        self.length = 0
+
+    def __len__(self) -> int:
+        return self.length
+
+    @staticmethod
+    def _stack_tail(node: "LinkedList.Node") -> tuple["LinkedList.Node", int]:
+        """
+        Find the last node of a detached stack and count its nodes.
+
+        Args:
+            node (Node): Starting node of the stack.
+
+        Returns:
+            tuple[Node, int]: The last node and the number of nodes.
+        """
+        count = 1
+        while node.next:
+            node = node.next
+            count += 1
+        return node, count
 
     def append(self, data: Any) -> None:
         """
@@ -50,14 +75,12 @@ class LinkedList:
             None
         """
         new_node = LinkedList.Node(data)
-        if self.head is None:
+        if self.tail is None:
             self.head = new_node
-            return
-
-        curr = self.head
-        while curr.next:
-            curr = curr.next
-        curr.next = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
 
     def to_list(self) -> list[Any]:
         """
@@ -95,17 +118,23 @@ class LinkedList:
         if self.head.data[0] == color:
             moving = self.head
             self.head = None
+            self.tail = None
+            self.length = 0
             return moving
 
         prev = self.head
         curr = prev.next
+        kept = 1
         while curr:
             if curr.data[0] == color:
                 # Disconnect previous node from this stack
                 prev.next = None
+                self.tail = prev
+                self.length = kept
                 return curr
             prev = curr
             curr = curr.next
+            kept += 1
         return None
 
     def add_stack_to_top(self, node: Optional["LinkedList.Node"]) -> None:
@@ -121,14 +150,13 @@ class LinkedList:
         if node is None:
             return
 
-        if self.head is None:
+        stack_tail, count = LinkedList._stack_tail(node)
+        if self.tail is None:
             self.head = node
-            return
-
-        curr = self.head
-        while curr.next:
-            curr = curr.next
-        curr.next = node
+        else:
+            self.tail.next = node
+        self.tail = stack_tail
+        self.length += count
 
     def remove_stack_from_top(self, n: int) -> Optional["LinkedList.Node"]:
         """
@@ -146,17 +174,14 @@ class LinkedList:
         if self.head is None:
             return None
 
-        # Compute total length
-        length = 0
-        curr = self.head
-        while curr:
-            length += 1
-            curr = curr.next
+        length = self.length
 
         # If n >= length, remove the entire list
         if n >= length:
             stack = self.head
             self.head = None
+            self.tail = None
+            self.length = 0
             return stack
 
         # Walk to the node just before the split point
@@ -168,6 +193,8 @@ class LinkedList:
 
         if prev is not None:
             prev.next = None
+        self.tail = prev
+        self.length = length - n
         return curr
 
     def add_stack_to_bottom(self, node: Optional["LinkedList.Node"]) -> None:
@@ -184,13 +211,14 @@ class LinkedList:
             return
 
         # Find end of provided stack
-        tail = node
-        while tail.next:
-            tail = tail.next
+        stack_tail, count = LinkedList._stack_tail(node)
 
         # Attach current list after this stack, then update head
-        tail.next = self.head
+        stack_tail.next = self.head
+        if self.head is None:
+            self.tail = stack_tail
         self.head = node
+        self.length += count
 
     def __str__(self) -> str:
         """
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from CamelPlayer import CamelPlayer
+from CompactBoard import CompactBoard
+from ExpectimaxPlayer import ExpectimaxPlayer
+from Instrumentation import Instrumentation
+from RandomSource import RandomSource
+
+if TYPE_CHECKING:
+    from TheGame import TheGame
+
+
+class _Node:
+    """
+    A position with the AI to move, and the statistics of each action from it.
+
+    edges maps an action to [visits, total return, {next state: _Node}]: what
+    happens after an action (the dice, the other seats' turns) is sampled, so
+    one action can lead to many positions.
+    """
+
+    __slots__ = ("state", "visits", "untried", "edges")
+
+    def __init__(self, state: Tuple, actions: List[Tuple]) -> None:
+        self.state = state
+        self.visits = 0
+        self.untried = actions
+        self.edges: Dict[Tuple, List] = {}
+
+
+class MCTSPlayer:
+    """
+    Anytime Monte Carlo Tree Search over whole turns, stopped by a wall-clock budget.
+
+    Unlike AIPlayer, whose cost is set by a number of simulations, this searches
+    for a fixed time and returns the best action found so far, however complex
+    the board. The tree holds the AI's own decisions. Everything between two AI
+    turns is sampled: the dice when somebody rolls, and the other seats' turns,
+    which follow a cheap default policy (take the leader's top ticket while it
+    pays 3 or more, otherwise roll). Each iteration:
+      - selects actions by UCB1 down the tree until an untried action or a new
+        position is reached
+      - plays the rest of the leg out with the default policy for every seat
+      - backs the AI's coin margin up the path
+
+    The search horizon is the end of the current leg (the last regular die, or
+    a camel crossing the finish line), where tickets are settled exactly. States,
+    actions and rewards are those of ExpectimaxPlayer: the value of an action
+    is the AI's expected coins minus the average coins of the other seats.
+
+    The tree is kept between turns. When the position at the AI's next turn is
+    one the tree already reached (the other seats and the dice did what was
+    simulated), search continues from that subtree instead of starting over.
+    """
+
+    def __init__(
+        self,
+        time_budget_ms: float = 500.0,
+        max_iterations: Optional[int] = None,
+        exploration: float = 2.0,
+        rng: Any = None,
+        instrumentation: Optional[Instrumentation] = None,
+        track_length: int = 16,
+    ) -> None:
+        """
+        Args:
+            time_budget_ms (float): Milliseconds to search per decision.
+            max_iterations (int | None): Also stop after this many iterations,
+                e.g. for repeatable runs; None for no limit.
+            exploration (float): UCB1 exploration constant, in coins.
+            rng: Source of the sampled dice; anything RandomSource accepts.
+            instrumentation (Instrumentation | None): Records the "ai.mcts"
+                phase and iteration counts when enabled.
+            track_length (int): Number of tiles on the track.
+
+        Raises:
+            ValueError: For a budget that is not positive, or an iteration cap
+                below 1.
+        """
+        if time_budget_ms <= 0:
+            raise ValueError("time_budget_ms must be positive")
+        if max_iterations is not None and max_iterations < 1:
+            raise ValueError("max_iterations must be at least 1")
+        self.time_budget_ms = time_budget_ms
+        self.max_iterations = max_iterations
+        self.exploration = exploration
+        self.rng = RandomSource.coerce(rng)
+        self.instrumentation = instrumentation or Instrumentation()
+        self.track_length = track_length
+        # iterations, seconds, iterations_per_second and reused_visits of the last decision
+        self.last_report: Dict[str, float] = {}
+
+        self._root: Optional[_Node] = None
+        self._n_seats = 1
+        self._weights: Tuple[float, ...] = (1.0, 0.0)
+        self._effects: Dict[Tuple, Tuple[int, ...]] = {}
+
+    def action_values(self, game: "TheGame", player: CamelPlayer) -> Dict[str, float]:
+        """
+        Search the game's position for `player`, who is about to move.
+
+        Args:
+            game (TheGame): The game; the other players move in the order of
+                game.players.
+            player (CamelPlayer): The player to move.
+
+        Returns:
+            dict[str, float]: Mean coin margin of every action searched, with
+            AIPlayer's labels, so it can be passed to TheGame.choose_ai_action.
+        """
+        state, n_seats = ExpectimaxPlayer.state_from_game(game, player)
+        return self.search(state, n_seats)
+
+    def search(self, state: Tuple, n_seats: int, time_budget_ms: Optional[float] = None) -> Dict[str, float]:
+        """
+        Search a position until the time budget or iteration cap runs out.
+
+        Args:
+            state (tuple): ExpectimaxPlayer search state with the AI to move.
+            n_seats (int): Number of seats in the game.
+            time_budget_ms (float | None): Overrides the player's budget for
+                this decision.
+
+        Returns:
+            dict[str, float]: Mean coin margin per action label. Rarely
+            visited actions have noisy means, so play best_action (the most
+            visited one), as TheGame.play_ai_turn does.
+        """
+        budget = self.time_budget_ms if time_budget_ms is None else time_budget_ms
+        with self.instrumentation.phase("ai.mcts"):
+            start = time.perf_counter()
+            deadline = start + budget / 1000.0
+            if n_seats != self._n_seats:
+                self._root = None
+                self._n_seats = n_seats
+                if n_seats > 1:
+                    self._weights = (1.0,) + (-1.0 / (n_seats - 1),) * (n_seats - 1) + (0.0,)
+                else:
+                    self._weights = (1.0, 0.0)
+            root = self._reuse(state)
+            reused = root.visits
+
+            iterations = 0
+            while True:
+                self._iterate(root)
+                iterations += 1
+                if self.max_iterations is not None and iterations >= self.max_iterations:
+                    break
+                if time.perf_counter() >= deadline:
+                    break
+            seconds = time.perf_counter() - start
+            self._root = root
+
+        self.last_report = {
+            "iterations": iterations,
+            "seconds": seconds,
+            "iterations_per_second": iterations / seconds if seconds > 0 else 0.0,
+            "reused_visits": reused,
+        }
+        self.instrumentation.count("ai.mcts_iterations", iterations)
+        return {
+            ExpectimaxPlayer.action_label(action): edge[1] / edge[0]
+            for action, edge in root.edges.items()
+            if edge[0]
+        }
+
+    def best_action(self) -> str:
+        """
+        Label of the most visited action at the root of the last search.
+
+        Raises:
+            ValueError: If nothing has been searched yet.
+
+        Returns:
+            str: An AIPlayer-style label.
+        """
+        if self._root is None or not self._root.edges:
+            raise ValueError("search has not run yet")
+        action = max(self._root.edges, key=lambda a: self._root.edges[a][0])
+        return ExpectimaxPlayer.action_label(action)
+
+    def _reuse(self, state: Tuple) -> _Node:
+        """
+        The node for `state` from the previous tree if it reached it, else a new root.
+        """
+        root = self._root
+        if root is not None:
+            if root.state == state:
+                return root
+            for edge in root.edges.values():
+                child = edge[2].get(state)
+                if child is not None:
+                    return child
+        return _Node(state, self._actions(state))
+
+    def _iterate(self, root: _Node) -> None:
+        """
+        One selection, expansion, rollout and backup from the root.
+        """
+        node = root
+        # (node, action, return earned before reaching node)
+        path: List[Tuple[_Node, Tuple, float]] = []
+        earned = 0.0
+        log = math.log
+        sqrt = math.sqrt
+        while True:
+            if node.untried:
+                action = node.untried.pop(self.rng.randrange(len(node.untried)))
+                node.edges[action] = [0, 0.0, {}]
+            else:
+                # UCB1 over the tried actions
+                log_visits = log(node.visits)
+                c = self.exploration
+                action = max(
+                    node.edges,
+                    key=lambda a: node.edges[a][1] / node.edges[a][0] + c * sqrt(log_visits / node.edges[a][0]),
+                )
+            path.append((node, action, earned))
+            next_state, reward = self._turn(node.state, action)
+            earned += reward
+            if next_state is None:
+                break
+            children = node.edges[action][2]
+            child = children.get(next_state)
+            if child is None:
+                # New position: add it, then play the leg out
+                children[next_state] = _Node(next_state, self._actions(next_state))
+                earned += self._rollout(next_state)
+                break
+            node = child
+
+        for visited, action, before in path:
+            visited.visits += 1
+            edge = visited.edges[action]
+            edge[0] += 1
+            edge[1] += earned - before
+
+    def _turn(self, state: Tuple, action: Tuple) -> Tuple[Optional[Tuple], float]:
+        """
+        Play the AI's action, then the other seats, until the AI moves again.
+
+        Returns:
+            tuple: (state with the AI to move, or None once the leg is over;
+            coin margin earned on the way)
+        """
+        state, reward = self._step(state, action)
+        while state is not None and state[5] != 0:
+            state, step_reward = self._step(state, self._default_action(state))
+            reward += step_reward
+        return state, reward
+
+    def _rollout(self, state: Tuple) -> float:
+        """
+        Coin margin earned playing the rest of the leg with the default policy.
+        """
+        reward = 0.0
+        while state is not None:
+            state, step_reward = self._step(state, self._default_action(state))
+            reward += step_reward
+        return reward
+
+    def _default_action(self, state: Tuple) -> Tuple:
+        """
+        Cheap policy: the leader's top ticket while it pays 3 or more, else roll.
+        """
+        leader = CompactBoard.ranking(state[0])[0]
+        stack = state[3][leader]
+        if stack and stack[-1][0] >= 3:
+            return ("bet", leader)
+        return ("roll",)
+
+    def _actions(self, state: Tuple) -> List[Tuple]:
+        """
+        Every legal action of the seat to move: roll, each bet, each tile and sign.
+        """
+        board, _, tiles, tickets, _, _ = state
+        actions: List[Tuple] = [("roll",)]
+        actions.extend(("bet", color) for color, stack in enumerate(tickets) if stack)
+        blocked = set()
+        for tile, _, _ in tiles:
+            blocked.update((tile - 1, tile, tile + 1))
+        for i in range(len(CompactBoard.COLORS)):
+            blocked.add(board[2 * i])
+        for tile in range(self.track_length):
+            if tile not in blocked:
+                actions.append(("tile", tile, 1))
+                actions.append(("tile", tile, -1))
+        return actions
+
+    def _step(self, state: Tuple, action: Tuple) -> Tuple[Optional[Tuple], float]:
+        """
+        Apply one action of the seat to move, rolling a random die for "roll".
+
+        Returns:
+            tuple: (next state, or None once the leg is over; coin margin earned)
+        """
+        board, dice, tiles, tickets, bets, seat = state
+        next_seat = (seat + 1) % self._n_seats
+        if action[0] == "bet":
+            color = action[1]
+            stack = tickets[color]
+            tickets = tickets[:color] + (stack[:-1],) + tickets[color + 1:]
+            seat_bets = tuple(sorted(bets[seat] + ((color, stack[-1]),)))
+            bets = bets[:seat] + (seat_bets,) + bets[seat + 1:]
+            return (board, dice, tiles, tickets, bets, next_seat), 0.0
+        if action[0] == "tile":
+            tiles = tuple(sorted(tiles + ((action[1], action[2], seat),)))
+            return (board, dice, tiles, tickets, bets, next_seat), 0.0
+
+        effects = self._effects.get(tiles)
+        if effects is None:
+            tile_effects = [0] * self.track_length
+            for tile, tile_type, _ in tiles:
+                tile_effects[tile] = tile_type
+            effects = self._effects[tiles] = tuple(tile_effects)
+        in_pyramid = [i for i in range(len(CompactBoard.COLORS)) if dice >> i & 1]
+        color_index = in_pyramid[self.rng.randrange(len(in_pyramid))]
+        face = self.rng.randint(1, 3)
+        weights = self._weights
+        if color_index >= CompactBoard.N_REGULAR:
+            # Rolling one crazy die takes the other one out of the pyramid
+            dice &= ExpectimaxPlayer.REGULAR_MASK
+            face = -face
+            reward = 0.0
+        else:
+            dice &= ~(1 << color_index)
+            reward = weights[seat]
+        board, landed, _, crossed = CompactBoard.move(board, color_index, face, effects, self.track_length)
+        if landed >= 0 and effects[landed]:
+            for tile, _, owner in tiles:
+                if tile == landed:
+                    reward += weights[owner]
+        if crossed or not dice & ExpectimaxPlayer.REGULAR_MASK:
+            # The leg is over: settle every ticket
+            rank = {color: place for place, color in enumerate(CompactBoard.ranking(board))}
+            for bet_seat, seat_bets in enumerate(bets):
+                for color, payouts in seat_bets:
+                    reward += weights[bet_seat] * payouts[rank.get(color, len(payouts) - 1)]
+            return None, reward
+        return (board, dice, tiles, tickets, bets, next_seat), reward
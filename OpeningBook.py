@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from CompactBoard import CompactBoard
+from LegEnumerator import LegEnumerator
+from RaceTrack import RaceTrack
+
+
+class OpeningBook:
+    """
+    Precomputed exact first-leg statistics for every possible opening board.
+
+    TheGame.__init__ places the regular camels one by one, in OPENING_ORDER, on a
+    random tile from 1 to 3 and puts black and white on tile 15, with every die
+    unrolled. That gives 3 ** 5 = 243 opening boards. `build` enumerates each of
+    them with LegEnumerator and writes the results to a small binary table, and
+    `lookup` reads the matching record through `mmap`, so the first hint of a game
+    costs a few microseconds and almost no resident memory.
+
+    File layout (little-endian):
+        header: magic b"CUOB", format version (u16), number of boards (u16),
+                values per record (u16), track length (u16)
+        records: one per board, in `board_index` order, each holding
+                P(1st) and P(2nd) for REGULAR_COLORS followed by the expected
+                landings per tile, as float64
+    """
+
+    MAGIC = b"CUOB"
+    # Bump whenever the simulation rules change, so stale books are ignored
+    FORMAT_VERSION = 2
+    HEADER = struct.Struct("<4sHHHH")
+    OPENING_ORDER = ("blue", "green", "red", "yellow", "purple")
+    OPENING_TILES = (1, 2, 3)
+    CRAZY_TILE = 15
+    DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opening_book.bin")
+
+    def __init__(self, path: str = DEFAULT_PATH) -> None:
+        """
+        Open a book written by `build`.
+
+        Args:
+            path (str): Path to the book file.
+
+        Raises:
+            ValueError: If the file is not a book for the current rules.
+        """
+        self.path = path
+        self.track_length = RaceTrack().race_track_length
+        self._record_values = 2 * CompactBoard.N_REGULAR + self.track_length
+        self._record = struct.Struct(f"<{self._record_values}d")
+
+        with open(path, "rb") as book_file:
+            self._map = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, n_boards, values, track_length = self.HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            self._map.close()
+            raise ValueError(f"{path} is not an opening book for the current rules")
+        expected_size = self.HEADER.size + n_boards * self._record.size
+        if (
+            magic != self.MAGIC
+            or version != self.FORMAT_VERSION
+            or n_boards != self.n_boards()
+            or values != self._record_values
+            or track_length != self.track_length
+            or len(self._map) != expected_size
+        ):
+            self._map.close()
+            raise ValueError(f"{path} is not an opening book for the current rules")
+
+    @staticmethod
+    def n_boards() -> int:
+        """
+        Number of distinct opening boards (one record each).
+        """
+        return len(OpeningBook.OPENING_TILES) ** len(OpeningBook.OPENING_ORDER)
+
+    @staticmethod
+    def opening_board(index: int) -> List[Tuple[str, int]]:
+        """
+        Rebuild the camel placements TheGame.__init__ would use for a board index.
+
+        Args:
+            index (int): Board index, 0 <= index < n_boards().
+
+        Returns:
+            list[tuple[str, int]]: (color, tile_index) pairs in placement order.
+        """
+        camels: List[Tuple[str, int]] = []
+        for color in OpeningBook.OPENING_ORDER:
+            index, digit = divmod(index, len(OpeningBook.OPENING_TILES))
+            camels.append((color, OpeningBook.OPENING_TILES[digit]))
+        camels.append(("black", OpeningBook.CRAZY_TILE))
+        camels.append(("white", OpeningBook.CRAZY_TILE))
+        return camels
+
+    @staticmethod
+    def board_index(race_track_simulatable_list: List[Tuple], remaining_die: List[str]) -> Optional[int]:
+        """
+        Find the book index of a position, if it is an opening position.
+
+        Args:
+            race_track_simulatable_list: Output of RaceTrack.to_simulatable_list().
+            remaining_die: Colors of dice still in the pyramid.
+
+        Returns:
+            int | None: The board index, or None if the position is not in the book.
+        """
+        if sorted(remaining_die) != sorted(CompactBoard.COLORS):
+            return None
+
+        index = 0
+        for color in reversed(OpeningBook.OPENING_ORDER):
+            tile_idx = next((entry[1] for entry in race_track_simulatable_list if entry[0] == color), None)
+            if tile_idx not in OpeningBook.OPENING_TILES:
+                return None
+            index = index * len(OpeningBook.OPENING_TILES) + OpeningBook.OPENING_TILES.index(tile_idx)
+
+        # Same stacks, in the same order, as the opening board itself
+        expected = RaceTrack()
+        expected.set_up_camels(OpeningBook.opening_board(index))
+        if list(race_track_simulatable_list) != expected.to_simulatable_list():
+            return None
+        return index
+
+    def lookup(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+    ) -> Optional[Tuple[Dict[str, List[float]], List[float]]]:
+        """
+        Return the exact first-leg statistics for an opening position.
+
+        Args:
+            race_track_simulatable_list: Output of RaceTrack.to_simulatable_list().
+            remaining_die: Colors of dice still in the pyramid.
+
+        Returns:
+            (placement_counts, tile_placement) as probabilities, like
+            LegEnumerator.enumerate_leg, or None if the position is not in the book.
+        """
+        index = self.board_index(race_track_simulatable_list, remaining_die)
+        if index is None:
+            return None
+
+        values = self._record.unpack_from(self._map, self.HEADER.size + index * self._record.size)
+        n_regular = CompactBoard.N_REGULAR
+        placement_counts = {
+            color: [values[i], values[n_regular + i]]
+            for i, color in enumerate(CompactBoard.REGULAR_COLORS)
+        }
+        return placement_counts, list(values[2 * n_regular:])
+
+    def close(self) -> None:
+        """
+        Release the memory map.
+
+        Returns:
+            None
+        """
+        self._map.close()
+
+    @staticmethod
+    def build(path: str = DEFAULT_PATH) -> None:
+        """
+        Enumerate every opening board and write the book. Takes a few minutes.
+
+        Args:
+            path (str): Where to write the book.
+
+        Returns:
+            None
+        """
+        track_length = RaceTrack().race_track_length
+        n_values = 2 * CompactBoard.N_REGULAR + track_length
+        record = struct.Struct(f"<{n_values}d")
+        enumerator = LegEnumerator(track_length, retain_tree=False)
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as book_file:
+            book_file.write(
+                OpeningBook.HEADER.pack(
+                    OpeningBook.MAGIC, OpeningBook.FORMAT_VERSION, OpeningBook.n_boards(), n_values, track_length
+                )
+            )
+            for index in range(OpeningBook.n_boards()):
+                race_track = RaceTrack(track_length)
+                race_track.set_up_camels(OpeningBook.opening_board(index))
+                placement_counts, tile_placement = enumerator.enumerate_leg(
+                    race_track.to_simulatable_list(), list(CompactBoard.COLORS)
+                )
+                values = [placement_counts[color][0] for color in CompactBoard.REGULAR_COLORS]
+                values += [placement_counts[color][1] for color in CompactBoard.REGULAR_COLORS]
+                values += tile_placement
+                book_file.write(record.pack(*values))
+        os.replace(tmp_path, path)
+
+
+if __name__ == "__main__":
+    # Usage: python OpeningBook.py [output_path]
+    output_path = sys.argv[1] if len(sys.argv) > 1 else OpeningBook.DEFAULT_PATH
+    OpeningBook.build(output_path)
+    print(f"Wrote {OpeningBook.n_boards()} opening boards to {output_path}")
@@ -1,6 +1,9 @@
-import random
+from typing import Any
+
 import colorama
 
+from RandomSource import RandomSource
+
 
 class Pyramid:
     """
@@ -11,31 +14,48 @@ class Pyramid:
         unrolled_dice (list[str]): Dice colors that have not yet been rolled.
         rolled_dice (list[tuple[str, int]]): Dice that have been rolled
             in the current leg as (color, value).
+        rng (RandomSource): Source of the rolls.
     """
 
-    def __init__(self):
+    CRAZY_DICE = ("black", "white")
+
+    def __init__(self, rng: Any = None):
         """
         Initialize the pyramid with all dice unrolled.
+
+        Args:
+            rng: RandomSource, or anything it accepts (None for the global
+                `random` module, an int seed, a random.Random, a NumPy Generator).
         """
+        self.rng = RandomSource.coerce(rng)
         self.unrolled_dice_original = ("blue", "green", "yellow", "red", "purple", "black", "white")
         self.unrolled_dice = list(self.unrolled_dice_original)
         self.rolled_dice = []
 
     @staticmethod
-    def from_simulatable(unrolled_dice: list) -> "Pyramid":
+    def from_simulatable(
+        unrolled_dice: list,
+        rng: Any = None,
+        rolled_dice: list | None = None,
+    ) -> "Pyramid":
         """
         Construct a Pyramid from a list of unrolled dice colors.
 
         Args:
             unrolled_dice (list[str]): Colors of dice that are still unrolled.
+            rng: Source of the rolls; see __init__.
+            rolled_dice (list[tuple[str, int]] | None): Dice already rolled this
+                leg as (color, value), if known. The simulatable form only keeps
+                the unrolled colors, so by default none are recorded; which dice
+                were rolled, and their faces, cannot be recovered from it (a crazy
+                die takes its unrolled partner out too).
 
         Returns:
             Pyramid: A new Pyramid instance with the given unrolled dice.
         """
-        ret = Pyramid()
-        # Approximate rolled dice as those not in the provided unrolled list
-        ret.rolled_dice = list(set(ret.unrolled_dice) - set(unrolled_dice))
-        ret.unrolled_dice = unrolled_dice.copy()
+        ret = Pyramid(rng)
+        ret.rolled_dice = list(rolled_dice) if rolled_dice is not None else []
+        ret.unrolled_dice = list(unrolled_dice)
         return ret
 
     def to_simulatable(self) -> list:
@@ -64,36 +84,93 @@ class Pyramid:
                 - bool: True if this roll ends the leg; False otherwise.
         """
         if self.unrolled_dice:
-            rand_color = random.choice(self.unrolled_dice)
-            dice_roll = random.randint(1, 3)
-
-            # Track rolled dice for display
-            self.rolled_dice.append((rand_color, dice_roll))
-            self.unrolled_dice.remove(rand_color)
-
-            if rand_color not in {"black", "white"}:
-                # Regular camel roll
-                is_last = self.is_last_roll()
-                return rand_color, dice_roll, is_last
-
-            # Black/white "crazy" dice: move backwards (negative spaces)
-            if rand_color == "black":
-                # Once black is rolled, white can no longer appear
-                if "white" in self.unrolled_dice:
-                    self.unrolled_dice.remove("white")
-                # Even if this might be last roll logically, original code
-                # always returns False here, so we preserve that behavior.
-                return rand_color, -dice_roll, False
-            else:
-                # rand_color == "white"
-                if "black" in self.unrolled_dice:
-                    self.unrolled_dice.remove("black")
-                return "white", -dice_roll, False
+            rng = self.rng
+            return self._take_at(rng.randrange(len(self.unrolled_dice)), rng.randint(1, 3))
 
         # No dice left to roll – keep behavior consistent with original
         print("Error, no more dice left to roll")
         return "", -9999, True
 
+    def take(self, color: str, dice_roll: int) -> tuple[str, int, bool]:
+        """
+        Take a known die out of the pyramid, exactly as if roll() had drawn it.
+
+        Used to replay logged games.
+
+        Args:
+            color (str): Color of the die; must still be unrolled.
+            dice_roll (int): Face shown, 1 to 3.
+
+        Raises:
+            ValueError: If the die is not in the pyramid or the face is invalid.
+
+        Returns:
+            tuple[str, int, bool]: Same as roll().
+        """
+        if color not in self.unrolled_dice or dice_roll not in (1, 2, 3):
+            raise ValueError(f"cannot take die {color} {dice_roll} from the pyramid")
+        return self._take_at(self.unrolled_dice.index(color), dice_roll)
+
+    def _take_at(self, index: int, dice_roll: int) -> tuple[str, int, bool]:
+        """
+        Take the die at `index` of unrolled_dice; body of roll() and take().
+        """
+        color = self.unrolled_dice.pop(index)
+        # Track rolled dice for display
+        self.rolled_dice.append((color, dice_roll))
+
+        if color not in {"black", "white"}:
+            # Regular camel roll
+            is_last = self.is_last_roll()
+            return color, dice_roll, is_last
+
+        # Black/white "crazy" dice: move backwards (negative spaces)
+        if color == "black":
+            # Once black is rolled, white can no longer appear
+            if "white" in self.unrolled_dice:
+                self.unrolled_dice.remove("white")
+            # Even if this might be last roll logically, original code
+            # always returns False here, so we preserve that behavior.
+            return color, -dice_roll, False
+        else:
+            # color == "white"
+            if "black" in self.unrolled_dice:
+                self.unrolled_dice.remove("black")
+            return "white", -dice_roll, False
+
+    @staticmethod
+    def leg_moves(leg: list[tuple[str, int]]) -> list[tuple[str, int]]:
+        """
+        Apply the pyramid's rules to a leg drawn in bulk by RandomSource.legs.
+
+        Crazy camels move backwards, and once one crazy die is rolled the other
+        is no longer in the pyramid, exactly as in roll(). The leg ends with the
+        last regular die, like is_last_roll(): crazy dice drawn after it are
+        never rolled.
+
+        Args:
+            leg (list[tuple[str, int]]): (color, face) for every remaining die,
+                in rolling order.
+
+        Returns:
+            list[tuple[str, int]]: (color, spaces to move) for each die rolled.
+        """
+        moves = []
+        crazy_rolled = False
+        regular_left = sum(1 for color, _ in leg if color not in Pyramid.CRAZY_DICE)
+        for color, face in leg:
+            if not regular_left:
+                break
+            if color in Pyramid.CRAZY_DICE:
+                if crazy_rolled:
+                    continue
+                crazy_rolled = True
+                face = -face
+            else:
+                regular_left -= 1
+            moves.append((color, face))
+        return moves
+
     def is_last_roll(self) -> bool:
         """
         Check whether the last roll of the leg has been reached.
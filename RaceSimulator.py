@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from CompactBoard import CompactBoard
+from RandomSource import RandomSource
+
+
+class RaceSimulator:
+    """
+    Monte Carlo simulator for the rest of the whole race, not just the current leg.
+
+    Each simulation finishes the current leg from the given position (including
+    its spectator tiles), then plays fresh legs with a full pyramid and no tiles,
+    exactly like TheGame does after a leg ends. A simulation stops on the roll
+    where a regular camel crosses the finish line, so decided races cost nothing
+    extra.
+
+    Moves use CompactBoard, which keeps a full race about as cheap per roll as the
+    single-leg path.
+    """
+
+    MAX_LEGS = 50
+
+    def __init__(self, track_length: int = 16, seed: Optional[int] = None, rng: Any = None) -> None:
+        """
+        Args:
+            track_length (int): Number of tiles on the track.
+            seed (int | None): Seed for a private stream; overrides rng.
+            rng: Source of the rolls; anything RandomSource accepts.
+        """
+        self.track_length = track_length
+        self.rng = RandomSource(seed) if seed is not None else RandomSource.coerce(rng)
+
+    def simulate(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        amount_of_sims: int,
+    ) -> Tuple[Dict[str, float], Dict[str, float], float]:
+        """
+        Simulate `amount_of_sims` races to the finish.
+
+        Args:
+            race_track_simulatable_list: Output of RaceTrack.to_simulatable_list().
+            remaining_die: Colors of dice still in the pyramid this leg.
+            amount_of_sims: Number of races to simulate.
+
+        Returns:
+            A tuple:
+              - winner_probs: dict[color] -> probability of winning the race
+              - loser_probs: dict[color] -> probability of finishing last
+              - expected_legs: expected number of legs until the race ends,
+                counting the current leg as one
+        """
+        start_board = CompactBoard.from_simulatable(race_track_simulatable_list)
+        start_effects = CompactBoard.spectator_effects(race_track_simulatable_list, self.track_length)
+        start_dice = [CompactBoard.COLOR_INDEX[color] for color in remaining_die]
+        all_dice = list(range(len(CompactBoard.COLORS)))
+        n_regular = CompactBoard.N_REGULAR
+
+        winner_counts = [0] * n_regular
+        loser_counts = [0] * n_regular
+        total_legs = 0
+        finished = 0
+
+        rng = self.rng
+        move = CompactBoard.move
+        track_length = self.track_length
+
+        for _ in range(amount_of_sims):
+            board = start_board
+            dice = list(start_dice)
+            effects: Optional[Tuple[int, ...]] = start_effects
+            legs = 1
+            won = False
+
+            while not won and legs <= self.MAX_LEGS:
+                # A leg ends once every regular die has been rolled
+                while any(d < n_regular for d in dice):
+                    die = dice.pop(rng.randrange(len(dice)))
+                    face = rng.randint(1, 3)
+                    if die >= n_regular:
+                        # A crazy die takes its partner out of the pyramid
+                        dice = [d for d in dice if d < n_regular]
+                        face = -face
+                    board, _, _, crossed = move(board, die, face, effects, track_length)
+                    if crossed:
+                        won = True
+                        break
+                if won:
+                    break
+                # New leg: full pyramid, spectator tiles are returned
+                legs += 1
+                dice = list(all_dice)
+                effects = None
+
+            if not won:
+                continue
+            ranking = CompactBoard.ranking(board)
+            winner_counts[ranking[0]] += 1
+            loser_counts[ranking[-1]] += 1
+            total_legs += legs
+            finished += 1
+
+        denominator = float(finished) if finished else 1.0
+        winner_probs = {
+            color: winner_counts[i] / denominator for i, color in enumerate(CompactBoard.REGULAR_COLORS)
+        }
+        loser_probs = {
+            color: loser_counts[i] / denominator for i, color in enumerate(CompactBoard.REGULAR_COLORS)
+        }
+        return winner_probs, loser_probs, total_legs / denominator
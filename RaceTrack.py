@@ -17,10 +17,14 @@ class RaceTrack:
         spectator_tiles (dict[int, tuple[int, CamelPlayer]]): Maps tile index to
             (tile_type, owner), where tile_type is +1 or -1.
         has_camel_won (bool): True if any regular camel has crossed the finish line.
+        camel_index (dict[str, tuple[int, LinkedList.Node]]): Maps each camel color
+            to (tile_index, node). Kept up to date by set_up_camels and
+            location_update, so camels must be placed through those methods.
     """
 
     def __init__(self, track_length: int = 16):
         self.camel_and_tile_locations = [LinkedList() for _ in range(track_length)]
+        self.camel_index: dict[str, tuple[int, LinkedList.Node]] = {}
         self.race_track_length = track_length
         self.camel_colors: set[str] = set()
         self.won_camels: list[list[str]] = [[] for _ in range(3)]
@@ -32,18 +36,38 @@ class RaceTrack:
         Place camels (and initial crazy camels) on the track.
 
         Args:
-            camels (list[tuple[str, int]]): List of (color, tile_index) pairs.
-                Entries with color == "spectator" are skipped.
+            camels (list[tuple[str, int]]): List of (color, tile_index) pairs, as
+                from to_simulatable_list. Its ("spectator", tile_index, tile_type,
+                owner) entries are placed as spectator tiles.
 
         Returns:
             None
         """
-        for color, tile_idx in camels:
+        for entry in camels:
+            color, tile_idx = entry[0], entry[1]
             if color == "spectator":
+                self.spectator_tiles[tile_idx] = (entry[2], entry[3])
                 continue
-            self.camel_and_tile_locations[tile_idx].append((color,))
+            tile = self.camel_and_tile_locations[tile_idx]
+            tile.append((color,))
+            self.camel_index[color] = (tile_idx, tile.tail)
             self.camel_colors.add(color)
 
+    def _index_stack(self, tile_idx: int, node: LinkedList.Node | None) -> None:
+        """
+        Record that every camel from `node` upwards now sits on `tile_idx`.
+
+        Args:
+            tile_idx (int): Tile the stack was placed on.
+            node (LinkedList.Node | None): Bottom node of the moved stack.
+
+        Returns:
+            None
+        """
+        while node:
+            self.camel_index[node.data[0]] = (tile_idx, node)
+            node = node.next
+
     def find_camel(self, color: str) -> int | None:
         """
         Find the tile index where a camel of a given color is located.
@@ -54,13 +78,8 @@ class RaceTrack:
         Returns:
             int | None: Tile index if found, None otherwise.
         """
-        for idx, tile in enumerate(self.camel_and_tile_locations):
-            curr = tile.head
-            while curr:
-                if curr.data[0] == color:
-                    return idx
-                curr = curr.next
-        return None
+        entry = self.camel_index.get(color)
+        return entry[0] if entry else None
 
     def location_update(self, color: str, amount_moved: int) -> tuple[list[list[str]], bool, CamelPlayer | None, int | None]:
         """
@@ -120,6 +139,7 @@ class RaceTrack:
                 new_pos = len(self.camel_and_tile_locations) - 1
 
         self.camel_and_tile_locations[new_pos].add_stack_to_top(moving_stack)
+        self._index_stack(new_pos, moving_stack)
 
         # Spectator tile effect
         if new_pos in self.spectator_tiles:
@@ -140,11 +160,17 @@ class RaceTrack:
                 after_pos = min(new_pos + 1, len(self.camel_and_tile_locations) - 1)
                 stack_top = self.camel_and_tile_locations[new_pos].remove_stack_from_top(n_camels)
                 self.camel_and_tile_locations[after_pos].add_stack_to_top(stack_top)
+                self._index_stack(after_pos, stack_top)
             elif tile_type == -1:
                 # Move stack backward one tile
                 after_pos = max(new_pos - 1, 0)
                 stack_top = self.camel_and_tile_locations[new_pos].remove_stack_from_top(n_camels)
                 self.camel_and_tile_locations[after_pos].add_stack_to_bottom(stack_top)
+                # Only the moved camels change tile; the ones above keep their nodes
+                node = stack_top
+                for _ in range(n_camels):
+                    self.camel_index[node.data[0]] = (after_pos, node)
+                    node = node.next
 
         return self.won_camels, spectator_triggered, spectator_owner, spectator_index
 
@@ -207,7 +233,7 @@ class RaceTrack:
 
         # Start with tiles that have no camels
         for idx, camel_stack in enumerate(self.camel_and_tile_locations):
-            if len(camel_stack.to_list()) == 0:
+            if camel_stack.head is None:
                 ret.add(idx)
 
         # Remove tiles that are a spectator tile or adjacent to one
@@ -283,15 +309,18 @@ class RaceTrack:
                 - (tile_idx, stack_idx): tile index and position within stack
                   (0 = bottom), or None if not found.
         """
-        for tile_idx, tile in enumerate(self.camel_and_tile_locations):
-            curr = tile.head
-            stack_idx = 0
-            while curr:
-                if curr.data[0] == color:
-                    return tile_idx, stack_idx
-                curr = curr.next
-                stack_idx += 1
-        return None
+        entry = self.camel_index.get(color)
+        if entry is None:
+            return None
+
+        # Stacks hold at most seven camels, so this walk is bounded
+        tile_idx, target = entry
+        curr = self.camel_and_tile_locations[tile_idx].head
+        stack_idx = 0
+        while curr is not target:
+            curr = curr.next
+            stack_idx += 1
+        return tile_idx, stack_idx
 
     def get_camel_placements(self) -> tuple[str, ...]:
         """
@@ -332,11 +361,7 @@ class RaceTrack:
 if __name__ == "__main__":
     # Simple manual test of movement and printing.
     racetrack = RaceTrack()
-    racetrack.camel_and_tile_locations[0].append(("blue",))
-    racetrack.camel_and_tile_locations[0].append(("yellow",))
-    racetrack.camel_and_tile_locations[3].append(("green",))
-    racetrack.camel_and_tile_locations[0].append(("red",))
-    racetrack.camel_and_tile_locations[2].append(("purple",))
+    racetrack.set_up_camels([("blue", 0), ("yellow", 0), ("green", 3), ("red", 0), ("purple", 2)])
 
     print("Initial board:")
     racetrack.print_track()
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import random
+from typing import Any, Iterator, List, MutableSequence, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class RandomSource:
+    """
+    Pluggable random number source for the dice, the starting board and the AI.
+
+    Wraps one of:
+      - None: the global `random` module, so random.seed still controls a game
+        (the default everywhere, and the historical behaviour)
+      - an int: a private random.Random seeded with it
+      - a random.Random instance
+      - a NumPy Generator (np.random.default_rng(...)); NumPy is only needed
+        when one is passed in
+
+    Besides single draws, `legs` draws whole legs in bulk: a random order of the
+    remaining dice plus a face for every die, generated a block at a time (one
+    vectorised call per block with NumPy), so simulators do not pay for an RNG
+    call per roll.
+    """
+
+    # Legs drawn per block by `legs`
+    BLOCK_SIZE = 4096
+
+    def __init__(self, source: Any = None) -> None:
+        """
+        Args:
+            source: None, an int seed, a random.Random or a NumPy Generator.
+
+        Raises:
+            ValueError: For any other source.
+        """
+        self.source = source
+        self._generator = None
+        if source is None:
+            self._random = random
+        elif isinstance(source, bool):
+            raise ValueError(f"unsupported random source {source!r}")
+        elif isinstance(source, int):
+            self._random = random.Random(source)
+        elif isinstance(source, random.Random):
+            self._random = source
+        elif hasattr(source, "integers") and hasattr(source, "permuted"):
+            self._random = None
+            self._generator = source
+        else:
+            raise ValueError(f"unsupported random source {source!r}")
+
+    @staticmethod
+    def coerce(source: Any = None) -> "RandomSource":
+        """
+        Return `source` if it already is a RandomSource, else wrap it.
+
+        Args:
+            source: A RandomSource or anything RandomSource() accepts.
+
+        Returns:
+            RandomSource: The source to draw from.
+        """
+        return source if isinstance(source, RandomSource) else RandomSource(source)
+
+    @property
+    def generator(self):
+        """
+        The wrapped NumPy Generator, or None for Python sources.
+        """
+        return self._generator
+
+    def randrange(self, stop: int) -> int:
+        """
+        Uniform integer in [0, stop).
+        """
+        if self._generator is not None:
+            return int(self._generator.integers(stop))
+        return self._random.randrange(stop)
+
+    def randint(self, low: int, high: int) -> int:
+        """
+        Uniform integer in [low, high], like random.randint.
+        """
+        if self._generator is not None:
+            return int(self._generator.integers(low, high + 1))
+        return self._random.randint(low, high)
+
+    def choice(self, items: Sequence[T]) -> T:
+        """
+        Uniformly chosen element of a non-empty sequence.
+        """
+        return items[self.randrange(len(items))]
+
+    def shuffle(self, items: MutableSequence) -> None:
+        """
+        Shuffle a list in place.
+
+        Returns:
+            None
+        """
+        if self._generator is not None:
+            order = self._generator.permutation(len(items)).tolist()
+            items[:] = [items[i] for i in order]
+        else:
+            self._random.shuffle(items)
+
+    def getrandbits(self, bits: int) -> int:
+        """
+        Random non-negative integer with `bits` random bits, e.g. for child seeds.
+        """
+        if self._generator is not None:
+            n_bytes = (bits + 7) // 8
+            return int.from_bytes(self._generator.bytes(n_bytes), "little") >> (8 * n_bytes - bits)
+        return self._random.getrandbits(bits)
+
+    def spawn(self) -> "RandomSource":
+        """
+        Independent child source, e.g. so AI simulations never consume the dice
+        stream of a game.
+
+        The global `random` module has no children; its child is the module again.
+
+        Returns:
+            RandomSource: The child.
+        """
+        if self.source is None:
+            return RandomSource()
+        if self._generator is not None:
+            return RandomSource(self._generator.spawn(1)[0])
+        return RandomSource(self._random.getrandbits(64))
+
+    def legs(self, dice: Sequence[str], count: int) -> Iterator[List[Tuple[str, int]]]:
+        """
+        Draw `count` legs of dice in bulk.
+
+        Each leg is every die in `dice` in a uniformly random order, with a face
+        from 1 to 3 each. Rolling them in that order gives the same distribution
+        as rolling one random die at a time; see Pyramid.leg_moves for applying
+        the crazy camel rules to a drawn leg.
+
+        Args:
+            dice (Sequence[str]): Colors of the dice still in the pyramid.
+            count (int): Number of legs.
+
+        Returns:
+            Iterator[list[tuple[str, int]]]: (color, face) per die, per leg.
+        """
+        dice = list(dice)
+        n_dice = len(dice)
+        for start in range(0, count, self.BLOCK_SIZE):
+            block = min(self.BLOCK_SIZE, count - start)
+            if not n_dice:
+                yield from ([] for _ in range(block))
+            elif self._generator is not None:
+                # Imported lazily so Python sources do not depend on NumPy
+                import numpy as np
+
+                orders = self._generator.permuted(np.tile(np.arange(n_dice), (block, 1)), axis=1).tolist()
+                faces = self._generator.integers(1, 4, (block, n_dice)).tolist()
+                for order, leg_faces in zip(orders, faces):
+                    yield [(dice[i], face) for i, face in zip(order, leg_faces)]
+            else:
+                sample = self._random.sample
+                faces = self._random.choices((1, 2, 3), k=block * n_dice)
+                for leg in range(block):
+                    yield list(zip(sample(dice, n_dice), faces[leg * n_dice:(leg + 1) * n_dice]))
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from CompactBoard import CompactBoard
+
+
+class SimulationCache:
+    """
+    Bounded LRU cache (transposition table) of simulation results.
+
+    Results are keyed on a canonical encoding of the board so that the same
+    position always maps to the same entry, no matter how it was reached or how
+    the caller ordered its lists.
+
+    Attributes:
+        max_size (int): Maximum number of entries kept; 0 disables caching.
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that were not in the cache.
+        evictions (int): Number of entries dropped to respect max_size.
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    @staticmethod
+    def make_key(
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+    ) -> Tuple:
+        """
+        Build a canonical, hashable key for a board state.
+
+        Args:
+            race_track_simulatable_list: Output of RaceTrack.to_simulatable_list();
+                camels as (color, tile_index) from bottom to top of each tile and
+                spectator tiles as ("spectator", tile_index, tile_type, owner).
+            remaining_die: Colors of dice still in the pyramid.
+
+        Returns:
+            tuple: (CompactBoard encoding of the camel stacks, spectator tiles,
+            remaining dice). Spectator owners are dropped since they do not affect
+            the simulation.
+        """
+        spectators = sorted(
+            (entry[1], entry[2]) for entry in race_track_simulatable_list if entry[0] == "spectator"
+        )
+        return (
+            CompactBoard.from_simulatable(race_track_simulatable_list),
+            tuple(spectators),
+            tuple(sorted(remaining_die)),
+        )
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a key, marking it as most recently used.
+
+        Args:
+            key (Hashable): Key built with make_key (optionally extended).
+
+        Returns:
+            The cached value, or None if not present.
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries if needed.
+
+        Args:
+            key (Hashable): Key built with make_key (optionally extended).
+            value (Any): Result to store.
+
+        Returns:
+            None
+        """
+        if self.max_size <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drop all entries. Counters are kept.
+
+        Returns:
+            None
+        """
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache usage, for sizing max_size.
+
+        Returns:
+            dict[str, int]: hits, misses, evictions, size and max_size.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
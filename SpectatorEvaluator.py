@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from CompactBoard import CompactBoard
+from Pyramid import Pyramid
+from RandomSource import RandomSource
+
+
+class SpectatorEvaluator:
+    """
+    Scores every legal spectator tile placement, with both signs, from one set
+    of simulated legs.
+
+    Common random numbers: each leg's dice order and faces are drawn once and
+    replayed for every counterfactual, so the difference a tile makes is measured
+    on identical rolls. The replay is also cheap. Until a camel first lands on tile
+    t, a tile on t changes nothing. So each leg is played once without a new tile,
+    and only the legs where some camel lands on t are replayed, from that roll
+    onwards, for t = +1 and t = -1. Every other option reuses the baseline
+    outcome. A leg has at most six rolls, so each leg costs a handful of short
+    replays instead of 2 x (number of empty tiles) full ones.
+
+    Each option (tile, sign) gets:
+      - payout: expected coins the tile earns its owner this leg (1 per landing)
+      - bets: expected change in what the owner's open bets pay at the end of the
+        leg, against not placing the tile
+      - ev: payout + bets
+
+    Existing spectator tiles on the board are applied in every leg. Legs follow
+    the same rules as the Monte Carlo path in AIPlayer: they end with the last
+    regular die, or when a camel crosses the finish line.
+    """
+
+    SIGNS = (1, -1)
+
+    def __init__(self, track_length: int = 16, rng: Any = None) -> None:
+        """
+        Args:
+            track_length (int): Number of tiles on the track.
+            rng: Source of the legs; anything RandomSource accepts.
+        """
+        self.track_length = track_length
+        self.rng = RandomSource.coerce(rng)
+
+    def evaluate(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        empty_spaces: Iterable[int],
+        open_bets: Sequence[Tuple[str, Sequence[int]]] = (),
+        amount_of_sims: int = 1000,
+    ) -> Dict[Tuple[int, int], Dict[str, float]]:
+        """
+        Simulate `amount_of_sims` legs and score every (tile, sign) option.
+
+        Args:
+            race_track_simulatable_list: Output of RaceTrack.to_simulatable_list().
+            remaining_die: Colors of dice still in the pyramid.
+            empty_spaces: Tiles where a spectator tile may be placed
+                (RaceTrack.empty_spaces()).
+            open_bets: The placing player's bets as (color, payouts), where
+                payouts[i] is paid for finishing (i + 1)th, as in
+                BettingTicket.money_for_placements.
+            amount_of_sims: Number of legs to simulate.
+
+        Raises:
+            ValueError: If amount_of_sims is less than 1.
+
+        Returns:
+            dict[(tile, sign)] -> {"payout", "bets", "ev"} for every empty tile
+            and sign (+1 / -1).
+        """
+        if amount_of_sims < 1:
+            raise ValueError("amount_of_sims must be at least 1")
+        tiles = sorted(tile for tile in empty_spaces if 0 <= tile < self.track_length)
+        track_length = self.track_length
+        start_stacks, start_tiles = CompactBoard.to_stacks(
+            CompactBoard.from_simulatable(race_track_simulatable_list), track_length
+        )
+        base_effects = CompactBoard.spectator_effects(race_track_simulatable_list, track_length)
+        base_table = CompactBoard.move_table(base_effects, track_length)
+        option_effects = {}
+        for tile in tiles:
+            for sign in self.SIGNS:
+                effects = list(base_effects)
+                effects[tile] = sign
+                option_effects[(tile, sign)] = tuple(effects)
+        # Move tables per option, built the first time a leg needs one
+        option_tables: Dict[Tuple[int, int], List] = {}
+
+        # Payout of the open bets by COLORS index and placement (0 = 1st)
+        bet_table = [[0] * CompactBoard.N_REGULAR for _ in range(CompactBoard.N_REGULAR)]
+        for color, payouts in open_bets:
+            for place, payout in enumerate(payouts[:CompactBoard.N_REGULAR]):
+                bet_table[CompactBoard.COLOR_INDEX[color]][place] += payout
+
+        has_bets = any(any(row) for row in bet_table)
+
+        def bets_value(stacks: List[Tuple[int, ...]]) -> int:
+            if not has_bets:
+                return 0
+            return sum(bet_table[camel][place] for place, camel in enumerate(CompactBoard.stack_ranking(stacks)))
+
+        payout_sums = dict.fromkeys(option_effects, 0)
+        bet_delta_sums = dict.fromkeys(option_effects, 0)
+        move = CompactBoard.move_stacks
+        color_index = CompactBoard.COLOR_INDEX
+        missing = CompactBoard.MISSING
+        tile_set = set(tiles)
+
+        for leg in self.rng.legs(remaining_die, amount_of_sims):
+            moves = [(color_index[color], amount) for color, amount in Pyramid.leg_moves(leg)]
+
+            # Baseline leg, remembering the board before the first landing on each tile
+            stacks = start_stacks.copy()
+            camel_tiles = start_tiles.copy()
+            first_landing: Dict[int, Tuple[int, List[Tuple[int, ...]], List[int]]] = {}
+            for step, (camel, amount) in enumerate(moves):
+                if camel_tiles[camel] != missing:
+                    landed = base_table[camel][camel_tiles[camel]][amount + 3][0]
+                    if landed in tile_set and landed not in first_landing:
+                        first_landing[landed] = (step, stacks.copy(), camel_tiles.copy())
+                _, _, crossed = move(stacks, camel_tiles, camel, amount, base_table)
+                if crossed:
+                    break
+            if not first_landing:
+                continue
+            base_value = bets_value(stacks)
+
+            # Replay the rest of the leg for each tile that was landed on
+            for tile, (first_step, before_stacks, before_tiles) in first_landing.items():
+                for sign in self.SIGNS:
+                    option = (tile, sign)
+                    table = option_tables.get(option)
+                    if table is None:
+                        table = option_tables[option] = CompactBoard.move_table(option_effects[option], track_length)
+                    stacks = before_stacks.copy()
+                    camel_tiles = before_tiles.copy()
+                    triggers = 0
+                    for camel, amount in moves[first_step:]:
+                        landed, _, crossed = move(stacks, camel_tiles, camel, amount, table)
+                        if landed == tile:
+                            triggers += 1
+                        if crossed:
+                            break
+                    payout_sums[option] += triggers
+                    bet_delta_sums[option] += bets_value(stacks) - base_value
+
+        results: Dict[Tuple[int, int], Dict[str, float]] = {}
+        for option in option_effects:
+            payout = payout_sums[option] / amount_of_sims
+            bets = bet_delta_sums[option] / amount_of_sims
+            results[option] = {"payout": payout, "bets": bets, "ev": payout + bets}
+        return results
@@ -0,0 +1,319 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, TimeoutError
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from AIPlayer import AIPlayer
+from SimulationCache import SimulationCache
+
+
+class SpeculativeHinter:
+    """
+    Computes the AI's simulation for the current position in the background.
+
+    TheGame calls `speculate` as soon as a turn begins, so the simulation runs
+    while a human sits in input() (which releases the GIL). When a hint is needed,
+    `simulation` returns the speculative result if it is for the same position,
+    waits for it if it is still running, or computes it on demand otherwise.
+
+    `stream` serves AIPlayer.stream_hint's progressive updates the same way:
+    the batches run on the worker thread and are handed to the caller as they
+    arrive, until a deadline, and a speculative job for the same position is
+    waited for (up to the deadline) instead of being queued behind.
+
+    All simulations go through one worker thread, so the AIPlayer (its cache,
+    enumerator memo and seed stream) is never used from two threads at once. A
+    pending job for an outdated position is cancelled when a new one is
+    speculated; a job that has already started cannot be interrupted, but its
+    result still lands in the AIPlayer's cache.
+
+    An unseeded AIPlayer draws from its RandomSource. When that is the global
+    `random` module (the default), a background simulation interleaves its
+    draws with the game's own dice rolls. TheGame(rng=...) gives the AI a
+    stream of its own.
+
+    Attributes:
+        ai_player (AIPlayer): The AI whose simulations are run.
+        ready (int): Hints answered by a finished speculative job.
+        waited (int): Hints that waited for a running speculative job.
+        computed (int): Hints that had to start a new job.
+        cancelled (int): Speculative jobs dropped before they started.
+        late (int): Streams whose deadline passed before any update arrived.
+    """
+
+    def __init__(self, ai_player: AIPlayer) -> None:
+        self.ai_player = ai_player
+        self.ready = 0
+        self.waited = 0
+        self.computed = 0
+        self.cancelled = 0
+        self.late = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hint")
+        self._lock = threading.Lock()
+        self._key: Optional[Tuple] = None
+        self._future: Optional[Future] = None
+
+    @staticmethod
+    def simulate_state(
+        ai_player: AIPlayer,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        available_bets: Dict[str, int],
+    ) -> Tuple[Dict[str, List[float]], List[float], Dict[str, float], bool]:
+        """
+        Run the simulation a hint needs, adaptive or fixed-size per the AIPlayer.
+
+        Args:
+            ai_player (AIPlayer): The AI to simulate with.
+            race_track_simulatable_list: Output of RaceTrack.to_simulatable_list().
+            remaining_die: Colors of dice still in the pyramid.
+            available_bets: BettingTicketHolder.get_available_bets().
+
+        Returns:
+            (placement_counts, tile_placement, report, exact), where report is
+            the adaptive sampling report, or empty for fixed-size simulations,
+            and exact tells whether the counts are exact probabilities (see
+            AIPlayer.simulation_result).
+        """
+        if ai_player.tolerance is not None:
+            placement_counts, tile_placement, report = ai_player.run_adaptive_simulation(
+                race_track_simulatable_list, remaining_die, available_bets
+            )
+            return placement_counts, tile_placement, report, ai_player.mode == "exact"
+        placement_counts, tile_placement, exact = ai_player.simulation_result(
+            race_track_simulatable_list, remaining_die
+        )
+        return placement_counts, tile_placement, {}, exact
+
+    def state_key(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        available_bets: Dict[str, int],
+    ) -> Tuple:
+        """
+        Key of everything the simulation depends on.
+
+        Bets only matter to adaptive sampling, which stops on bet EVs.
+
+        Returns:
+            tuple: Hashable state key.
+        """
+        key = SimulationCache.make_key(race_track_simulatable_list, remaining_die)
+        if self.ai_player.tolerance is not None:
+            key += (tuple(sorted(available_bets.items())),)
+        return key
+
+    def speculate(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        available_bets: Dict[str, int],
+    ) -> None:
+        """
+        Start simulating a position in the background, replacing any older job.
+
+        Args:
+            race_track_simulatable_list: Output of RaceTrack.to_simulatable_list().
+            remaining_die: Colors of dice still in the pyramid (copied).
+            available_bets: BettingTicketHolder.get_available_bets().
+
+        Returns:
+            None
+        """
+        self._submit(race_track_simulatable_list, remaining_die, available_bets)
+
+    def simulation(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        available_bets: Dict[str, int],
+    ) -> Tuple[Dict[str, List[float]], List[float], Dict[str, float]]:
+        """
+        Return the simulation for a position, reusing speculative work if possible.
+
+        Args:
+            race_track_simulatable_list: Output of RaceTrack.to_simulatable_list().
+            remaining_die: Colors of dice still in the pyramid.
+            available_bets: BettingTicketHolder.get_available_bets().
+
+        Returns:
+            (placement_counts, tile_placement, report) from simulate_state, as
+            fresh copies the caller may mutate.
+        """
+        future = self._submit(race_track_simulatable_list, remaining_die, available_bets, on_demand=True)
+        try:
+            placement_counts, tile_placement, report, _ = future.result()
+        except CancelledError:
+            # Replaced by another thread's speculation in the meantime
+            placement_counts, tile_placement, report, _ = self._executor.submit(
+                self.simulate_state, self.ai_player, race_track_simulatable_list, list(remaining_die), available_bets
+            ).result()
+        return (
+            {color: list(counts) for color, counts in placement_counts.items()},
+            list(tile_placement),
+            dict(report),
+        )
+
+    def stream(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        available_bets: Dict[str, int],
+        empty_spaces: Set[int],
+        deadline: Optional[float] = None,
+    ) -> Iterator[Tuple[Dict[str, float], Dict[str, float], int]]:
+        """
+        Progressively refined hints for a position; see AIPlayer.stream_hint.
+
+        A speculative job for the same position is served as one update if it
+        finishes by the deadline; a second job would only queue behind it on
+        the worker thread. Otherwise a pending speculative job is replaced by
+        a streaming one.
+
+        The deadline is a hard cap: nothing is waited for past it, so the
+        stream may end without any update (counted in `late`), and the caller
+        falls back to its own estimate.
+
+        Args:
+            race_track_simulatable_list: Output of RaceTrack.to_simulatable_list().
+            remaining_die: Colors of dice still in the pyramid.
+            available_bets: BettingTicketHolder.get_available_bets().
+            empty_spaces: RaceTrack.empty_spaces().
+            deadline: time.perf_counter() value to stop at; None waits for the
+                whole simulation.
+
+        Returns:
+            Iterator of (evs, errors, samples), as from AIPlayer.stream_hint.
+        """
+        ai_player = self.ai_player
+        key = self.state_key(race_track_simulatable_list, remaining_die, available_bets)
+        with self._lock:
+            future = self._future if self._key == key else None
+            if future is not None and not future.cancelled():
+                if future.done():
+                    self.ready += 1
+                else:
+                    self.waited += 1
+            else:
+                if self._future is not None and self._future.cancel():
+                    self.cancelled += 1
+                self.computed += 1
+                future = None
+                # The finished stream leaves its result in the AIPlayer's cache, not here
+                self._key = None
+                self._future = None
+
+        if future is not None:
+            timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+            try:
+                placement_counts, tile_placement, _, exact = future.result(timeout=timeout)
+            except TimeoutError:
+                self.late += 1
+                return
+            except CancelledError:
+                # Closed before it started
+                return
+            evs = ai_player.display_stats(
+                placement_counts, tile_placement, available_bets, empty_spaces, remaining_die
+            )
+            if exact:
+                yield evs, {label: 0.0 for label in evs}, 0
+            else:
+                errors = ai_player.hint_errors(placement_counts, tile_placement, available_bets, empty_spaces)
+                yield evs, errors, int(sum(counts[0] for counts in placement_counts.values()))
+            return
+
+        updates: "queue.Queue[Optional[Tuple]]" = queue.Queue()
+        args = (list(race_track_simulatable_list), list(remaining_die), dict(available_bets), set(empty_spaces))
+
+        def run() -> None:
+            try:
+                for update in ai_player.stream_hint(*args, deadline=deadline):
+                    updates.put(update)
+            finally:
+                updates.put(None)
+
+        self._executor.submit(run)
+        first = True
+        while True:
+            try:
+                if deadline is None:
+                    update = updates.get()
+                else:
+                    update = updates.get(timeout=max(0.0, deadline - time.perf_counter()))
+            except queue.Empty:
+                if first:
+                    self.late += 1
+                return
+            if update is None:
+                return
+            first = False
+            yield update
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report how hints were served, for tuning.
+
+        Returns:
+            dict[str, int]: ready, waited, computed, cancelled and late.
+        """
+        return {
+            "ready": self.ready,
+            "waited": self.waited,
+            "computed": self.computed,
+            "cancelled": self.cancelled,
+            "late": self.late,
+        }
+
+    def close(self) -> None:
+        """
+        Drop pending work and stop the worker thread.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._future is not None and self._future.cancel():
+                self.cancelled += 1
+            self._future = None
+            self._key = None
+        self._executor.shutdown(wait=True)
+
+    def _submit(
+        self,
+        race_track_simulatable_list: List[Tuple],
+        remaining_die: List[str],
+        available_bets: Dict[str, int],
+        on_demand: bool = False,
+    ) -> Future:
+        """
+        Return the job for a position, starting one if the current job is for
+        another position.
+        """
+        key = self.state_key(race_track_simulatable_list, remaining_die, available_bets)
+        with self._lock:
+            if self._key == key and self._future is not None and not self._future.cancelled():
+                if on_demand:
+                    if self._future.done():
+                        self.ready += 1
+                    else:
+                        self.waited += 1
+                return self._future
+
+            if self._future is not None and self._future.cancel():
+                self.cancelled += 1
+            if on_demand:
+                self.computed += 1
+            self._key = key
+            self._future = self._executor.submit(
+                self.simulate_state,
+                self.ai_player,
+                list(race_track_simulatable_list),
+                list(remaining_die),
+                dict(available_bets),
+            )
+            return self._future
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import sys
+from typing import Dict, List, Optional, TextIO
+
+import colorama
+
+from CamelPlayer import CamelPlayer
+from Pyramid import Pyramid
+from RaceTrack import RaceTrack
+
+
+_RESET = colorama.Style.RESET_ALL
+_FORE = {
+    "blue": colorama.Fore.LIGHTBLUE_EX,
+    "green": colorama.Fore.LIGHTGREEN_EX,
+    "red": colorama.Fore.LIGHTRED_EX,
+    "yellow": colorama.Fore.LIGHTYELLOW_EX,
+    "purple": colorama.Fore.LIGHTMAGENTA_EX,
+    "black": colorama.Fore.LIGHTBLACK_EX,
+    "white": colorama.Fore.LIGHTWHITE_EX,
+}
+_BACK = {
+    "blue": colorama.Back.LIGHTBLUE_EX,
+    "green": colorama.Back.LIGHTGREEN_EX,
+    "red": colorama.Back.LIGHTRED_EX,
+    "yellow": colorama.Back.LIGHTYELLOW_EX,
+    "purple": colorama.Back.LIGHTMAGENTA_EX,
+}
+_DICE_FACES = {1: "⚀ ", 2: "⚁ ", 3: "⚂ ", -1: "⚀ ", -2: "⚁ ", -3: "⚂ "}
+
+
+class TerminalRenderer:
+    """
+    Incremental ANSI renderer for the game screen.
+
+    The screen is cleared with escape codes instead of a `cls` subprocess, and
+    each frame only rewrites the lines that differ from the previous frame, so a
+    turn sends a few hundred bytes instead of the whole board. Lines left over
+    from a longer previous frame, and whatever the player typed below the frame,
+    are erased in the same write.
+
+    All colored glyphs (camels, spectator tiles, dice, bet tickets) are built once
+    per class, so composing a frame is plain lookups and joins.
+
+    Anything that clears the screen outside a renderer must call clear_screen(),
+    which makes every renderer redraw its next frame in full.
+    """
+
+    CLEAR = "\x1b[2J\x1b[H"
+    ERASE_LINE = "\x1b[K"
+    ERASE_BELOW = "\x1b[J"
+
+    BET_COLORS = ("blue", "green", "red", "yellow", "purple")
+
+    CAMEL_GLYPHS: Dict[str, str] = {color: fore + "C" + _RESET for color, fore in _FORE.items()}
+    SPECTATOR_GLYPHS: Dict[int, str] = {
+        1: colorama.Fore.LIGHTGREEN_EX + "+" + _RESET,
+        -1: colorama.Fore.LIGHTRED_EX + "-" + _RESET,
+    }
+    ROLLED_GLYPHS: Dict[tuple, str] = {
+        (color, value): fore + face + _RESET
+        for color, fore in _FORE.items()
+        for value, face in _DICE_FACES.items()
+    }
+    UNROLLED_GLYPHS: Dict[str, str] = {color: fore + "☐ " + _RESET + " " for color, fore in _FORE.items()}
+    BET_PREFIX: Dict[str, str] = {color: back for color, back in _BACK.items()}
+
+    # Bumped by clear_screen so every renderer knows its last frame is gone
+    _screen_epoch = 0
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """
+        Args:
+            stream (TextIO | None): Where frames are written. Defaults to the
+                current sys.stdout at write time.
+        """
+        self.stream = stream
+        self._last_frame: Optional[List[str]] = None
+        self._epoch = TerminalRenderer._screen_epoch
+        # Lets Windows consoles interpret the escape codes
+        colorama.just_fix_windows_console()
+
+    @staticmethod
+    def clear_screen(stream: Optional[TextIO] = None) -> None:
+        """
+        Clear the terminal and force every renderer to redraw in full.
+
+        Args:
+            stream (TextIO | None): Defaults to sys.stdout.
+
+        Returns:
+            None
+        """
+        stream = stream or sys.stdout
+        stream.write(TerminalRenderer.CLEAR)
+        stream.flush()
+        TerminalRenderer._screen_epoch += 1
+
+    def invalidate(self) -> None:
+        """
+        Forget the last frame, so the next one is drawn on a cleared screen.
+
+        Returns:
+            None
+        """
+        self._last_frame = None
+
+    def render(self, frame: str) -> str:
+        """
+        Draw a frame, rewriting only the lines that changed since the last one.
+
+        The cursor is left on the line just below the frame, ready for input.
+
+        Args:
+            frame (str): Full screen contents; lines separated by "\\n".
+
+        Returns:
+            str: The exact text written to the stream.
+        """
+        lines = frame.split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()
+
+        previous = self._last_frame
+        parts: List[str] = []
+        if previous is None or self._epoch != TerminalRenderer._screen_epoch:
+            parts.append(self.CLEAR)
+            previous = []
+            self._epoch = TerminalRenderer._screen_epoch
+
+        for row, line in enumerate(lines):
+            if row >= len(previous) or previous[row] != line:
+                parts.append(f"\x1b[{row + 1};1H{line}{self.ERASE_LINE}")
+        # Park the cursor below the frame and erase stale lines and typed input
+        parts.append(f"\x1b[{len(lines) + 1};1H{self.ERASE_BELOW}")
+
+        output = "".join(parts)
+        stream = self.stream or sys.stdout
+        stream.write(output)
+        stream.flush()
+        self._last_frame = lines
+        return output
+
+    def bets_line(self, available_bets: Dict[str, int]) -> str:
+        """
+        Colorized top payout per camel color, as in the game header.
+
+        Args:
+            available_bets (dict[str, int]): BettingTicketHolder.get_available_bets().
+
+        Returns:
+            str: The bets line.
+        """
+        prefix = self.BET_PREFIX
+        return (
+            "Available bets:"
+            + colorama.Fore.BLACK
+            + "".join(prefix[color] + str(available_bets[color]) for color in self.BET_COLORS)
+            + _RESET
+        )
+
+    def pyramid_line(self, pyramid: Pyramid) -> str:
+        """
+        Colorized rolled and unrolled dice, matching Pyramid.to_printable.
+
+        Args:
+            pyramid (Pyramid): The game's pyramid.
+
+        Returns:
+            str: The dice line.
+        """
+        rolled = self.ROLLED_GLYPHS
+        unrolled = self.UNROLLED_GLYPHS
+        return (
+            "Rolled: "
+            + "".join(rolled[die] for die in pyramid.rolled_dice)
+            + " Unrolled: "
+            + "".join(unrolled[color] for color in pyramid.unrolled_dice)
+        )
+
+    def board_lines(self, race_track: RaceTrack) -> List[str]:
+        """
+        The framed track, top row first, matching RaceTrack.to_rotated_list.
+
+        Args:
+            race_track (RaceTrack): The game's track.
+
+        Returns:
+            list[str]: One line per screen row.
+        """
+        length = race_track.race_track_length
+        # 7 rows is enough to represent max stack + spectator row
+        grid = [[" "] * length for _ in range(7)]
+        camels = self.CAMEL_GLYPHS
+        for column, camel_stack in enumerate(race_track.camel_and_tile_locations):
+            node = camel_stack.head
+            row = 0
+            while node is not None:
+                grid[row][column] = camels[node.data[0]]
+                node = node.next
+                row += 1
+        for tile, (tile_type, _) in race_track.spectator_tiles.items():
+            grid[0][tile] = self.SPECTATOR_GLYPHS[tile_type]
+
+        lines = ["+Start+" + "-" * (length * 2 - 1) + "+Finish+"]
+        lines.extend("|     |" + "_".join(row) + "|      |" for row in reversed(grid))
+        lines.append("+Start+0-1-2-3-4-5-6-7-8-9-0-1-2-3-4-5+Finish+")
+        return lines
+
+    def state_lines(
+        self,
+        available_bets: Dict[str, int],
+        pyramid: Pyramid,
+        race_track: RaceTrack,
+        players: List[CamelPlayer],
+    ) -> List[str]:
+        """
+        Every line of the game state: bets and dice, the board, then player money.
+
+        Args:
+            available_bets (dict[str, int]): Top payout per color.
+            pyramid (Pyramid): The game's pyramid.
+            race_track (RaceTrack): The game's track.
+            players (list[CamelPlayer]): All players, in seating order.
+
+        Returns:
+            list[str]: The lines, without trailing newlines.
+        """
+        lines = [f"{self.bets_line(available_bets)}            {self.pyramid_line(pyramid)}"]
+        lines.extend(self.board_lines(race_track))
+        lines.extend(f"{player.name} has {player.amount_of_money} coin(s)" for player in players)
+        return lines
@@ -1,16 +1,26 @@
-import os
+import argparse
 import re
-import random
+import time
+from typing import TYPE_CHECKING, Any, Iterator
 
 import colorama
 
 from AIPlayer import AIPlayer
 from BettingTicketHolder import BettingTicketHolder
 from CamelPlayer import CamelPlayer
+from ExpectimaxPlayer import ExpectimaxPlayer
+from Instrumentation import Instrumentation
+from MCTSPlayer import MCTSPlayer
 from Pyramid import Pyramid
 from RaceTrack import RaceTrack
+from RandomSource import RandomSource
+from SpeculativeHinter import SpeculativeHinter
+from TerminalRenderer import TerminalRenderer
 import subprocess
 
+if TYPE_CHECKING:
+    from EventLog import EventLog
+
 colorama.just_fix_windows_console()
 
 
@@ -20,7 +30,11 @@ class TheGame:
     """
 
     @staticmethod
-    def get_input_force(repeat_question: str, is_valid_reply_function) -> str:
+    def get_input_force(
+        repeat_question: str,
+        is_valid_reply_function,
+        renderer: TerminalRenderer | None = None,
+    ) -> str:
         """
         Repeatedly prompt the user until a valid reply is provided.
 
@@ -28,30 +42,72 @@ class TheGame:
             repeat_question (str): The question or prompt to display.
             is_valid_reply_function (Callable[[str], bool]): Function that returns
                 True if the input is acceptable, False otherwise.
+            renderer (TerminalRenderer | None): Draw the question as a frame, so
+                only changed lines are redrawn. Without one the question is printed
+                and the screen is cleared before asking again.
 
         Returns:
             str: A validated user input string.
         """
-        print(repeat_question)
+        if renderer:
+            renderer.render(repeat_question)
+        else:
+            print(repeat_question)
         console_input = re.sub(r"[() \n]+", "", input().lower().strip())
         while not is_valid_reply_function(console_input):
-            os.system("cls")
-            print(repeat_question)
+            if renderer:
+                # Same frame again: only the rejected input below it is erased
+                renderer.render(repeat_question)
+            else:
+                TerminalRenderer.clear_screen()
+                print(repeat_question)
             console_input = input().lower().strip()
         return console_input
 
-    def __init__(self):
+    def __init__(
+        self,
+        instrumentation: Instrumentation | None = None,
+        instrumentation_output: str = "camelup_instrumentation",
+        event_log: "EventLog | None" = None,
+        rng: Any = None,
+        lookahead: ExpectimaxPlayer | MCTSPlayer | None = None,
+        workers: int = 1,
+    ):
         """
         Initialize a new game: pyramid, betting tickets, racetrack, and AI.
+
+        Args:
+            instrumentation (Instrumentation | None): Records per-phase timings
+                ("game.*" and "ai.*") when enabled. Disabled by default.
+            instrumentation_output (str): Path prefix for the report written at
+                the end of the game (<prefix>.json and, when profiling, <prefix>.prof).
+            event_log (EventLog | None): Append every turn of start_game to this log.
+            rng: Source of the dice, starting board and turn order: a RandomSource,
+                an int seed, a random.Random or a NumPy Generator. The default is
+                the global `random` module. The AI simulates with a child stream
+                of it, so hints never change the dice of a seeded game.
+            lookahead (ExpectimaxPlayer | MCTSPlayer | None): Search a few turns
+                ahead to choose AI moves instead of playing the best one-turn EV.
+                Hints shown to humans are unchanged.
+            workers (int): Processes the AI simulates with. Above 1, start_game
+                starts the pool once and it serves every hint of the game.
+
+        Raises:
+            ValueError: If workers is less than 1.
         """
-        self.pyramid = Pyramid()
+        self.instrumentation = instrumentation or Instrumentation()
+        self.instrumentation_output = instrumentation_output
+        self.event_log = event_log
+        self.rng = RandomSource.coerce(rng)
+        self.pyramid = Pyramid(self.rng)
         self.betting_tents = BettingTicketHolder()
         self.race_track = RaceTrack()
+        self.renderer = TerminalRenderer()
 
         # Random initial positions for regular camels
         temp: list[tuple[str, int]] = []
         for color in ["blue", "green", "red", "yellow", "purple"]:
-            temp.append((color, random.randint(1, 3)))
+            temp.append((color, self.rng.randint(1, 3)))
 
         # Place crazy camels at tile 15 by default
         temp.append(("black", 15))
@@ -60,7 +116,14 @@ class TheGame:
         self.race_track.set_up_camels(temp)
         self.players: list[CamelPlayer] = []
         self.all_players: list[CamelPlayer] = []
-        self.ai_player = AIPlayer()
+        self.ai_player = AIPlayer(workers=workers, instrumentation=self.instrumentation, rng=self.rng.spawn())
+        self.lookahead = lookahead
+        # Hard cap on the AI's own hint, in milliseconds; None waits for the full hint
+        self.ai_hint_ms: float | None = None
+        # Samples used / achieved error of the last adaptive hint, if any
+        self.last_hint_report: dict[str, float] = {}
+        # Background hint worker; started by start_game for interactive games
+        self.hinter: SpeculativeHinter | None = None
 
     def payout_bets(self, players: list[CamelPlayer], camel_ordering: tuple[str, ...]) -> None:
         """
@@ -82,21 +145,7 @@ class TheGame:
         Returns:
             str: Human-readable representation of the top bet value for each color.
         """
-        available_bets = self.betting_tents.get_available_bets()
-        clr_bck = {
-            "blue": colorama.Back.LIGHTBLUE_EX,
-            "green": colorama.Back.LIGHTGREEN_EX,
-            "red": colorama.Back.LIGHTRED_EX,
-            "yellow": colorama.Back.LIGHTYELLOW_EX,
-            "purple": colorama.Back.LIGHTMAGENTA_EX,
-        }
-
-        tent_str_rep = "Available bets:" + colorama.Fore.BLACK
-        for ticket_color in ["blue", "green", "red", "yellow", "purple"]:
-            tent_str_rep += clr_bck[ticket_color] + str(available_bets[ticket_color])
-
-        tent_str_rep += colorama.Style.RESET_ALL
-        return tent_str_rep
+        return self.renderer.bets_line(self.betting_tents.get_available_bets())
 
     def get_game_state_str(self) -> str:
         """
@@ -106,20 +155,10 @@ class TheGame:
         Returns:
             str: A multi-line string representing the game state.
         """
-        ret = ""
-        ret += f"{self.get_bets_available_string()}            {self.pyramid.to_printable()}\n"
-
-        board_rows = self.race_track.to_rotated_list()
-        ret += "+Start+" + "-" * (self.race_track.race_track_length * 2 - 1) + "+Finish+\n"
-        board_rows.reverse()
-        for row in board_rows:
-            ret += "|     |" + "_".join(row) + "|      |\n"
-        ret += "+Start+0-1-2-3-4-5-6-7-8-9-0-1-2-3-4-5+Finish+\n"
-
-        for player in self.all_players:
-            ret += f"{player.name} has {player.amount_of_money} coin(s)\n"
-
-        return ret
+        lines = self.renderer.state_lines(
+            self.betting_tents.get_available_bets(), self.pyramid, self.race_track, self.all_players
+        )
+        return "\n".join(lines) + "\n"
 
     def prompt_player_input(self, player: CamelPlayer, extra_text: str, extra_text_2: str) -> str:
         """
@@ -133,22 +172,24 @@ class TheGame:
         Returns:
             str: Player's choice ("1", "2", "3", or "4").
         """
-        full_prompt = (
-            self.get_game_state_str()
-            + extra_text
-            + "\n"
-            + extra_text_2
-            + f"\n{player.name}'s turn\n"
-              "Choose an action:\n"
-              "1. Roll dice\n"
-              "2. Place a bet\n"
-              "3. Place spectator tile\n"
-              "4. Ask for a hint\n"
-              "Enter 1, 2, 3, or 4:"
-        )
-        return self.get_input_force(full_prompt, lambda reply: reply in {"1", "2", "3", "4"})
+        with self.instrumentation.phase("game.render"):
+            full_prompt = (
+                self.get_game_state_str()
+                + extra_text
+                + "\n"
+                + extra_text_2
+                + f"\n{player.name}'s turn\n"
+                  "Choose an action:\n"
+                  "1. Roll dice\n"
+                  "2. Place a bet\n"
+                  "3. Place spectator tile\n"
+                  "4. Ask for a hint\n"
+                  "Enter 1, 2, 3, or 4:"
+            )
+        with self.instrumentation.phase("game.input_wait"):
+            return self.get_input_force(full_prompt, lambda reply: reply in {"1", "2", "3", "4"}, self.renderer)
 
-    def roll_dice(self, player: CamelPlayer) -> tuple[bool, str]:
+    def roll_dice(self, player: CamelPlayer, die: tuple[str, int] | None = None) -> tuple[bool, str]:
         """
         Roll a die from the pyramid and move the corresponding camel.
 
@@ -156,13 +197,20 @@ class TheGame:
 
         Args:
             player (CamelPlayer): The player who rolled the die.
+            die (tuple[str, int] | None): (color, face) to take instead of rolling,
+                to replay a logged roll.
 
         Returns:
             tuple[bool, str]:
                 - has_leg_ended (bool): True if the leg ended after this roll.
                 - msg (str): Human-readable summary of the roll.
         """
-        returned_dice_color, amount, has_leg_ended = self.pyramid.roll()
+        if die is None:
+            returned_dice_color, amount, has_leg_ended = self.pyramid.roll()
+        else:
+            returned_dice_color, amount, has_leg_ended = self.pyramid.take(*die)
+        if self.event_log is not None and returned_dice_color:
+            self.event_log.roll(self, player, returned_dice_color, abs(amount))
 
         if returned_dice_color not in {"black", "white"}:
             player.amount_of_money += 1
@@ -175,30 +223,127 @@ class TheGame:
                 "(No such camel on the racetrack, skipping move.)\n",
             )
 
+        msg = f"Rolled {returned_dice_color} camel: moves {amount} spaces.\n"
         _, triggered, owner, tile_idx = self.race_track.location_update(returned_dice_color, amount)
         if triggered and owner:
             owner.amount_of_money += 1
-            print(
+            msg += (
                 f"{owner.name} gains 1 coin for a camel landing on their spectator "
-                f"tile at tile {tile_idx}!"
+                f"tile at tile {tile_idx}!\n"
             )
 
-        return has_leg_ended, f"Rolled {returned_dice_color} camel: moves {amount} spaces.\n"
+        return has_leg_ended, msg
 
-    def get_hint(self) -> dict[str, float]:
+    def get_hint(self, player: CamelPlayer | None = None, deadline: float | None = None) -> dict[str, float]:
         """
         Use the AIPlayer to run simulations and compute suggested EVs.
 
+        Args:
+            player (CamelPlayer | None): Player the hint is for; spectator tiles
+                are also scored by their effect on this player's open bets.
+            deadline (float | None): time.perf_counter() value by which to
+                answer; the best estimate from stream_hint by then is returned
+                (only "roll" if none arrived in time). None waits for the full hint.
+
         Returns:
             dict[str, float]: Mapping of actions/colors to expected values:
                 - "<color>" for race bets
-                - "spt_<index>" for spectator tile placement at a tile
+                - "spt_<index>+" / "spt_<index>-" for a positive / negative
+                  spectator tile at each legal tile (the better sign only)
                 - "roll" for rolling.
         """
-        camel_placements, most_visited_tiles = self.ai_player.run_simulation(
-            self.race_track.to_simulatable_list(),
-            self.pyramid.to_simulatable(),
-        )
+        with self.instrumentation.phase("game.hint"):
+            if deadline is None:
+                return self._compute_hint(player)
+            evs = None
+            for evs, _, _ in self.stream_hint(player, deadline):
+                pass
+            if evs is None:
+                # Nothing arrived in time; rolling's EV needs no simulation
+                self.instrumentation.count("game.hint_timeouts")
+                evs = {"roll": self.ai_player.roll_ev(self.pyramid.to_simulatable())}
+            return evs
+
+    def stream_hint(
+        self,
+        player: CamelPlayer | None = None,
+        deadline: float | None = None,
+    ) -> Iterator[tuple[dict[str, float], dict[str, float], int]]:
+        """
+        Progressively refined hints, for live display or a hard latency cap.
+
+        Yields display_stats-style EVs after every batch of simulated legs
+        (see AIPlayer.stream_hint), through the SpeculativeHinter when one is
+        running. Without a deadline, a last update rescores the spectator
+        tiles like get_hint; with one, the spectator tiles keep display_stats'
+        single suggestion, since rescoring could overrun it.
+
+        Args:
+            player (CamelPlayer | None): Player the hint is for.
+            deadline (float | None): time.perf_counter() value to stop at.
+
+        Returns:
+            Iterator of (evs, errors, samples): EV per label, confidence
+            half-width per label (labels without one are missing), and legs
+            simulated so far.
+        """
+        race_track_list = self.race_track.to_simulatable_list()
+        remaining_die = list(self.pyramid.to_simulatable())
+        available_bets = self.betting_tents.get_available_bets()
+        empty_spaces = self.race_track.empty_spaces()
+        if self.hinter is not None:
+            updates = self.hinter.stream(race_track_list, remaining_die, available_bets, empty_spaces, deadline)
+        else:
+            updates = self.ai_player.stream_hint(race_track_list, remaining_die, available_bets, empty_spaces, deadline)
+
+        last = None
+        for last in updates:
+            yield last
+        if last is None or deadline is not None:
+            return
+        evs, errors, samples = last
+        open_bets = [(bet.color, tuple(bet.money_for_placements)) for bet in player.bets] if player else []
+        evs = self.ai_player.score_spectator_tiles(evs, race_track_list, remaining_die, empty_spaces, open_bets)
+        yield evs, {label: error for label, error in errors.items() if not label.startswith("spt_")}, samples
+
+    def show_live_hint(self, player: CamelPlayer) -> dict[str, float]:
+        """
+        Redraw the hint after every update of stream_hint until it is final.
+
+        Args:
+            player (CamelPlayer): Player the hint is for.
+
+        Returns:
+            dict[str, float]: The final hint, as from get_hint.
+        """
+        evs: dict[str, float] = {}
+        for evs, errors, samples in self.stream_hint(player):
+            lines = [f"Hint for {player.name} ({samples} simulated legs):"]
+            for label, ev in sorted(evs.items(), key=lambda item: -item[1]):
+                error = errors.get(label)
+                lines.append(f"  {label}: {ev:.2f}" + (f" +/- {error:.2f}" if error else ""))
+            self.renderer.render(self.get_game_state_str() + "\n".join(lines) + "\n")
+        return evs
+
+    def _compute_hint(self, player: CamelPlayer | None = None) -> dict[str, float]:
+        """
+        Body of get_hint, timed there as the "game.hint" phase.
+        """
+        race_track_list = self.race_track.to_simulatable_list()
+        remaining_die = list(self.pyramid.to_simulatable())
+        available_bets = self.betting_tents.get_available_bets()
+        if self.hinter is not None:
+            # Usually already simulated in the background since the turn began
+            camel_placements, most_visited_tiles, report = self.hinter.simulation(
+                race_track_list, remaining_die, available_bets
+            )
+        else:
+            camel_placements, most_visited_tiles, report, _ = SpeculativeHinter.simulate_state(
+                self.ai_player, race_track_list, remaining_die, available_bets
+            )
+        if self.ai_player.tolerance is not None:
+            # Adaptive sampling: samples used and achieved precision
+            self.last_hint_report = report
         best_hints = self.ai_player.display_stats(
             camel_placements,
             most_visited_tiles,
@@ -206,7 +351,10 @@ class TheGame:
             self.race_track.empty_spaces(),
             self.pyramid.to_simulatable(),
         )
-        return best_hints
+        open_bets = [(bet.color, tuple(bet.money_for_placements)) for bet in player.bets] if player else []
+        return self.ai_player.score_spectator_tiles(
+            best_hints, race_track_list, remaining_die, self.race_track.empty_spaces(), open_bets
+        )
 
     def start_game(self, num_players: int = 2) -> None:
         """
@@ -230,118 +378,50 @@ class TheGame:
         self.players = [CamelPlayer(name) for name in player_names]
         self.all_players = self.players.copy()
 
+        self.instrumentation.begin()
         try:
-            subprocess.run(["java", "AvatarScreen", *player_names], check=False)
+            with self.instrumentation.phase("game.avatar_launch"):
+                subprocess.run(["java", "AvatarScreen", *player_names], check=False)
         except FileNotFoundError:
         # Java or AvatarScreen not available; fail silently
             pass
 
+        # Pay the AI's worker start-up cost once, before the first hint
+        self.ai_player.start_pool()
+        self.hinter = SpeculativeHinter(self.ai_player)
+
         # Shuffle turn order
-        random.shuffle(self.players)
+        self.rng.shuffle(self.players)
+        if self.event_log is not None:
+            self.event_log.begin(self)
         extra_text = "\nPlayer order:\n"
         for idx, player in enumerate(self.players):
             extra_text += f"{idx + 1}. {player.name}\n"
 
         # Main game loop
         while True:
+            if self.event_log is not None:
+                # Checkpoint the first turn of each leg, while everyone is in line
+                self.event_log.turn_started(self)
             cur_player = self.players.pop(0)
-            os.system("cls")
-
-            player_bets_str = self.betting_tents.get_player_bets_str(self.all_players)
-            max_color = ""
-            max_ev = -1.0
-            max_tile_pos = -1  # Only used for spectator tile placement
+            # Simulate this position while the player thinks
+            self.speculate_hint()
 
             if cur_player.is_ai:
                 # AI chooses the action based on EV
-                evs = self.get_hint()
-                for col, ev in evs.items():
-                    if "spt_" in col:
-                        max_tile_pos = int(col[4:])
-                    if ev > max_ev:
-                        max_ev = ev
-                        max_color = col
-
-                # Map best EV label to an action choice
-                if max_color == "roll":
-                    player_input = "1"
-                elif "spt_" in max_color:
-                    player_input = "3"
-                else:
-                    player_input = "2"
+                with self.instrumentation.phase("game.action"):
+                    has_used_turn, extra_text = self.play_ai_turn(cur_player)
             else:
+                with self.instrumentation.phase("game.render"):
+                    player_bets_str = self.betting_tents.get_player_bets_str(self.all_players)
                 player_input = self.prompt_player_input(cur_player, extra_text, player_bets_str)
+                with self.instrumentation.phase("game.action"):
+                    has_used_turn, extra_text = self.play_human_turn(cur_player, player_input)
+            self.instrumentation.count("game.turns")
 
-            has_used_turn = False
-            extra_text = ""  # Reset per turn
-
-            if player_input == "1":
-                # Roll dice
-                has_used_turn = True
-                has_leg_ended, extra_text = self.roll_dice(cur_player)
-                if has_leg_ended:
-                    extra_text += "The leg has ended.\n"
-                    self.payout_bets(self.players, self.race_track.get_camel_placements())
-                    self.pyramid.reset()
-                    self.race_track.spectator_tiles = {}
-
-                if self.race_track.has_camel_won:
-                    self.show_winner_screen()
-                    break
-
-            elif player_input == "2":
-                # Place a bet
-                color_bet_on = max_color  # Default for AI
-                if not cur_player.is_ai:
-                    color_bet_on = TheGame.get_input_force(
-                        "Which camel color would you like to take out a bet on? \n"
-                        "(b)lue (g)reen (r)ed (y)ellow (p)urple (c)ancel\n"
-                        + self.get_bets_available_string()
-                        + "\n",
-                        lambda reply: reply
-                        in {
-                            "blue",
-                            "green",
-                            "red",
-                            "yellow",
-                            "purple",
-                            "cancel",
-                            "b",
-                            "g",
-                            "r",
-                            "y",
-                            "p",
-                            "c",
-                        },
-                    )
-
-                # Map single-letter choices to full colors
-                if color_bet_on in {"b", "g", "r", "y", "p"}:
-                    color_bet_on = {
-                        "b": "blue",
-                        "g": "green",
-                        "r": "red",
-                        "y": "yellow",
-                        "p": "purple",
-                    }[color_bet_on]
-
-                if color_bet_on not in {"cancel", "c"}:
-                    worked = self.betting_tents.take_out_bet(color_bet_on, cur_player)
-                    if worked:
-                        has_used_turn = True
-                        extra_text = f"{cur_player.name} has taken out a bet on {color_bet_on}."
-                    else:
-                        extra_text = f"There were no bets available for the {color_bet_on} camel."
-
-            elif player_input == "3":
-                # Place spectator tile
-                tile, signum = self.place_spectator_tile(cur_player, max_tile_pos)
-                has_used_turn = True
-                extra_text = f"{cur_player.name} has placed a {signum} spectator tile on tile {tile}."
-
-            elif player_input == "4":
-                # Ask for a hint
-                extra_text = str(self.get_hint())
+            if self.race_track.has_camel_won:
+                self.show_winner_screen()
+                break
 
             # Reinsert current player based on whether they used their turn
             if has_used_turn:
@@ -349,6 +429,231 @@ class TheGame:
             else:
                 self.players.insert(0, cur_player)
 
+    def speculate_hint(self) -> None:
+        """
+        Start computing the hint for the current position in the background.
+
+        Does nothing unless a SpeculativeHinter is running (see start_game).
+
+        Returns:
+            None
+        """
+        if self.hinter is not None:
+            self.hinter.speculate(
+                self.race_track.to_simulatable_list(),
+                list(self.pyramid.to_simulatable()),
+                self.betting_tents.get_available_bets(),
+            )
+
+    def play_human_turn(self, player: CamelPlayer, player_input: str) -> tuple[bool, str]:
+        """
+        Carry out a human player's chosen action, prompting for its details.
+
+        Args:
+            player (CamelPlayer): The current player.
+            player_input (str): Chosen action ("1", "2", "3" or "4").
+
+        Returns:
+            tuple[bool, str]:
+                - has_used_turn (bool): False for hints and cancelled/failed bets.
+                - msg (str): Human-readable summary of what happened.
+        """
+        if player_input == "1":
+            # Roll dice
+            return True, self.take_roll_turn(player)
+
+        if player_input == "2":
+            # Place a bet
+            color_bet_on = TheGame.get_input_force(
+                "Which camel color would you like to take out a bet on? \n"
+                "(b)lue (g)reen (r)ed (y)ellow (p)urple (c)ancel\n"
+                + self.get_bets_available_string()
+                + "\n",
+                lambda reply: reply
+                in {
+                    "blue",
+                    "green",
+                    "red",
+                    "yellow",
+                    "purple",
+                    "cancel",
+                    "b",
+                    "g",
+                    "r",
+                    "y",
+                    "p",
+                    "c",
+                },
+            )
+
+            # Map single-letter choices to full colors
+            if color_bet_on in {"b", "g", "r", "y", "p"}:
+                color_bet_on = {
+                    "b": "blue",
+                    "g": "green",
+                    "r": "red",
+                    "y": "yellow",
+                    "p": "purple",
+                }[color_bet_on]
+
+            if color_bet_on in {"cancel", "c"}:
+                return False, ""
+            if self.take_bet(player, color_bet_on):
+                return True, f"{player.name} has taken out a bet on {color_bet_on}."
+            return False, f"There were no bets available for the {color_bet_on} camel."
+
+        if player_input == "3":
+            # Place spectator tile
+            tile, signum = self.place_spectator_tile(player, -1)
+            return True, f"{player.name} has placed a {signum} spectator tile on tile {tile}."
+
+        # Ask for a hint, redrawn as the estimate improves
+        return False, str(self.show_live_hint(player))
+
+    def choose_ai_action(
+        self,
+        evs: dict[str, float] | None = None,
+        player: CamelPlayer | None = None,
+    ) -> tuple[str, str, int]:
+        """
+        Pick the AI's action from the best EV in get_hint.
+
+        Args:
+            evs (dict[str, float] | None): Hint computed elsewhere (e.g. in a
+                worker process). Defaults to calling get_hint, within
+                ai_hint_ms when that is set.
+            player (CamelPlayer | None): The AI, whose open bets get_hint weighs.
+
+        Returns:
+            tuple[str, str, int]:
+                - player_input (str): "1" (roll), "2" (bet) or "3" (spectator tile).
+                - max_color (str): Label with the best EV ("roll", a color, "spt_<i>").
+                - max_tile_pos (int): Suggested spectator tile index, or -1.
+        """
+        max_color = ""
+        max_ev = float("-inf")
+        max_tile_pos = -1  # Only used for spectator tile placement
+
+        if evs is None:
+            deadline = time.perf_counter() + self.ai_hint_ms / 1000.0 if self.ai_hint_ms else None
+            evs = self.get_hint(player, deadline)
+        for col, ev in evs.items():
+            if ev > max_ev:
+                max_ev = ev
+                max_color = col
+
+        # Map best EV label to an action choice
+        if max_color == "roll":
+            player_input = "1"
+        elif max_color.startswith("spt_"):
+            player_input = "3"
+            max_tile_pos, _ = AIPlayer.parse_spectator_label(max_color)
+        else:
+            player_input = "2"
+        return player_input, max_color, max_tile_pos
+
+    def play_ai_turn(self, player: CamelPlayer, evs: dict[str, float] | None = None) -> tuple[bool, str]:
+        """
+        Choose and carry out an AI action without any terminal I/O.
+
+        If the chosen bet is no longer available the AI rolls instead, so an AI
+        turn always uses the turn.
+
+        Args:
+            player (CamelPlayer): The AI player taking the turn.
+            evs (dict[str, float] | None): Precomputed hint; see choose_ai_action.
+                Without one, the lookahead search chooses when the game has one
+                (an MCTSPlayer plays its most visited action).
+
+        Returns:
+            tuple[bool, str]:
+                - has_used_turn (bool): Always True.
+                - msg (str): Human-readable summary of what happened.
+        """
+        if evs is None and self.lookahead is not None:
+            evs = self.lookahead.action_values(self, player)
+            if isinstance(self.lookahead, MCTSPlayer):
+                # The most visited action, not the best mean of a barely sampled one
+                best = self.lookahead.best_action()
+                evs = {best: evs[best]}
+        player_input, max_color, max_tile_pos = self.choose_ai_action(evs, player)
+
+        if player_input == "2" and self.take_bet(player, max_color):
+            return True, f"{player.name} has taken out a bet on {max_color}."
+
+        if player_input == "3":
+            _, tile_type = AIPlayer.parse_spectator_label(max_color)
+            self.set_spectator_tile(player, max_tile_pos, tile_type)
+            sign_label = "positive" if tile_type == 1 else "negative"
+            return True, f"{player.name} has placed a {sign_label} spectator tile on tile {max_tile_pos}."
+
+        return True, self.take_roll_turn(player)
+
+    def take_roll_turn(self, player: CamelPlayer, die: tuple[str, int] | None = None) -> str:
+        """
+        Roll a die for the player and settle the leg if that roll ended it.
+
+        Args:
+            player (CamelPlayer): The player who rolled the die.
+            die (tuple[str, int] | None): Die to take instead of rolling; see roll_dice.
+
+        Returns:
+            str: Human-readable summary of the roll.
+        """
+        has_leg_ended, msg = self.roll_dice(player, die)
+        if has_leg_ended:
+            msg += "The leg has ended.\n"
+            self.end_leg()
+        return msg
+
+    def end_leg(self) -> None:
+        """
+        Settle every player's bets, refill the pyramid and return spectator tiles.
+
+        Returns:
+            None
+        """
+        with self.instrumentation.phase("game.settlement"):
+            self.payout_bets(self.all_players, self.race_track.get_camel_placements())
+            self.pyramid.reset()
+            self.race_track.spectator_tiles = {}
+        self.instrumentation.count("game.legs")
+        if self.event_log is not None:
+            self.event_log.leg_end(self)
+
+    def take_bet(self, player: CamelPlayer, color: str) -> bool:
+        """
+        Give the player the top betting ticket for a camel, if any is left.
+
+        Args:
+            player (CamelPlayer): The player betting.
+            color (str): Camel color.
+
+        Returns:
+            bool: True if a ticket was taken.
+        """
+        if not self.betting_tents.take_out_bet(color, player):
+            return False
+        if self.event_log is not None:
+            self.event_log.bet(self, player, color)
+        return True
+
+    def set_spectator_tile(self, player: CamelPlayer, position: int, tile_type: int) -> None:
+        """
+        Put a player's spectator tile on the track.
+
+        Args:
+            player (CamelPlayer): Owner of the tile.
+            position (int): Tile index.
+            tile_type (int): +1 or -1.
+
+        Returns:
+            None
+        """
+        self.race_track.spectator_tiles[position] = (tile_type, player)
+        if self.event_log is not None:
+            self.event_log.tile(self, player, position, tile_type)
+
     def place_spectator_tile(self, player: CamelPlayer, position: int) -> tuple[int, str]:
         """
         Place a spectator tile for a player, either interactively or based on AI choice.
@@ -362,8 +667,7 @@ class TheGame:
                 - tile_idx (int): Position where the tile was placed.
                 - sign_label (str): "positive" or "negative".
         """
-        os.system("cls")
-        print(self.get_game_state_str())
+        self.renderer.render(self.get_game_state_str())
         pos = 0
 
         if player.is_ai:
@@ -426,7 +730,7 @@ class TheGame:
                 print("Enter 'p' for positive or 'n' for negative")
 
         sign_label = "positive" if tile_type == +1 else "negative"
-        self.race_track.spectator_tiles[pos] = (tile_type, player)
+        self.set_spectator_tile(player, pos, tile_type)
 
         return pos, sign_label
 
@@ -444,10 +748,47 @@ class TheGame:
             print(f"{idx + 1}: {color.capitalize()} camel")
         for player in self.all_players:
             print(f"{player.name} ended with {player.amount_of_money} coin(s)")
+        if self.hinter is not None:
+            self.hinter.close()
+        self.ai_player.close()
+        if self.event_log is not None:
+            self.event_log.game_end(self)
+            self.event_log.close()
+        self.instrumentation.end()
+        for path in self.instrumentation.dump(self.instrumentation_output):
+            print(f"Instrumentation report written to {path}")
         exit()
 
 
 if __name__ == "__main__":
-    game = TheGame()
+    parser = argparse.ArgumentParser(description="Play Camel Up in the terminal.")
+    parser.add_argument("--instrument", metavar="PREFIX", help="record per-phase timings to PREFIX.json")
+    parser.add_argument("--profile", action="store_true", help="with --instrument, also write PREFIX.prof")
+    parser.add_argument("--trace-memory", action="store_true", help="with --instrument, record allocations")
+    parser.add_argument("--log", metavar="PATH", help="append every turn to an event log (see EventLog.py)")
+    parser.add_argument("--seed", type=int, default=None, help="seed the dice, board and turn order")
+    parser.add_argument("--lookahead", type=int, metavar="DEPTH", help="AI players search DEPTH turns ahead")
+    parser.add_argument("--think-ms", type=float, metavar="MS", help="AI players run MCTS for MS milliseconds a turn")
+    parser.add_argument("--workers", type=int, default=1, help="processes the AI simulates with")
+    parser.add_argument("--ai-hint-ms", type=float, metavar="MS", help="cap the AI's hint at MS milliseconds")
+    args = parser.parse_args()
+
+    event_log = None
+    if args.log:
+        from EventLog import EventLog
+
+        event_log = EventLog(args.log)
+    instrumentation = Instrumentation(True, args.profile, args.trace_memory) if args.instrument else None
+    lookahead = None
+    if args.think_ms:
+        lookahead = MCTSPlayer(args.think_ms, rng=RandomSource.coerce(args.seed).spawn(), instrumentation=instrumentation)
+    elif args.lookahead:
+        lookahead = ExpectimaxPlayer(depth=args.lookahead, rng=RandomSource.coerce(args.seed).spawn(),
+                                     instrumentation=instrumentation)
+    if args.instrument:
+        game = TheGame(instrumentation, args.instrument, event_log, args.seed, lookahead, args.workers)
+    else:
+        game = TheGame(event_log=event_log, rng=args.seed, lookahead=lookahead, workers=args.workers)
+    game.ai_hint_ms = args.ai_hint_ms
     num_players = int(TheGame.get_input_force("How many players will play? ", str.isnumeric))
     game.start_game(num_players)
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+from AIPlayer import AIPlayer
+from CamelPlayer import CamelPlayer
+from ExpectimaxPlayer import ExpectimaxPlayer
+from MCTSPlayer import MCTSPlayer
+from RandomSource import RandomSource
+from TheGame import TheGame
+
+
+class Tournament:
+    """
+    Headless AI-vs-AI tournament runner.
+
+    Plays many all-AI games with the real Pyramid, RaceTrack, BettingTicketHolder and
+    AIPlayer logic through TheGame.play_ai_turn, with no terminal I/O, no Java
+    avatar screen and no exit() at the end. Games are spread over a process pool
+    and each game is seeded, so a tournament with the same seed replays the same
+    games.
+
+    Seat 0 is the first player to move. Each seat plays one of STRATEGIES:
+    "greedy" takes the best one-turn EV of AIPlayer's hint, "expectimax"
+    searches a few turns ahead with ExpectimaxPlayer, and "mcts" searches for a
+    fixed time per turn with MCTSPlayer.
+    """
+
+    STRATEGIES = ("greedy", "expectimax", "mcts")
+
+    def __init__(
+        self,
+        num_players: int = 2,
+        amount_of_sims: int = 200,
+        mode: str = "monte_carlo",
+        workers: Optional[int] = None,
+        seed: int = 0,
+        max_turns: int = 1000,
+        strategies: Optional[Sequence[str]] = None,
+        lookahead_depth: int = 2,
+        think_ms: float = 100.0,
+    ) -> None:
+        """
+        Args:
+            num_players (int): AI players per game.
+            amount_of_sims (int): Simulations per AI hint.
+            mode (str): AIPlayer simulation mode.
+            workers (int | None): Worker processes; defaults to the CPU count.
+            seed (int): Master seed; game i uses seed + i.
+            max_turns (int): Safety cap on turns per game.
+            strategies (Sequence[str] | None): Strategy per seat; all "greedy"
+                by default.
+            lookahead_depth (int): Search depth of "expectimax" seats.
+            think_ms (float): Time budget per turn of "mcts" seats.
+
+        Raises:
+            ValueError: For an unknown strategy or one strategy too many or few.
+        """
+        strategies = list(strategies or ["greedy"] * num_players)
+        if len(strategies) != num_players:
+            raise ValueError("give one strategy per player")
+        for strategy in strategies:
+            if strategy not in self.STRATEGIES:
+                raise ValueError(f"unknown strategy {strategy!r}")
+        self.num_players = num_players
+        self.amount_of_sims = amount_of_sims
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.seed = seed
+        self.max_turns = max_turns
+        self.strategies = strategies
+        self.lookahead_depth = lookahead_depth
+        self.think_ms = think_ms
+
+    def run(self, num_games: int) -> Dict[str, Any]:
+        """
+        Play `num_games` games and summarise them.
+
+        Args:
+            num_games (int): Number of games to play.
+
+        Returns:
+            dict: games, seconds, games_per_second, mean_turns, unfinished_games,
+            win_rate_by_seat (ties split evenly) and coins_by_seat (mean, stdev,
+            min, max and a histogram of final coins per seat).
+        """
+        jobs = [
+            (
+                self.seed + i, self.num_players, self.amount_of_sims, self.mode, self.max_turns,
+                self.strategies, self.lookahead_depth, self.think_ms,
+            )
+            for i in range(num_games)
+        ]
+
+        start = time.perf_counter()
+        if self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(_play_game_job, jobs, chunksize=max(1, num_games // (4 * self.workers))))
+        else:
+            results = [_play_game_job(job) for job in jobs]
+        seconds = time.perf_counter() - start
+
+        return self.summarise(results, seconds)
+
+    def summarise(self, results: List[Dict[str, Any]], seconds: float) -> Dict[str, Any]:
+        """
+        Turn per-game results from play_game into a tournament report.
+
+        Args:
+            results (list[dict]): Results of play_game.
+            seconds (float): Wall-clock time taken.
+
+        Returns:
+            dict: See run.
+        """
+        wins = [0.0] * self.num_players
+        coins_by_seat: List[List[int]] = [[] for _ in range(self.num_players)]
+        for result in results:
+            coins = result["coins"]
+            best = max(coins)
+            winners = [seat for seat, amount in enumerate(coins) if amount == best]
+            for seat in winners:
+                wins[seat] += 1.0 / len(winners)
+            for seat, amount in enumerate(coins):
+                coins_by_seat[seat].append(amount)
+
+        n_games = len(results)
+        coin_stats = []
+        for seat_coins in coins_by_seat:
+            histogram: Dict[str, int] = {}
+            for amount in sorted(seat_coins):
+                histogram[str(amount)] = histogram.get(str(amount), 0) + 1
+            coin_stats.append(
+                {
+                    "mean": statistics.fmean(seat_coins) if seat_coins else 0.0,
+                    "stdev": statistics.pstdev(seat_coins) if seat_coins else 0.0,
+                    "min": min(seat_coins, default=0),
+                    "max": max(seat_coins, default=0),
+                    "histogram": histogram,
+                }
+            )
+
+        return {
+            "games": n_games,
+            "seconds": seconds,
+            "games_per_second": n_games / seconds if seconds > 0 else 0.0,
+            "mean_turns": statistics.fmean(r["turns"] for r in results) if results else 0.0,
+            "unfinished_games": sum(1 for r in results if not r["finished"]),
+            "win_rate_by_seat": [w / n_games if n_games else 0.0 for w in wins],
+            "coins_by_seat": coin_stats,
+        }
+
+    @staticmethod
+    def play_game(
+        game_seed: int,
+        num_players: int = 2,
+        amount_of_sims: int = 200,
+        mode: str = "monte_carlo",
+        max_turns: int = 1000,
+        strategies: Optional[Sequence[str]] = None,
+        lookahead_depth: int = 2,
+        think_ms: float = 100.0,
+    ) -> Dict[str, Any]:
+        """
+        Play one seeded all-AI game to the end, without any terminal I/O.
+
+        The dice, starting board and AI all draw from private streams seeded
+        with game_seed, so the global `random` module is left untouched.
+
+        Args:
+            game_seed (int): Seed for the dice, the starting board and the AI.
+            num_players (int): Number of AI players.
+            amount_of_sims (int): Simulations per AI hint.
+            mode (str): AIPlayer simulation mode.
+            max_turns (int): Safety cap on turns.
+            strategies (Sequence[str] | None): Strategy per seat; see STRATEGIES.
+            lookahead_depth (int): Search depth of "expectimax" seats.
+            think_ms (float): Time budget per turn of "mcts" seats. Their moves
+                depend on machine speed, so such games do not replay exactly.
+
+        Returns:
+            dict: coins (final coins per seat), turns, finished, and winner_camel.
+        """
+        game = TheGame(rng=game_seed)
+        game.ai_player.close()
+        # A seed of its own, drawn from the game's stream, keeps the AI's draws apart from the dice
+        ai_seed = game.rng.getrandbits(63)
+        game.ai_player = AIPlayer(amount_of_sims, mode=mode, seed=ai_seed)
+        strategies = list(strategies or ["greedy"] * num_players)
+        searchers: Dict[str, Any] = {}
+        if "expectimax" in strategies:
+            searchers["expectimax"] = ExpectimaxPlayer(lookahead_depth, rng=RandomSource(ai_seed).spawn())
+
+        # CamelPlayer marks a player as AI by its name
+        seats = [CamelPlayer("AI") for _ in range(num_players)]
+        searcher_of: Dict[int, Any] = {}
+        for seat_index, (seat, strategy) in enumerate(zip(seats, strategies)):
+            if strategy == "mcts":
+                # Each MCTS seat keeps a tree of its own between turns
+                searcher_of[id(seat)] = MCTSPlayer(think_ms, rng=RandomSource(ai_seed + seat_index).spawn())
+            else:
+                searcher_of[id(seat)] = searchers.get(strategy)
+        game.players = seats.copy()
+        game.all_players = seats.copy()
+
+        turns = 0
+        while not game.race_track.has_camel_won and turns < max_turns:
+            cur_player = game.players.pop(0)
+            # Greedy seats have no searcher and fall back to the AIPlayer hint
+            game.lookahead = searcher_of[id(cur_player)]
+            game.play_ai_turn(cur_player)
+            game.players.append(cur_player)
+            turns += 1
+
+        game.ai_player.close()
+        finished = game.race_track.has_camel_won
+        return {
+            "coins": [player.amount_of_money for player in seats],
+            "turns": turns,
+            "finished": finished,
+            "winner_camel": game.race_track.get_camel_placements()[0] if finished else "",
+        }
+
+
+def _play_game_job(job: tuple) -> Dict[str, Any]:
+    """
+    Pool entry point: unpack a job tuple for Tournament.play_game.
+    """
+    return Tournament.play_game(*job)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a headless AI-vs-AI Camel Up tournament.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--sims", type=int, default=200, help="simulations per AI hint")
+    parser.add_argument("--mode", default="monte_carlo", choices=AIPlayer.MODES)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--strategies", nargs="+", choices=Tournament.STRATEGIES, help="strategy per seat (default: all greedy)"
+    )
+    parser.add_argument("--depth", type=int, default=2, help="search depth of expectimax seats")
+    parser.add_argument("--think-ms", type=float, default=100.0, help="time budget per turn of mcts seats")
+    args = parser.parse_args()
+
+    report = Tournament(
+        args.players, args.sims, args.mode, args.workers, args.seed,
+        strategies=args.strategies, lookahead_depth=args.depth, think_ms=args.think_ms,
+    ).run(args.games)
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,233 @@
+import unittest
+import sys
+import os
+import random
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from AIPlayer import AIPlayer
+from LegEnumerator import LegEnumerator
+from TheGame import TheGame
+
+
+class TestSeededSimulation(unittest.TestCase):
+    def test_same_seed_same_result(self):
+        board = [("blue", 1), ("green", 2), ("red", 3), ("yellow", 3), ("purple", 2)]
+        dice = ["blue", "green", "red"]
+        first = AIPlayer(amount_of_sims=90, cache_size=0, workers=2, seed=11)
+        second = AIPlayer(amount_of_sims=90, cache_size=0, workers=2, seed=11)
+        try:
+            result = first.run_simulation(board, dice)
+            self.assertEqual(result, second.run_simulation(board, dice))
+            self.assertEqual(sum(counts[0] for counts in result[0].values()), 90)
+        finally:
+            first.close()
+            second.close()
+
+
+    def test_game_pool(self):
+        game = TheGame(rng=2, workers=2)
+        try:
+            self.assertEqual(game.ai_player.workers, 2)
+            game.ai_player.start_pool()
+            self.assertIn("roll", game.get_hint())
+        finally:
+            game.ai_player.close()
+        with self.assertRaises(ValueError):
+            TheGame(workers=0)
+
+class TestAdaptiveSimulation(unittest.TestCase):
+    def setUp(self):
+        self.board = [("blue", 1), ("green", 1), ("yellow", 2), ("red", 3), ("purple", 3)]
+        self.bets = {"blue": 5, "green": 5, "yellow": 5, "red": 5, "purple": 5}
+
+    def test_lopsided_board_stops_early(self):
+        # Purple is too far ahead to be caught with one die left
+        board = [("blue", 1), ("green", 1), ("yellow", 2), ("red", 3), ("purple", 12)]
+        ai = AIPlayer(amount_of_sims=4000, seed=1, tolerance=0.01)
+        _, _, report = ai.run_adaptive_simulation(board, ["blue"], self.bets, batch_size=200)
+        self.assertEqual(report["samples"], 200)
+        self.assertEqual(report["separated"], 1.0)
+
+    def test_respects_max_sims(self):
+        ai = AIPlayer(seed=2)
+        placements, _, report = ai.run_adaptive_simulation(
+            self.board, ["blue", "green", "red"], self.bets, tolerance=0.0, batch_size=100, max_sims=300
+        )
+        self.assertLessEqual(report["samples"], 300)
+        self.assertEqual(sum(counts[0] for counts in placements.values()), report["samples"])
+
+    def test_spectator_tile_counts_for_separation(self):
+        ai = AIPlayer(seed=2, opening_book_path=None)
+        # A sure blue win pays 1, and so does a tile landed on once per leg
+        placements = {"blue": [1000, 0], "red": [0, 1000]}
+        tiles = [0] * 16
+        tiles[5] = 1000
+        bets = {"blue": 1, "red": 0}
+        self.assertTrue(ai._is_separated(placements, tiles, bets, set(), [], 1.96))
+        self.assertFalse(ai._is_separated(placements, tiles, bets, {5}, [], 1.96))
+
+    def test_error_shrinks_with_samples(self):
+        placements = {"blue": [50, 25], "red": [25, 50]}
+        small = AIPlayer.bet_ev_errors(placements, {"blue": 5, "red": 0})
+        large = AIPlayer.bet_ev_errors({c: [4 * a, 4 * b] for c, (a, b) in placements.items()}, {"blue": 5, "red": 0})
+        self.assertAlmostEqual(large["blue"], small["blue"] / 2)
+        self.assertEqual(small["red"], 0.0)
+
+
+class TestStreamHint(unittest.TestCase):
+    def setUp(self):
+        self.board = [("blue", 1), ("green", 1), ("yellow", 2), ("red", 3), ("purple", 3)]
+        self.dice = ["blue", "green", "red"]
+        self.bets = {"blue": 5, "green": 5, "yellow": 5, "red": 5, "purple": 5}
+        self.empty = {5, 6, 7}
+
+    def test_updates_refine(self):
+        ai = AIPlayer(amount_of_sims=1000, seed=3, opening_book_path=None)
+        updates = list(ai.stream_hint(self.board, self.dice, self.bets, self.empty, batch_size=250))
+        self.assertEqual([samples for _, _, samples in updates], [250, 500, 750, 1000])
+        first_errors, last_errors = updates[0][1], updates[-1][1]
+        self.assertAlmostEqual(last_errors["blue"], first_errors["blue"] / 2, delta=0.05)
+        self.assertEqual(last_errors["roll"], 0.0)
+        self.assertEqual(set(updates[-1][0]) - set(last_errors), set())
+        # A finished stream is cached, so the next one is answered at once
+        cached = list(ai.stream_hint(self.board, self.dice, self.bets, self.empty))
+        self.assertEqual(len(cached), 1)
+        self.assertEqual(cached[0][0], updates[-1][0])
+
+    def test_deadline_stops_after_first_batch(self):
+        ai = AIPlayer(amount_of_sims=100000, seed=3, opening_book_path=None)
+        updates = list(ai.stream_hint(self.board, self.dice, self.bets, self.empty, deadline=0.0, batch_size=100))
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(updates[0][2], 100)
+
+    def test_cached_single_sample_is_not_exact(self):
+        ai = AIPlayer(amount_of_sims=1, seed=3, opening_book_path=None)
+        ai.run_simulation(self.board, self.dice)
+        (_, _, samples), = ai.stream_hint(self.board, self.dice, self.bets, self.empty)
+        self.assertEqual(samples, 1)
+        self.assertFalse(ai.simulation_result(self.board, self.dice)[2])
+        self.assertTrue(AIPlayer(mode="exact", opening_book_path=None).simulation_result(self.board, ["blue"])[2])
+
+    def test_exact_mode_has_no_error(self):
+        ai = AIPlayer(mode="exact", opening_book_path=None)
+        updates = list(ai.stream_hint(self.board, ["blue"], self.bets, self.empty))
+        self.assertEqual(len(updates), 1)
+        evs, errors, samples = updates[0]
+        self.assertEqual(samples, 0)
+        self.assertTrue(all(error == 0.0 for error in errors.values()))
+        with self.assertRaises(ValueError):
+            next(ai.stream_hint(self.board, ["blue"], self.bets, self.empty, batch_size=0))
+
+
+    def test_game_hint_deadline(self):
+        game = TheGame(rng=5)
+        game.ai_player.close()
+        game.ai_player = AIPlayer(amount_of_sims=100000, seed=5, opening_book_path=None)
+        # Only the first batch fits a deadline that has already passed
+        evs = game.get_hint(deadline=0.0)
+        self.assertIn("roll", evs)
+        self.assertTrue(any(label in evs for label in ("blue", "green", "yellow", "red", "purple")))
+        game.ai_hint_ms = 20
+        player_input, _, _ = game.choose_ai_action()
+        self.assertIn(player_input, ("1", "2", "3"))
+
+class TestHintBatch(unittest.TestCase):
+    def setUp(self):
+        boards = [
+            [("blue", 1), ("green", 2), ("red", 3), ("yellow", 3), ("purple", 2)],
+            [("blue", 4), ("green", 2), ("red", 6), ("yellow", 5), ("purple", 2)],
+        ]
+        bets = {"blue": 5, "green": 3, "red": 5, "yellow": 2, "purple": 5}
+        self.states = [
+            (boards[0], ["blue", "green", "red"], bets, {7, 8}),
+            (boards[1], ["red", "yellow"], bets, {9}),
+            (boards[0], ["blue", "green", "red"], {"blue": 2}, {7, 8}),
+            (boards[0], ["blue", "green", "red"], bets, {7, 8}),
+        ]
+
+    def test_matches_single_hints_exactly(self):
+        ai = AIPlayer(mode="exact", opening_book_path=None)
+        expected = [
+            ai.display_stats(*ai.run_simulation(board, dice), bets, empty, dice)
+            for board, dice, bets, empty in self.states
+        ]
+        batch_ai = AIPlayer(mode="exact", opening_book_path=None)
+        self.assertEqual(list(batch_ai.hint_batch(iter(self.states), window=3)), expected)
+        # Two distinct boards, each enumerated once
+        self.assertEqual(len(batch_ai.cache), 2)
+
+    def test_pool_shares_work_and_is_reproducible(self):
+        first = AIPlayer(amount_of_sims=200, workers=2, seed=5, opening_book_path=None)
+        second = AIPlayer(amount_of_sims=200, workers=2, seed=5, opening_book_path=None)
+        try:
+            hints = list(first.hint_batch(self.states))
+            self.assertEqual(hints, list(second.hint_batch(self.states)))
+            self.assertEqual(len(hints), 4)
+            self.assertEqual(hints[0], hints[3])
+            self.assertEqual(hints[2]["green"], 0.0)
+            # A second pass is served from the cache
+            self.assertEqual(list(first.hint_batch(self.states)), hints)
+            self.assertEqual(first.cache.stats()["hits"], 2)
+        finally:
+            first.close()
+            second.close()
+
+
+class TestSimulationRules(unittest.TestCase):
+    def test_monte_carlo_matches_exact_with_tiles_and_crazy_camels(self):
+        # White carries blue backwards; camels bounce off the tiles on 5 and 8
+        board = [("green", 1), ("red", 2), ("yellow", 3), ("purple", 4), ("white", 6), ("blue", 6),
+                 ("black", 15), ("spectator", 5, 1, None), ("spectator", 8, -1, None)]
+        dice = ["green", "red", "purple", "black", "white"]
+        sims = 20000
+        placements, tiles = AIPlayer(amount_of_sims=sims, cache_size=0, seed=6,
+                                     opening_book_path=None).run_simulation(board, dice)
+        exact_placements, exact_tiles = LegEnumerator().enumerate_leg(board, dice)
+        for color, (first, second) in exact_placements.items():
+            self.assertAlmostEqual(placements[color][0] / sims, first, delta=0.015)
+            self.assertAlmostEqual(placements[color][1] / sims, second, delta=0.015)
+        for count, expected in zip(tiles, exact_tiles):
+            self.assertAlmostEqual(count / sims, expected, delta=0.015)
+
+    def test_leg_stops_when_a_camel_finishes(self):
+        board = [("blue", 15), ("red", 0), ("green", 0), ("yellow", 0), ("purple", 0)]
+        placements, tiles = AIPlayer(amount_of_sims=200, cache_size=0, seed=7,
+                                     opening_book_path=None).run_simulation(board, ["blue", "red"])
+        self.assertEqual(placements["blue"][0], 200)
+        # Red only moves when its die comes before blue's
+        self.assertLess(sum(tiles), 400)
+
+
+class TestRaceSimulation(unittest.TestCase):
+    def test_distributions(self):
+        board = [("blue", 1), ("green", 1), ("yellow", 2), ("red", 3), ("purple", 3), ("black", 15), ("white", 15)]
+        winners, losers, legs = AIPlayer(amount_of_sims=300, seed=4).run_race_simulation(
+            board, ["blue", "green", "yellow", "red", "purple", "black", "white"]
+        )
+        self.assertAlmostEqual(sum(winners.values()), 1.0)
+        self.assertAlmostEqual(sum(losers.values()), 1.0)
+        # A race from the starting tiles lasts several legs
+        self.assertGreaterEqual(legs, 4.0)
+
+    def test_decided_race(self):
+        # Blue crosses the finish line with any roll; it ends in the current leg
+        board = [("red", 10), ("blue", 15), ("green", 3), ("yellow", 2), ("purple", 1)]
+        winners, losers, legs = AIPlayer(amount_of_sims=100, seed=5).run_race_simulation(board, ["blue"])
+        self.assertEqual(winners["blue"], 1.0)
+        self.assertEqual(losers["purple"], 1.0)
+        self.assertEqual(legs, 1.0)
+
+    def test_injected_source_is_reproducible(self):
+        board = [("blue", 1), ("green", 1), ("yellow", 2), ("red", 3), ("purple", 3)]
+        dice = ["blue", "green", "yellow"]
+        runs = [
+            AIPlayer(amount_of_sims=200, rng=random.Random(9)).run_race_simulation(board, dice) for _ in range(2)
+        ]
+        self.assertEqual(runs[0], runs[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
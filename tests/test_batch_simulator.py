@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+try:
+    from BatchSimulator import BatchSimulator
+except ImportError:  # NumPy not installed
+    BatchSimulator = None
+
+from LegEnumerator import LegEnumerator
+
+
+@unittest.skipIf(BatchSimulator is None, "NumPy is required for BatchSimulator")
+class TestBatchSimulator(unittest.TestCase):
+    def setUp(self):
+        self.board = [("blue", 1), ("green", 1), ("yellow", 2), ("red", 3), ("purple", 3),
+                      ("black", 15), ("white", 15)]
+        self.dice = ["blue", "red", "purple", "black", "white"]
+
+    def test_counts_add_up(self):
+        placements, tiles = BatchSimulator(seed=1).simulate(self.board, self.dice, 1000)
+        self.assertEqual(sum(p[0] for p in placements.values()), 1000)
+        self.assertEqual(sum(p[1] for p in placements.values()), 1000)
+        # Three regular dice every leg, and a crazy die unless both come last (1 in 10)
+        self.assertAlmostEqual(sum(tiles) / 1000, 3.9, delta=0.05)
+
+    def test_matches_exact_enumeration(self):
+        sims = 100000
+        placements, tiles = BatchSimulator(seed=2).simulate(self.board, self.dice, sims)
+        exact_placements, exact_tiles = LegEnumerator().enumerate_leg(self.board, self.dice)
+        for color, (first, second) in exact_placements.items():
+            self.assertAlmostEqual(placements[color][0] / sims, first, delta=0.01)
+            self.assertAlmostEqual(placements[color][1] / sims, second, delta=0.01)
+        for count, expected in zip(tiles, exact_tiles):
+            self.assertAlmostEqual(count / sims, expected, delta=0.01)
+
+    def test_spectator_tiles_match_exact_enumeration(self):
+        sims = 100000
+        board = self.board + [("spectator", 4, 1, None), ("spectator", 13, -1, None)]
+        placements, tiles = BatchSimulator(seed=4).simulate(board, self.dice, sims)
+        exact_placements, exact_tiles = LegEnumerator().enumerate_leg(board, self.dice)
+        for color, (first, second) in exact_placements.items():
+            self.assertAlmostEqual(placements[color][0] / sims, first, delta=0.01)
+            self.assertAlmostEqual(placements[color][1] / sims, second, delta=0.01)
+        for count, expected in zip(tiles, exact_tiles):
+            self.assertAlmostEqual(count / sims, expected, delta=0.01)
+        # Camels bounce off the +1 tile on 4, so no roll ends there
+        self.assertEqual(tiles[4], 0)
+
+    def test_seed_is_reproducible(self):
+        a = BatchSimulator(seed=3).simulate(self.board, self.dice, 500)
+        b = BatchSimulator(seed=3).simulate(self.board, self.dice, 500)
+        self.assertEqual(a, b)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from Benchmark import Benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_run_covers_hot_paths(self):
+        results = Benchmark(repeats=1, scale=0.01).run()
+        names = results["benchmarks"].keys()
+        for prefix in ("location_update/", "find_camel/", "get_camel_placements/", "run_simulation/",
+                       "display_stats/", "pyramid_roll", "exchange_all_bets"):
+            self.assertTrue(any(name.startswith(prefix) for name in names), prefix)
+        for case in results["benchmarks"].values():
+            self.assertGreater(case["normalised"], 0)
+
+    def test_compare_flags_slowdowns_only(self):
+        baseline = {"benchmarks": {"a": {"normalised": 1.0, "best_us": 1.0},
+                                   "b": {"normalised": 1.0, "best_us": 1.0}}}
+        results = {"benchmarks": {"a": {"normalised": 1.2, "best_us": 1.2},
+                                  "b": {"normalised": 3.0, "best_us": 3.0},
+                                  "new": {"normalised": 9.0, "best_us": 9.0}}}
+        regressions = Benchmark.compare(results, baseline, threshold=1.5)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("b:"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+import sys
+import os
+import random
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from CompactBoard import CompactBoard
+from CamelPlayer import CamelPlayer
+from RaceTrack import RaceTrack
+
+
+class TestCompactBoard(unittest.TestCase):
+    def setUp(self):
+        self.camels = [("red", 0), ("blue", 1), ("green", 2), ("yellow", 3), ("purple", 4),
+                       ("black", 15), ("white", 15)]
+        self.race_track = RaceTrack()
+        self.race_track.set_up_camels(self.camels)
+
+    def assert_same(self, board):
+        camels = [entry for entry in self.race_track.to_simulatable_list() if entry[0] != "spectator"]
+        self.assertEqual(CompactBoard.to_simulatable(board), camels)
+        self.assertEqual(CompactBoard.placements(board), self.race_track.get_camel_placements())
+
+    def test_round_trip(self):
+        board = CompactBoard.from_simulatable(self.race_track.to_simulatable_list())
+        self.assertEqual(len(board), 14)
+        self.assert_same(board)
+
+    def test_moves_match_race_track(self):
+        board = CompactBoard.from_simulatable(self.camels)
+        for color, amount in [("red", 2), ("blue", 1), ("green", 2), ("yellow", 1), ("white", -1),
+                              ("purple", 3), ("black", -2), ("red", 3)]:
+            self.race_track.location_update(color, amount)
+            board, _, final, _ = CompactBoard.move(board, CompactBoard.COLOR_INDEX[color], amount)
+            self.assertEqual(final, self.race_track.find_camel(color))
+            self.assert_same(board)
+
+    def test_spectator_tiles(self):
+        owner = CamelPlayer("owner")
+        self.race_track.spectator_tiles = {5: (1, owner), 7: (-1, owner)}
+        effects = CompactBoard.spectator_effects({5: 1, 7: -1})
+        board = CompactBoard.from_simulatable(self.camels)
+        landings = []
+        for color, amount in [("yellow", 2), ("purple", 3), ("green", 3), ("red", 3)]:
+            self.race_track.location_update(color, amount)
+            board, landed, final, _ = CompactBoard.move(board, CompactBoard.COLOR_INDEX[color], amount, effects)
+            landings.append((landed, final))
+            self.assert_same(board)
+        # yellow hit the +1 tile, purple the -1 tile, green the +1 tile again
+        self.assertEqual(landings, [(5, 6), (7, 6), (5, 6), (3, 3)])
+
+    def test_stack_form_matches_move(self):
+        effects = CompactBoard.spectator_effects({0: -1, 5: 1, 9: -1, 15: 1})
+        table = CompactBoard.move_table(effects)
+        rng = random.Random(8)
+        for _ in range(50):
+            board = CompactBoard.from_simulatable(self.camels)
+            stacks, tiles = CompactBoard.to_stacks(board)
+            for _ in range(20):
+                color_index = rng.randrange(len(CompactBoard.COLORS))
+                amount = rng.randint(1, 3) * (-1 if color_index >= CompactBoard.N_REGULAR else 1)
+                board, landed, final, crossed = CompactBoard.move(board, color_index, amount, effects)
+                self.assertEqual(CompactBoard.move_stacks(stacks, tiles, color_index, amount, table),
+                                 (landed, final, crossed))
+                self.assertEqual(CompactBoard.to_stacks(board), (stacks, tiles))
+                self.assertEqual(CompactBoard.stack_ranking(stacks), CompactBoard.ranking(board))
+
+    def test_crossing_finish(self):
+        board = CompactBoard.from_simulatable([("blue", 14), ("red", 14)])
+        board, landed, final, crossed = CompactBoard.move(board, CompactBoard.COLOR_INDEX["blue"], 3)
+        self.assertTrue(crossed)
+        self.assertEqual(CompactBoard.placements(board), ("red", "blue"))
+
+
+if __name__ == "__main__":
+    unittest.main()
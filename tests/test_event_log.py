@@ -0,0 +1,99 @@
+import unittest
+import sys
+import os
+import json
+import random
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from CamelPlayer import CamelPlayer
+from EventLog import EventLog
+from GameSnapshot import GameSnapshot
+from TheGame import TheGame
+
+
+class TestEventLog(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "game.log")
+        self.log = EventLog(self.path)
+        self.game = TheGame(event_log=self.log)
+        self.game.ai_player.close()
+        self.game.players = [CamelPlayer("ann"), CamelPlayer("ann"), CamelPlayer("bo")]
+        self.game.all_players = self.game.players.copy()
+
+    def tearDown(self):
+        self.log.close()
+        self.tmp.cleanup()
+
+    def play(self, turns):
+        """
+        Play random turns the way start_game does, returning a snapshot before each turn.
+        """
+        game = self.game
+        self.log.begin(game)
+        states = []
+        for _ in range(turns):
+            if game.race_track.has_camel_won:
+                break
+            self.log.turn_started(game)
+            states.append(GameSnapshot.dumps(game))
+            player = game.players.pop(0)
+            choice = random.random()
+            empty_spaces = sorted(game.race_track.empty_spaces())
+            if choice < 0.2 and game.take_bet(player, random.choice(["blue", "green", "red", "yellow", "purple"])):
+                pass
+            elif choice < 0.3 and empty_spaces:
+                game.set_spectator_tile(player, random.choice(empty_spaces), random.choice([1, -1]))
+            else:
+                game.take_roll_turn(player)
+            game.players.append(player)
+        states.append(GameSnapshot.dumps(game))
+        return states
+
+    def test_replay_matches_every_turn(self):
+        states = self.play(60)
+        events = list(EventLog.events(self.path))
+        self.assertEqual(events[0], {"turn": 0, "type": "start", "seats": ["ann", "ann", "bo"]})
+        self.assertGreater(sum(event["type"] == "leg_end" for event in events), 1)
+        self.assertEqual(sum(event["type"] in EventLog.TURN_TYPES for event in events), len(states) - 1)
+
+        for turn, state in enumerate(states):
+            self.assertEqual(GameSnapshot.dumps(EventLog.replay(self.path, turn)), state, f"turn {turn}")
+        self.assertEqual(GameSnapshot.dumps(EventLog.replay(self.path)), states[-1])
+
+    def test_replay_starts_from_nearest_checkpoint(self):
+        states = self.play(40)
+        events = list(EventLog.events(self.path))
+        last_checkpoint = max(idx for idx, event in enumerate(events) if event["type"] == "checkpoint")
+        self.assertGreater(events[last_checkpoint]["turn"], 0)
+
+        # Turns before the last checkpoint are never applied
+        with open(self.path, "w", encoding="utf-8") as log_file:
+            for idx, event in enumerate(events):
+                if idx < last_checkpoint and event["type"] == "roll":
+                    event["color"] = "nope"
+                log_file.write(json.dumps(event) + "\n")
+        self.assertEqual(GameSnapshot.dumps(EventLog.replay(self.path)), states[-1])
+        with self.assertRaises(ValueError):
+            EventLog.replay(self.path, events[last_checkpoint]["turn"] - 1)
+
+    def test_partial_lines_and_errors(self):
+        self.play(5)
+        with open(self.path, "a", encoding="utf-8") as log_file:
+            log_file.write('{"turn": 5, "type": "ro')
+        self.assertEqual(list(EventLog.events(self.path))[-1]["turn"], 4)
+        with self.assertRaisesRegex(ValueError, "before turn 50"):
+            EventLog.replay(self.path, 50)
+
+        game = EventLog.replay(self.path)
+        waiting = next(idx for idx, player in enumerate(game.all_players) if player is not game.players[0])
+        with self.assertRaisesRegex(ValueError, "turn 5: it is not"):
+            EventLog.apply(game, {"turn": 5, "type": "roll", "player": waiting, "color": "blue", "value": 1})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from CamelPlayer import CamelPlayer
+from CompactBoard import CompactBoard
+from ExpectimaxPlayer import ExpectimaxPlayer
+from TheGame import TheGame
+from Tournament import Tournament
+
+# Blue leads alone on tile 10, the others are stacked far behind; only one
+# regular die (purple) is left, so blue wins the leg whatever happens
+TRACK = [
+    ("red", 2), ("yellow", 2), ("green", 2), ("purple", 2),
+    ("blue", 10),
+    ("black", 15), ("white", 15),
+]
+
+
+def late_leg_state():
+    board = CompactBoard.from_simulatable(TRACK)
+    dice = 1 << CompactBoard.COLOR_INDEX["purple"]
+    # A 5 coin ticket on top of a 2 coin one for every color
+    tickets = tuple(((2, 1, -1, -1, -1), (5, 1, -1, -1, -1)) for _ in range(CompactBoard.N_REGULAR))
+    return (board, dice, (), tickets, ((), ()), 0)
+
+
+class TestExpectimaxPlayer(unittest.TestCase):
+    def setUp(self):
+        self.player = ExpectimaxPlayer(depth=1, rng=5)
+
+    def test_invalid_arguments(self):
+        for kwargs in ({"depth": 0}, {"node_budget": 0}, {"leaf_sims": 0}, {"exact_dice": -1}):
+            with self.assertRaises(ValueError):
+                ExpectimaxPlayer(**kwargs)
+
+    def test_labels_from_game(self):
+        game = TheGame(rng=3)
+        game.ai_player.close()
+        ai, other = CamelPlayer("AI"), CamelPlayer("AI")
+        game.players = [other]
+        game.all_players = [ai, other]
+        values = ExpectimaxPlayer(depth=1, rng=1).action_values(game, ai)
+        self.assertIn("roll", values)
+        for color in CompactBoard.REGULAR_COLORS:
+            self.assertIn(color, values)
+        self.assertTrue(any(label.startswith("spt_") for label in values))
+        # The chosen label maps onto a real action
+        player_input, _, _ = game.choose_ai_action(values, ai)
+        self.assertIn(player_input, ("1", "2", "3"))
+
+    def test_sure_ticket_beats_rolling(self):
+        values = self.player.search(late_leg_state(), 2)
+        # Taking the 5 coin blue ticket is worth its full value
+        self.assertAlmostEqual(values["blue"], 5.0)
+        self.assertGreater(values["blue"], values["roll"])
+        # Rolling ends the leg, so only the roll's coin counts
+        self.assertAlmostEqual(values["roll"], 1.0)
+
+    def test_opponent_reply(self):
+        # One turn deeper the other seat answers the blue bet: rolling ends the
+        # leg for a coin, taking the 2 coin blue ticket costs the AI 2
+        values = ExpectimaxPlayer(depth=2, rng=5).search(late_leg_state(), 2)
+        self.assertAlmostEqual(values["blue"], 3.0)
+
+    def test_dominated_actions_pruned(self):
+        values = self.player.search(late_leg_state(), 2)
+        # Red, yellow and green cannot finish in the top two with one die left
+        for color in ("red", "yellow", "green"):
+            self.assertNotIn(color, values)
+        self.assertIn("purple", values)
+        # Tiles out of purple's reach collapse into a single do-nothing tile
+        unreachable = [
+            label for label in values
+            if label.startswith("spt_") and not 3 <= int(label[4:-1]) <= 5
+        ]
+        self.assertEqual(len(unreachable), 1)
+        self.assertAlmostEqual(values[unreachable[0]], 0.0)
+
+    def test_no_pruning_on_sampled_statistics(self):
+        # Five dice left and exact_dice=0: leaf statistics are sampled
+        state = late_leg_state()
+        dice = (1 << CompactBoard.N_REGULAR) - 1
+        values = ExpectimaxPlayer(depth=1, exact_dice=0, leaf_sims=5, rng=5).search((state[0], dice) + state[2:], 2)
+        for color in CompactBoard.REGULAR_COLORS:
+            self.assertIn(color, values)
+        # Every empty tile is searched with both signs (camels on 2, 10 and 15)
+        tiles = [label for label in values if label.startswith("spt_")]
+        self.assertEqual(len(tiles), 2 * (16 - 3))
+
+    def test_node_budget_limits_depth(self):
+        state = (
+            CompactBoard.from_simulatable(TRACK),
+            (1 << len(CompactBoard.COLORS)) - 1,
+            (),
+            tuple(((2, 1, -1, -1, -1), (3, 1, -1, -1, -1), (5, 1, -1, -1, -1)) for _ in range(5)),
+            ((), ()),
+            0,
+        )
+        limited = ExpectimaxPlayer(depth=3, node_budget=50, rng=5)
+        values = limited.search(state, 2)
+        self.assertEqual(limited.last_report["depth"], 1)
+        self.assertIn("roll", values)
+
+    def test_deeper_search_reaches_leg_end(self):
+        # With two dice left, depth 3 sees both rolls and settles the leg exactly
+        state = late_leg_state()
+        dice = state[1] | 1 << CompactBoard.COLOR_INDEX["red"]
+        deep = ExpectimaxPlayer(depth=3, node_budget=None, rng=5)
+        values = deep.search((state[0], dice) + state[2:], 2)
+        self.assertEqual(deep.last_report["depth"], 3)
+        self.assertGreater(values["blue"], 0)
+
+    def test_tournament_with_expectimax_seat(self):
+        result = Tournament.play_game(
+            4, num_players=2, amount_of_sims=20, strategies=["expectimax", "greedy"], lookahead_depth=1
+        )
+        self.assertTrue(result["finished"])
+        with self.assertRaises(ValueError):
+            Tournament(num_players=2, strategies=["expectimax"])
+
+
+if __name__ == '__main__':
+    unittest.main()
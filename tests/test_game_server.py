@@ -0,0 +1,138 @@
+import unittest
+import sys
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from GameClient import GameClient
+from GameServer import GameServer
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.server = GameServer(port=0, amount_of_sims=30, executor=self.executor)
+        await self.server.start()
+        self.clients = []
+
+    async def asyncTearDown(self):
+        for client in self.clients:
+            await client.close()
+        await self.server.close()
+        self.executor.shutdown()
+
+    async def connect(self):
+        client = await GameClient.connect("127.0.0.1", self.server.port)
+        self.clients.append(client)
+        return client
+
+    async def test_two_humans_take_turns(self):
+        alice, bob = await self.connect(), await self.connect()
+        table = await alice.request("CREATE alice bob")
+        session = table["session"]
+        await alice.request(f"JOIN {session} alice")
+        await bob.request(f"JOIN {session} bob")
+
+        with self.assertRaisesRegex(ValueError, "alice's turn"):
+            await bob.request("ROLL")
+        reply = await alice.request("BET blue")
+        self.assertEqual(reply["state"]["turn"], "bob")
+        self.assertEqual(reply["state"]["players"][0]["bets"], [["blue", 5]])
+
+        # Bob was told about Alice's move
+        events = await bob.poll_events(timeout=1.0)
+        self.assertEqual(events[0]["messages"], ["alice has taken out a bet on blue."])
+
+        # A hint asked for out of turn weighs the asker's own tickets
+        hint_session = self.server.sessions[session]
+        self.assertEqual(hint_session.hint_request("bob")[5], [])
+        self.assertEqual(hint_session.hint_request("alice")[5], [("blue", (5, 1, -1, -1, -1))])
+        self.assertIn("roll", (await alice.request("HINT"))["hint"])
+
+        reply = await bob.request("ROLL")
+        self.assertEqual(sum(len(tile) for tile in reply["state"]["board"]), 7)
+        crazy = reply["state"]["rolled"][0][0] in ("black", "white")
+        self.assertEqual(reply["state"]["players"][1]["coins"], 3 if crazy else 4)
+
+    async def test_ai_seats_answer_and_tables_are_independent(self):
+        client, other = await self.connect(), await self.connect()
+        first = await client.request("CREATE carol AI")
+        second = await other.request("CREATE dave")
+        self.assertNotEqual(first["session"], second["session"])
+
+        await client.request(f"JOIN {first['session']} carol")
+        reply = await client.request("BET green")
+        # The AI seat moved before the reply came back
+        self.assertEqual(len(reply["messages"]), 2)
+        self.assertEqual(reply["state"]["turn"], "carol")
+
+        hint = (await client.request("HINT"))["hint"]
+        self.assertIn("roll", hint)
+
+        await other.request(f"JOIN {second['session']} dave")
+        self.assertEqual((await other.request("STATE"))["state"]["players"][0]["name"], "dave")
+
+    async def test_all_ai_table_plays_to_the_end(self):
+        client = await self.connect()
+        reply = await client.request("CREATE AI AI")
+        self.assertTrue(reply["state"]["finished"])
+        self.assertIsNone(reply["state"]["turn"])
+
+    async def test_tables_resume_from_snapshots(self):
+        with tempfile.TemporaryDirectory() as snapshot_dir:
+            server = GameServer(port=0, amount_of_sims=30, executor=self.executor, snapshot_dir=snapshot_dir)
+            await server.start()
+            client = await GameClient.connect("127.0.0.1", server.port)
+            table = await client.request("CREATE erin frank")
+            await client.request(f"JOIN {table['session']} erin")
+            before = (await client.request("BET green"))["state"]
+            await client.close()
+            await server.close()
+
+            resumed = GameServer(port=0, amount_of_sims=30, executor=self.executor, snapshot_dir=snapshot_dir)
+            await resumed.start()
+            client = await GameClient.connect("127.0.0.1", resumed.port)
+            await client.request(f"JOIN {table['session']} frank")
+            self.assertEqual((await client.request("STATE"))["state"], before)
+            self.assertNotEqual((await client.request("CREATE gina"))["session"], table["session"])
+            await client.close()
+            await resumed.close()
+
+    async def test_errors(self):
+        client = await self.connect()
+        with self.assertRaisesRegex(ValueError, "join a table first"):
+            await client.request("ROLL")
+        with self.assertRaisesRegex(ValueError, "unknown command"):
+            await client.request("DANCE")
+        table = await client.request("CREATE erin")
+        await client.request(f"JOIN {table['session']} erin")
+        with self.assertRaisesRegex(ValueError, "cannot place"):
+            await client.request("TILE 15 +")
+        with self.assertRaisesRegex(ValueError, "unknown camel color"):
+            await client.request("BET pink")
+        # A rejected table is not left behind
+        with self.assertRaisesRegex(ValueError, "255 UTF-8 bytes"):
+            await client.request("CREATE " + "x" * 300 + " bob")
+        self.assertEqual(len((await client.request("LIST"))["tables"]), 1)
+
+
+    async def test_internal_error_keeps_connection(self):
+        client = await self.connect()
+        table = await client.request("CREATE frank")
+        await client.request(f"JOIN {table['session']} frank")
+
+        async def broken_hint(*args):
+            raise RuntimeError("hint worker died")
+
+        self.server._hint = broken_hint
+        with self.assertLogs("GameServer", "ERROR"):
+            with self.assertRaisesRegex(ValueError, "internal error"):
+                await client.request("HINT")
+        self.assertEqual((await client.request("STATE"))["state"]["turn"], "frank")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import sys
+import os
+import random
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from CamelPlayer import CamelPlayer
+from GameSession import GameSession
+from GameSnapshot import GameSnapshot
+from TheGame import TheGame
+
+
+class TestGameSnapshot(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.session = GameSession("1", ["alice", "bob", "carol"])
+        self.session.bet("alice", "blue")
+        self.session.place_tile("bob", sorted(self.session.game.race_track.empty_spaces())[-1], "-")
+        self.session.roll("carol")
+        self.session.bet("alice", "blue")
+        self.game = self.session.game
+
+    def test_round_trip(self):
+        data = GameSnapshot.dumps(self.game)
+        restored = GameSnapshot.loads(data)
+
+        self.assertLess(len(data), 200)
+        self.assertEqual(GameSnapshot.dumps(restored), data)
+        self.assertEqual(restored.race_track.to_simulatable_list()[:7], self.game.race_track.to_simulatable_list()[:7])
+        self.assertEqual(restored.pyramid.rolled_dice, self.game.pyramid.rolled_dice)
+        self.assertEqual(restored.pyramid.unrolled_dice, self.game.pyramid.unrolled_dice)
+        self.assertEqual(restored.betting_tents.get_available_bets(), self.game.betting_tents.get_available_bets())
+        self.assertEqual([p.name for p in restored.players], ["bob", "carol", "alice"])
+        self.assertEqual([p.amount_of_money for p in restored.all_players],
+                         [p.amount_of_money for p in self.game.all_players])
+        self.assertEqual([(bet.color, bet.money_for_placements) for bet in restored.all_players[0].bets],
+                         [("blue", (5, 1, -1, -1, -1)), ("blue", (3, 1, -1, -1, -1))])
+
+        # Spectator tile owners are seats of the restored game, not copies
+        (tile_type, owner), = restored.race_track.spectator_tiles.values()
+        self.assertEqual(tile_type, -1)
+        self.assertIs(owner, restored.all_players[1])
+
+    def test_session_resumes_play(self):
+        resumed = GameSession("1", [], self.session.snapshot())
+        self.assertEqual(resumed.state(), self.session.state())
+        with self.assertRaisesRegex(ValueError, "bob's turn"):
+            resumed.roll("alice")
+        resumed.roll("bob")
+        self.assertEqual(resumed.current_player.name, "carol")
+
+    def test_rejects_bad_data(self):
+        data = GameSnapshot.dumps(self.game)
+        for bad in (b"", b"XXXX" + data[4:], data[:4] + b"\x63\x00" + data[6:], data[:-3], data + b"\x00"):
+            with self.assertRaises(ValueError):
+                GameSnapshot.loads(bad)
+
+    def test_only_between_turns(self):
+        self.game.players.pop(0)
+        with self.assertRaises(ValueError):
+            GameSnapshot.dumps(self.game)
+
+
+    def test_restored_dice_follow_the_game_rng(self):
+        original, target = TheGame(rng=11), TheGame(rng=11)
+        for game in (original, target):
+            game.ai_player.close()
+        original.all_players = [CamelPlayer("alice"), CamelPlayer("bob")]
+        original.players = list(original.all_players)
+        restored = GameSnapshot.loads(GameSnapshot.dumps(original), target)
+        self.assertIs(restored.pyramid.rng, target.rng)
+        self.assertEqual(
+            [restored.pyramid.roll()[:2] for _ in range(4)],
+            [original.pyramid.roll()[:2] for _ in range(4)],
+        )
+
+    def test_long_names(self):
+        with self.assertRaisesRegex(ValueError, "255 UTF-8 bytes"):
+            GameSession("2", ["x" * 300, "bob"])
+        self.game.all_players[0].name = "\u00e9" * 128
+        with self.assertRaisesRegex(ValueError, "longer than 255"):
+            GameSnapshot.dumps(self.game)
+
+if __name__ == '__main__':
+    unittest.main()
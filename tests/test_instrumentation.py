@@ -0,0 +1,71 @@
+import unittest
+import sys
+import os
+import json
+import random
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from AIPlayer import AIPlayer
+from CamelPlayer import CamelPlayer
+from Instrumentation import Instrumentation
+from TheGame import TheGame
+
+
+class TestInstrumentation(unittest.TestCase):
+    board = [("blue", 1), ("green", 1), ("red", 2), ("yellow", 3), ("purple", 3)]
+    dice = ["blue", "green", "red", "yellow", "purple"]
+
+    def test_disabled_records_nothing(self):
+        instrumentation = Instrumentation()
+        ai = AIPlayer(50, cache_size=0, seed=1, opening_book_path=None, instrumentation=instrumentation)
+        ai.run_simulation(self.board, self.dice)
+        with instrumentation.phase("x"):
+            instrumentation.count("y")
+        self.assertEqual(instrumentation.phases, {})
+        self.assertEqual(instrumentation.counters, {})
+        self.assertEqual(instrumentation.dump("unused"), [])
+
+    def test_ai_phases_and_counters(self):
+        instrumentation = Instrumentation(enabled=True)
+        ai = AIPlayer(50, opening_book_path=None, instrumentation=instrumentation)
+        ai.run_simulation(self.board, self.dice)
+        ai.run_simulation(self.board, self.dice)
+        report = instrumentation.to_dict()
+        for name in ("ai.simulate", "ai.setup", "ai.roll_loop", "ai.ranking"):
+            self.assertIn(name, report["phases"])
+        self.assertEqual(report["phases"]["ai.setup"]["calls"], 50)
+        self.assertEqual(report["counters"]["ai.simulated_legs"], 50)
+        self.assertEqual(report["counters"]["ai.simulated_moves"], 250)
+        self.assertEqual(report["counters"]["ai.cache_hits"], 1)
+
+    def test_game_report_dump(self):
+        saved_state = random.getstate()
+        random.seed(3)
+        try:
+            instrumentation = Instrumentation(enabled=True, profile=True)
+            game = TheGame(instrumentation)
+            game.ai_player = AIPlayer(30, seed=3, opening_book_path=None, instrumentation=instrumentation)
+            game.players = game.all_players = [CamelPlayer("AI"), CamelPlayer("AI")]
+            instrumentation.begin()
+            for turn in range(12):
+                game.play_ai_turn(game.players[turn % 2])
+            instrumentation.end()
+        finally:
+            random.setstate(saved_state)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            written = instrumentation.dump(os.path.join(tmp, "game"))
+            self.assertEqual([os.path.basename(path) for path in written], ["game.json", "game.prof"])
+            with open(written[0]) as report_file:
+                report = json.load(report_file)
+        self.assertEqual(report["phases"]["game.hint"]["calls"], 12)
+        self.assertIn("ai.stats", report["phases"])
+        self.assertGreater(report["wall_seconds"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from LegEnumerator import LegEnumerator
+from AIPlayer import AIPlayer
+from RaceTrack import RaceTrack
+
+
+class TestLegEnumerator(unittest.TestCase):
+    def setUp(self):
+        self.board = [("blue", 1), ("green", 1), ("yellow", 2), ("red", 3), ("purple", 3),
+                      ("black", 15), ("white", 15)]
+
+    def test_single_die(self):
+        # Only blue left to roll: it lands on 2, 3 or 4 with equal probability
+        placements, tiles = LegEnumerator().enumerate_leg([("blue", 1), ("green", 3)], ["blue"])
+        self.assertAlmostEqual(placements["blue"][0], 2 / 3)  # rolled 2 (on top of green) or 3
+        self.assertAlmostEqual(placements["green"][0], 1 / 3)
+        self.assertAlmostEqual(placements["green"][1], 2 / 3)
+        self.assertAlmostEqual(tiles[2], 1 / 3)
+        self.assertAlmostEqual(tiles[3], 1 / 3)
+        self.assertAlmostEqual(tiles[4], 1 / 3)
+
+    def test_probabilities_sum_to_one(self):
+        placements, tiles = LegEnumerator().enumerate_leg(self.board, ["blue", "red", "purple", "black", "white"])
+        self.assertAlmostEqual(sum(p[0] for p in placements.values()), 1.0)
+        self.assertAlmostEqual(sum(p[1] for p in placements.values()), 1.0)
+        # Three regular dice, and one crazy die unless both are drawn last (1 in 10)
+        self.assertAlmostEqual(sum(tiles), 3.9)
+
+    def test_spectator_tiles(self):
+        # Blue landing on the +1 tile on 2 is carried onto green on 3
+        board = [("blue", 1), ("green", 3), ("spectator", 2, 1, None)]
+        placements, tiles = LegEnumerator().enumerate_leg(board, ["blue"])
+        self.assertAlmostEqual(placements["blue"][0], 1.0)
+        self.assertAlmostEqual(tiles[2], 0.0)
+        self.assertAlmostEqual(tiles[3], 2 / 3)
+        self.assertAlmostEqual(tiles[4], 1 / 3)
+
+        # A -1 tile puts blue under green instead; the new tiles start a new tree
+        enumerator = LegEnumerator()
+        enumerator.enumerate_leg(board, ["blue"])
+        placements, _ = enumerator.enumerate_leg([("blue", 1), ("green", 3), ("spectator", 4, -1, None)], ["blue"])
+        self.assertEqual(enumerator.tree_hits, 0)
+        self.assertAlmostEqual(placements["green"][0], 2 / 3)
+
+    def test_leg_ends_with_last_regular_die(self):
+        # The crazy die only moves if it is drawn before blue
+        _, tiles = LegEnumerator().enumerate_leg(self.board, ["blue", "black", "white"])
+        self.assertAlmostEqual(sum(tiles), 1 + 2 / 3)
+
+    def test_leg_ends_when_a_camel_finishes(self):
+        # Blue always crosses the line, so red's die is only rolled when it comes first
+        board = [("blue", 15), ("red", 0)]
+        placements, tiles = LegEnumerator().enumerate_leg(board, ["blue", "red"])
+        self.assertAlmostEqual(placements["blue"][0], 1.0)
+        self.assertAlmostEqual(sum(tiles), 1.5)
+
+    def test_reuses_tree_after_roll(self):
+        enumerator = LegEnumerator()
+        enumerator.enumerate_leg(self.board, ["blue", "red", "black", "white"])
+        race_track = RaceTrack()
+        race_track.set_up_camels(self.board)
+        race_track.location_update("red", 2)
+        child = race_track.to_simulatable_list()
+        reused = enumerator.enumerate_leg(child, ["blue", "black", "white"])
+        self.assertEqual(enumerator.tree_hits, 1)
+        self.assertEqual(reused, LegEnumerator().enumerate_leg(child, ["blue", "black", "white"]))
+
+    def test_ai_exact_mode(self):
+        ai = AIPlayer(mode="exact")
+        placements, tiles = ai.run_simulation(self.board, ["yellow", "red"])
+        evs = ai.display_stats(placements, tiles, {"blue": 5, "green": 5, "yellow": 5, "red": 5, "purple": 5},
+                               set(range(4, 15)), ["yellow", "red"])
+        self.assertAlmostEqual(evs["blue"], -1.0)
+        self.assertIn("roll", evs)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            AIPlayer(mode="quantum")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from LinkedList import LinkedList
+
+
+def stack_of(*colors):
+    stack = LinkedList()
+    for color in colors:
+        stack.append((color,))
+    return stack
+
+
+class TestLinkedList(unittest.TestCase):
+    def assertConsistent(self, stack, colors):
+        self.assertEqual([data[0] for data in stack.to_list()], colors)
+        self.assertEqual(len(stack), len(colors))
+        if colors:
+            self.assertEqual(stack.tail.data, (colors[-1],))
+            self.assertIsNone(stack.tail.next)
+        else:
+            self.assertIsNone(stack.head)
+            self.assertIsNone(stack.tail)
+
+    def test_append(self):
+        stack = stack_of("red", "blue")
+        self.assertConsistent(stack, ["red", "blue"])
+
+    def test_remove_from(self):
+        stack = stack_of("red", "blue", "green")
+        moving = stack.remove_from("blue")
+        self.assertConsistent(stack, ["red"])
+        self.assertEqual(moving.data, ("blue",))
+        self.assertIsNone(stack.remove_from("purple"))
+        self.assertConsistent(stack, ["red"])
+        stack.remove_from("red")
+        self.assertConsistent(stack, [])
+
+    def test_remove_stack_from_top(self):
+        stack = stack_of("red", "blue", "green")
+        top = stack.remove_stack_from_top(2)
+        self.assertConsistent(stack, ["red"])
+        self.assertEqual(top.data, ("blue",))
+        stack.remove_stack_from_top(5)
+        self.assertConsistent(stack, [])
+
+    def test_add_stacks(self):
+        stack = stack_of("red")
+        stack.add_stack_to_top(stack_of("blue", "green").head)
+        self.assertConsistent(stack, ["red", "blue", "green"])
+        stack.add_stack_to_bottom(stack_of("yellow", "purple").head)
+        self.assertConsistent(stack, ["yellow", "purple", "red", "blue", "green"])
+
+        empty = LinkedList()
+        empty.add_stack_to_bottom(stack_of("white").head)
+        self.assertConsistent(empty, ["white"])
+        empty.add_stack_to_top(None)
+        empty.add_stack_to_bottom(None)
+        self.assertConsistent(empty, ["white"])
+
+
+if __name__ == "__main__":
+    unittest.main()
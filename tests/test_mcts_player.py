@@ -0,0 +1,105 @@
+import unittest
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from AIPlayer import AIPlayer
+from CamelPlayer import CamelPlayer
+from CompactBoard import CompactBoard
+from MCTSPlayer import MCTSPlayer
+from TheGame import TheGame
+from Tournament import Tournament
+
+# Blue leads alone on tile 10 and only purple's die is left, so blue wins the leg
+TRACK = [
+    ("red", 2), ("yellow", 2), ("green", 2), ("purple", 2),
+    ("blue", 10),
+    ("black", 15), ("white", 15),
+]
+
+
+def late_leg_state():
+    board = CompactBoard.from_simulatable(TRACK)
+    dice = 1 << CompactBoard.COLOR_INDEX["purple"]
+    tickets = tuple(((2, 1, -1, -1, -1), (5, 1, -1, -1, -1)) for _ in range(CompactBoard.N_REGULAR))
+    return (board, dice, (), tickets, ((), ()), 0)
+
+
+class TestMCTSPlayer(unittest.TestCase):
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            MCTSPlayer(time_budget_ms=0)
+        with self.assertRaises(ValueError):
+            MCTSPlayer(max_iterations=0)
+        with self.assertRaises(ValueError):
+            MCTSPlayer().best_action()
+
+    def test_finds_sure_ticket(self):
+        player = MCTSPlayer(time_budget_ms=10000, max_iterations=2000, rng=1)
+        values = player.search(late_leg_state(), 2)
+        self.assertEqual(player.best_action(), "blue")
+        self.assertEqual(player.last_report["iterations"], 2000)
+        self.assertGreater(player.last_report["iterations_per_second"], 0)
+        # Only a 2 coin blue ticket is left, so the other seat's default policy
+        # rolls, ending the leg for a coin
+        self.assertAlmostEqual(values["blue"], 4.0)
+
+    def test_time_budget(self):
+        player = MCTSPlayer(time_budget_ms=50, rng=1)
+        game = TheGame(rng=3)
+        game.ai_player.close()
+        ai, other = CamelPlayer("AI"), CamelPlayer("AI")
+        game.players = [other]
+        game.all_players = [ai, other]
+        values = player.action_values(game, ai)
+        self.assertIn("roll", values)
+        self.assertLess(player.last_report["seconds"], 0.5)
+        self.assertGreater(player.last_report["iterations"], 1)
+
+    def test_tree_reused_when_position_was_simulated(self):
+        player = MCTSPlayer(time_budget_ms=10000, max_iterations=500, rng=2)
+        game = TheGame(rng=3)
+        game.ai_player.close()
+        ai, other = CamelPlayer("AI"), CamelPlayer("AI")
+        game.players = [other]
+        game.all_players = [ai, other]
+        player.action_values(game, ai)
+        self.assertEqual(player.last_report["reused_visits"], 0)
+
+        # The AI plays its pick and the other seat does what the default policy does
+        game.play_ai_turn(ai, {player.best_action(): 1.0})
+        leader = game.race_track.get_camel_placements()[0]
+        if game.betting_tents.get_available_bets()[leader] >= 3:
+            game.take_bet(other, leader)
+        else:
+            game.take_roll_turn(other)
+        player.action_values(game, ai)
+        self.assertGreater(player.last_report["reused_visits"], 0)
+
+    def test_game_plays_most_visited_action(self):
+        player = MCTSPlayer(time_budget_ms=10000, max_iterations=40, rng=4)
+        game = TheGame(rng=3, lookahead=player)
+        game.ai_player.close()
+        ai, other = CamelPlayer("AI"), CamelPlayer("AI")
+        game.players = [other]
+        game.all_players = [ai, other]
+        game.play_ai_turn(ai)
+        label = player.best_action()
+        if label == "roll":
+            self.assertEqual(len(game.pyramid.rolled_dice), 1)
+        elif label.startswith("spt_"):
+            tile, sign = AIPlayer.parse_spectator_label(label)
+            self.assertEqual(game.race_track.spectator_tiles[tile][0], sign)
+        else:
+            self.assertEqual(ai.bets[-1].color, label)
+
+    def test_tournament_with_mcts_seat(self):
+        result = Tournament.play_game(5, num_players=2, amount_of_sims=20, strategies=["mcts", "greedy"], think_ms=5)
+        self.assertTrue(result["finished"])
+
+
+if __name__ == '__main__':
+    unittest.main()
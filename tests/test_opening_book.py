@@ -0,0 +1,74 @@
+import unittest
+import sys
+import os
+import struct
+import tempfile
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from OpeningBook import OpeningBook
+from AIPlayer import AIPlayer
+from LegEnumerator import LegEnumerator
+from RaceTrack import RaceTrack
+
+ALL_DICE = ["blue", "green", "yellow", "red", "purple", "black", "white"]
+
+
+class TestOpeningBook(unittest.TestCase):
+    def test_board_index_round_trip(self):
+        for index in (0, 17, OpeningBook.n_boards() - 1):
+            race_track = RaceTrack()
+            race_track.set_up_camels(OpeningBook.opening_board(index))
+            self.assertEqual(OpeningBook.board_index(race_track.to_simulatable_list(), ALL_DICE), index)
+
+    def test_non_opening_positions(self):
+        race_track = RaceTrack()
+        race_track.set_up_camels(OpeningBook.opening_board(5))
+        board = race_track.to_simulatable_list()
+        self.assertIsNone(OpeningBook.board_index(board, ALL_DICE[:-1]))
+        race_track.location_update("blue", 1)
+        self.assertIsNone(OpeningBook.board_index(race_track.to_simulatable_list(), ALL_DICE))
+
+    def test_lookup(self):
+        # A book where only board 42 has real values is enough to check the file layout
+        race_track = RaceTrack()
+        race_track.set_up_camels(OpeningBook.opening_board(42))
+        board = race_track.to_simulatable_list()
+        placements, tiles = LegEnumerator().enumerate_leg(board, ALL_DICE)
+        colors = list(placements)
+        record_values = 2 * len(colors) + len(tiles)
+        record = struct.Struct(f"<{record_values}d")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "book.bin")
+            with open(path, "wb") as book_file:
+                book_file.write(OpeningBook.HEADER.pack(
+                    OpeningBook.MAGIC, OpeningBook.FORMAT_VERSION, OpeningBook.n_boards(), record_values, len(tiles)))
+                for index in range(OpeningBook.n_boards()):
+                    if index == 42:
+                        values = [placements[c][0] for c in colors] + [placements[c][1] for c in colors] + tiles
+                    else:
+                        values = [0.0] * record_values
+                    book_file.write(record.pack(*values))
+
+            ai = AIPlayer(opening_book_path=path)
+            try:
+                self.assertEqual(ai.run_simulation(board, ALL_DICE), (placements, tiles))
+                self.assertEqual(ai.cache.misses, 0)
+            finally:
+                ai.close()
+
+    def test_rejects_foreign_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "book.bin")
+            with open(path, "wb") as book_file:
+                book_file.write(b"not a book")
+            with self.assertRaises(ValueError):
+                OpeningBook(path)
+            self.assertIsNone(AIPlayer(opening_book_path=path).opening_book)
+
+
+if __name__ == "__main__":
+    unittest.main()
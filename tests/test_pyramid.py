@@ -53,6 +53,14 @@ class TestPyramid(unittest.TestCase):
         self.assertEqual(self.pyramid.rolled_dice, {"Black", "White"})
         self.assertIn(next(val for val in result if isinstance(val, str)), {"Black", "White"})
 
+    def test_from_simulatable(self):
+        pyramid = Pyramid.from_simulatable(["blue", "red"], rng=1)
+        self.assertEqual(pyramid.unrolled_dice, ["blue", "red"])
+        self.assertEqual(pyramid.rolled_dice, [])
+        pyramid = Pyramid.from_simulatable(["blue"], rolled_dice=[("red", 2)])
+        self.assertEqual(pyramid.rolled_dice, [("red", 2)])
+        self.assertIn("Rolled", pyramid.to_printable())
+
     def test_roll_alldice(self):
         # Tests that rolling all dice exhausts unrolled_dice
         for _ in range(7):
@@ -36,6 +36,63 @@ class TestValidMove(unittest.TestCase):
         race_track.location_update("purple", 1)
         self.assertEqual(race_track.to_list(), [[], [], [], [], [], [('red',)], [('blue',)], [('yellow',), ('green',)], [('purple',)], [], [], [], [], [], [], []])
 
+    def test_spectator_tiles_round_trip(self):
+        race_track = RaceTrack()
+        race_track.set_up_camels([("red", 0), ("blue", 1)])
+        race_track.spectator_tiles[3] = (-1, None)
+        copy = RaceTrack()
+        copy.set_up_camels(race_track.to_simulatable_list())
+        self.assertEqual(copy.to_list(), race_track.to_list())
+        self.assertEqual(copy.spectator_tiles[3][0], -1)
+        copy.location_update("blue", 2)
+        self.assertEqual(copy.find_camel("blue"), 2)
+
+    def assertIndexed(self, race_track):
+        # camel_index and every tile's tail/length agree with the stacks
+        for tile_idx, stack in enumerate(race_track.camel_and_tile_locations):
+            camels = [data[0] for data in stack.to_list()]
+            self.assertEqual(len(stack), len(camels))
+            self.assertEqual(stack.tail.data[0] if stack.tail else None, camels[-1] if camels else None)
+            for stack_idx, color in enumerate(camels):
+                self.assertEqual(race_track.find_camel(color), tile_idx)
+                self.assertEqual(race_track.get_camel_position(color), (tile_idx, stack_idx))
+
+    def test_index_follows_stacked_moves(self):
+        race_track = RaceTrack()
+        race_track.set_up_camels([("red", 1), ("blue", 1), ("green", 1), ("yellow", 2)])
+        # Blue carries green along
+        race_track.location_update("blue", 2)
+        self.assertEqual(race_track.get_camel_position("green"), (3, 1))
+        race_track.location_update("yellow", 1)
+        race_track.location_update("green", 1)
+        self.assertEqual(race_track.to_list()[3], [("blue",)])
+        self.assertEqual(race_track.to_list()[4], [("green",), ("yellow",)])
+        self.assertEqual(race_track.get_camel_position("yellow"), (4, 1))
+        self.assertIndexed(race_track)
+
+    def test_index_after_positive_spectator_bounce(self):
+        race_track = RaceTrack()
+        race_track.set_up_camels([("red", 1), ("blue", 1), ("green", 4)])
+        race_track.spectator_tiles[3] = (1, None)
+        race_track.location_update("red", 2)
+        self.assertEqual(race_track.to_list()[4], [("green",), ("red",), ("blue",)])
+        self.assertEqual(race_track.get_camel_position("blue"), (4, 2))
+        self.assertIndexed(race_track)
+
+    def test_index_after_negative_spectator_bounce_under_stack(self):
+        race_track = RaceTrack()
+        race_track.set_up_camels([("red", 1), ("blue", 1), ("green", 2), ("yellow", 2)])
+        race_track.spectator_tiles[3] = (-1, None)
+        race_track.location_update("red", 2)
+        # The bounced stack goes under the camels already on tile 2
+        self.assertEqual(race_track.to_list()[2], [("red",), ("blue",), ("green",), ("yellow",)])
+        self.assertEqual(race_track.get_camel_position("red"), (2, 0))
+        self.assertEqual(race_track.get_camel_position("yellow"), (2, 3))
+        self.assertIndexed(race_track)
+        race_track.location_update("green", 1)
+        self.assertEqual(race_track.to_list()[3], [])
+        self.assertIndexed(race_track)
+
     # def test_1(self):
     #     ''' Valid move on empty 3x3 board '''
     #     actual = self.empty_board.valid_move(2, 2)
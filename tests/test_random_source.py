@@ -0,0 +1,97 @@
+import unittest
+import sys
+import os
+import random
+
+import numpy as np
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from AIPlayer import AIPlayer
+from CamelPlayer import CamelPlayer
+from Pyramid import Pyramid
+from RandomSource import RandomSource
+from TheGame import TheGame
+
+DICE = ["blue", "green", "yellow", "red", "purple", "black", "white"]
+
+
+class TestRandomSource(unittest.TestCase):
+    def test_sources(self):
+        for source in (3, random.Random(3), np.random.default_rng(3)):
+            rng = RandomSource(source)
+            self.assertIn(rng.randint(1, 3), (1, 2, 3))
+            self.assertIn(rng.choice(DICE), DICE)
+            self.assertLess(rng.getrandbits(10), 1024)
+            items = list(range(10))
+            rng.shuffle(items)
+            self.assertEqual(sorted(items), list(range(10)))
+        self.assertIs(RandomSource.coerce(rng), rng)
+        for bad in ("seed", 1.5, True):
+            with self.assertRaises(ValueError):
+                RandomSource(bad)
+
+    def test_legs_are_permutations(self):
+        for source in (5, np.random.default_rng(5)):
+            legs = list(RandomSource(source).legs(DICE[2:], 1000))
+            self.assertEqual(len(legs), 1000)
+            for leg in legs:
+                self.assertEqual(sorted(color for color, _ in leg), sorted(DICE[2:]))
+                self.assertTrue(all(face in (1, 2, 3) for _, face in leg))
+            # Every die leads about equally often
+            firsts = [leg[0][0] for leg in legs]
+            for color in DICE[2:]:
+                self.assertAlmostEqual(firsts.count(color) / 1000, 0.2, delta=0.05)
+        self.assertEqual(list(RandomSource(5).legs([], 3)), [[], [], []])
+
+    def test_leg_moves_follow_pyramid_rules(self):
+        leg = [("white", 2), ("blue", 3), ("black", 1), ("red", 1)]
+        self.assertEqual(Pyramid.leg_moves(leg), [("white", -2), ("blue", 3), ("red", 1)])
+        # The leg ends with the last regular die
+        leg = [("blue", 3), ("black", 1), ("red", 1), ("white", 2)]
+        self.assertEqual(Pyramid.leg_moves(leg), [("blue", 3), ("black", -1), ("red", 1)])
+        self.assertEqual(Pyramid.leg_moves([("red", 2), ("white", 1), ("black", 3)]), [("red", 2)])
+
+
+class TestInjectedRng(unittest.TestCase):
+    def play(self, seed, hints):
+        game = TheGame(rng=seed)
+        game.ai_player.close()
+        game.ai_player.amount_of_sims = 30
+        player = CamelPlayer("ann")
+        rolls = []
+        for _ in range(10):
+            if hints:
+                game.get_hint()
+            game.take_roll_turn(player)
+            rolls.append(game.pyramid.rolled_dice[-1] if game.pyramid.rolled_dice else None)
+        return game.race_track.to_simulatable_list(), rolls
+
+    def test_seeded_games_ignore_hints_and_global_random(self):
+        random.seed(1)
+        first = self.play(9, hints=False)
+        random.seed(2)
+        self.assertEqual(self.play(9, hints=True), first)
+        self.assertEqual(self.play(np.random.default_rng(9), hints=True), self.play(np.random.default_rng(9), False))
+
+    def test_seeded_pyramid(self):
+        first, second = Pyramid(4), Pyramid(random.Random(4))
+        for _ in range(5):
+            self.assertEqual(first.roll(), second.roll())
+
+    def test_ai_rng(self):
+        board = [("blue", 1), ("green", 2), ("red", 3), ("yellow", 3), ("purple", 2), ("black", 15), ("white", 15)]
+        for mode in ("monte_carlo", "vectorized"):
+            results = [
+                AIPlayer(200, mode=mode, cache_size=0, opening_book_path=None, rng=np.random.default_rng(6))
+                .run_simulation(board, DICE)
+                for _ in range(2)
+            ]
+            self.assertEqual(results[0], results[1])
+            self.assertEqual(sum(counts[0] for counts in results[0][0].values()), 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from SimulationCache import SimulationCache
+from AIPlayer import AIPlayer
+
+
+class TestSimulationCache(unittest.TestCase):
+    def test_canonical_key(self):
+        # Dice order and spectator tile owners must not change the key
+        a = SimulationCache.make_key([("blue", 1), ("red", 1), ("spectator", 5, 1, object())], ["red", "blue"])
+        b = SimulationCache.make_key([("blue", 1), ("red", 1), ("spectator", 5, 1, object())], ["blue", "red"])
+        self.assertEqual(a, b)
+        # Stack order does matter
+        c = SimulationCache.make_key([("red", 1), ("blue", 1)], ["blue", "red"])
+        self.assertNotEqual(SimulationCache.make_key([("blue", 1), ("red", 1)], ["blue", "red"]), c)
+
+    def test_lru_eviction(self):
+        cache = SimulationCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "b" is now least recently used
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "evictions": 1, "size": 2, "max_size": 2})
+
+    def test_ai_uses_cache(self):
+        ai = AIPlayer(amount_of_sims=50)
+        board = [("blue", 1), ("green", 2), ("red", 3), ("yellow", 3), ("purple", 2)]
+        first = ai.run_simulation(board, ["blue", "red"])
+        second = ai.run_simulation(board, ["red", "blue"])
+        self.assertEqual(first, second)
+        self.assertEqual(ai.cache.hits, 1)
+        self.assertEqual(ai.cache.misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from AIPlayer import AIPlayer
+from SpectatorEvaluator import SpectatorEvaluator
+from TheGame import TheGame
+
+# Blue on top of the stack on tile 0, green alone on tile 3; only blue still rolls
+TRACK = [
+    ("red", 0), ("yellow", 0), ("purple", 0), ("blue", 0),
+    ("green", 3),
+    ("black", 15), ("white", 15),
+]
+
+
+class TestSpectatorEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.evaluator = SpectatorEvaluator(rng=7)
+
+    def test_every_tile_and_sign(self):
+        results = self.evaluator.evaluate(TRACK, ["blue"], {1, 2, 8}, amount_of_sims=300)
+        self.assertEqual(set(results), {(tile, sign) for tile in (1, 2, 8) for sign in (1, -1)})
+        for scores in results.values():
+            self.assertGreaterEqual(scores["payout"], 0)
+            self.assertAlmostEqual(scores["ev"], scores["payout"] + scores["bets"])
+        # No camel can reach tile 8 this leg
+        self.assertEqual(results[(8, 1)]["ev"], 0)
+        self.assertEqual(results[(8, -1)]["ev"], 0)
+
+    def test_payout_matches_hand_calculation(self):
+        results = self.evaluator.evaluate(TRACK, ["blue"], {1, 2}, amount_of_sims=3000)
+        for option in ((1, 1), (1, -1), (2, 1), (2, -1)):
+            self.assertAlmostEqual(results[option]["payout"], 1 / 3, delta=0.05)
+            self.assertEqual(results[option]["bets"], 0)
+
+    def test_open_bets(self):
+        # A +1 tile on 2 lets blue climb onto green and win, costing a 5 coin
+        # green ticket 4 coins a third of the time; a -1 tile changes nothing
+        bets = [("green", (5, 1, -1, -1, -1))]
+        results = self.evaluator.evaluate(TRACK, ["blue"], {2}, bets, amount_of_sims=3000)
+        self.assertAlmostEqual(results[(2, 1)]["bets"], -4 / 3, delta=0.2)
+        self.assertEqual(results[(2, -1)]["bets"], 0)
+        self.assertLess(results[(2, 1)]["ev"], results[(2, -1)]["ev"])
+
+    def test_invalid_sims(self):
+        with self.assertRaises(ValueError):
+            self.evaluator.evaluate(TRACK, ["blue"], {2}, amount_of_sims=0)
+
+
+class TestSpectatorScoring(unittest.TestCase):
+    def setUp(self):
+        self.ai_player = AIPlayer(amount_of_sims=400, seed=3)
+
+    def tearDown(self):
+        self.ai_player.close()
+
+    def test_labels_round_trip(self):
+        for tile in (0, 7, 15):
+            for sign in (1, -1):
+                label = AIPlayer.spectator_label(tile, sign)
+                self.assertEqual(AIPlayer.parse_spectator_label(label), (tile, sign))
+        self.assertEqual(AIPlayer.parse_spectator_label("spt_4"), (4, -1))
+
+    def test_scores_best_sign_per_tile(self):
+        bets = [("green", (5, 1, -1, -1, -1))]
+        evs = self.ai_player.score_spectator_tiles({"roll": 1.0, "spt_2": 0.3}, TRACK, ["blue"], {2, 8}, bets)
+        self.assertEqual(set(evs), {"roll", "spt_2-", "spt_8+"})
+        self.assertEqual(evs["roll"], 1.0)
+
+    def test_ai_places_chosen_sign(self):
+        game = TheGame()
+        game.ai_player.close()
+        player_input, label, tile = game.choose_ai_action({"roll": 1.0, "spt_5+": 2.0})
+        self.assertEqual((player_input, label, tile), ("3", "spt_5+", 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import unittest
+import sys
+import os
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from AIPlayer import AIPlayer
+from SpeculativeHinter import SpeculativeHinter
+from TheGame import TheGame
+
+
+class TestSpeculativeHinter(unittest.TestCase):
+    board = [("blue", 1), ("green", 1), ("red", 2), ("yellow", 3), ("purple", 3)]
+    moved = [("blue", 1), ("green", 1), ("red", 4), ("yellow", 3), ("purple", 3)]
+    dice = ["blue", "green", "red", "yellow", "purple"]
+    bets = {"blue": 5, "green": 5, "red": 5, "yellow": 5, "purple": 5}
+
+    def setUp(self):
+        self.hinter = SpeculativeHinter(AIPlayer(200, seed=4, opening_book_path=None))
+
+    def tearDown(self):
+        self.hinter.close()
+
+    def test_speculated_result_is_reused(self):
+        self.hinter.speculate(self.board, self.dice, self.bets)
+        counts, tiles, report = self.hinter.simulation(self.board, self.dice, self.bets)
+
+        expected = AIPlayer(200, seed=4, opening_book_path=None).run_simulation(self.board, self.dice)
+        self.assertEqual((counts, tiles), expected)
+        self.assertEqual(report, {})
+        self.assertEqual(self.hinter.computed, 0)
+        self.assertEqual(self.hinter.ready + self.hinter.waited, 1)
+
+    def test_state_change_replaces_speculation(self):
+        self.hinter.speculate(self.board, self.dice, self.bets)
+        self.hinter.speculate(self.moved, self.dice, self.bets)
+        self.hinter.simulation(self.moved, self.dice, self.bets)
+        self.assertEqual(self.hinter.computed, 0)
+
+        self.hinter.simulation(self.board, ["blue"], self.bets)
+        self.assertEqual(self.hinter.computed, 1)
+
+    def test_results_are_copies(self):
+        counts, tiles, _ = self.hinter.simulation(self.board, self.dice, self.bets)
+        counts["blue"][0] = -1
+        tiles[0] = -1
+        again, again_tiles, _ = self.hinter.simulation(self.board, self.dice, self.bets)
+        self.assertNotEqual(again["blue"][0], -1)
+        self.assertNotEqual(again_tiles[0], -1)
+
+    def test_stream_serves_finished_speculation(self):
+        self.hinter.speculate(self.board, self.dice, self.bets)
+        self.hinter.simulation(self.board, self.dice, self.bets)
+        updates = list(self.hinter.stream(self.board, self.dice, self.bets, {5, 6}))
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(updates[0][2], 200)
+
+    def test_stream_reports_single_sample(self):
+        hinter = SpeculativeHinter(AIPlayer(1, seed=4, opening_book_path=None))
+        try:
+            hinter.speculate(self.board, self.dice, self.bets)
+            (_, _, samples), = hinter.stream(self.board, self.dice, self.bets, {5, 6})
+            self.assertEqual(samples, 1)
+        finally:
+            hinter.close()
+
+    def test_stream_runs_on_worker(self):
+        updates = list(self.hinter.stream(self.moved, self.dice, self.bets, {5, 6}))
+        self.assertEqual(updates[-1][2], 200)
+        self.assertEqual(self.hinter.stats()["computed"], 1)
+
+    def test_stream_serves_running_speculation(self):
+        hinter = SpeculativeHinter(AIPlayer(40000, seed=4, opening_book_path=None))
+        try:
+            hinter.speculate(self.board, self.dice, self.bets)
+            # The running job is not finished by the deadline and no duplicate is queued
+            deadline = time.perf_counter() + 0.01
+            self.assertEqual(list(hinter.stream(self.board, self.dice, self.bets, {5, 6}, deadline)), [])
+            self.assertEqual(hinter.stats()["late"], 1)
+            updates = list(hinter.stream(self.board, self.dice, self.bets, {5, 6}))
+            self.assertEqual(len(updates), 1)
+            self.assertEqual(updates[0][2], 40000)
+            self.assertEqual(hinter.stats()["computed"], 0)
+            self.assertEqual(hinter.stats()["waited"], 2)
+        finally:
+            hinter.close()
+
+    def test_game_deadline_with_speculation(self):
+        game = TheGame(rng=1)
+        game.ai_player.close()
+        game.ai_player = AIPlayer(amount_of_sims=40000, seed=5, opening_book_path=None)
+        game.hinter = SpeculativeHinter(game.ai_player)
+        try:
+            game.speculate_hint()
+            game.ai_hint_ms = 20
+            start = time.perf_counter()
+            evs = game.get_hint(deadline=start + game.ai_hint_ms / 1000.0)
+            # Well inside the full simulation, which takes about half a second
+            self.assertLess(time.perf_counter() - start, 0.1)
+            self.assertIn("roll", evs)
+            self.assertEqual(game.hinter.stats()["computed"], 0)
+        finally:
+            game.hinter.close()
+
+    def test_adaptive_key_includes_bets(self):
+        ai_player = AIPlayer(100, tolerance=0.5, seed=1, opening_book_path=None)
+        hinter = SpeculativeHinter(ai_player)
+        try:
+            other_bets = dict(self.bets, blue=3)
+            self.assertNotEqual(
+                hinter.state_key(self.board, self.dice, self.bets),
+                hinter.state_key(self.board, self.dice, other_bets),
+            )
+            _, _, report = hinter.simulation(self.board, self.dice, self.bets)
+            self.assertIn("samples", report)
+        finally:
+            hinter.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import sys
+import os
+import io
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from BettingTicketHolder import BettingTicketHolder
+from CamelPlayer import CamelPlayer
+from Pyramid import Pyramid
+from RaceTrack import RaceTrack
+from TerminalRenderer import TerminalRenderer
+
+
+class TestTerminalRenderer(unittest.TestCase):
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.renderer = TerminalRenderer(self.stream)
+
+    def test_state_matches_legacy_rendering(self):
+        race_track = RaceTrack()
+        race_track.set_up_camels([("blue", 1), ("green", 1), ("red", 1), ("yellow", 4), ("black", 15)])
+        race_track.spectator_tiles[7] = (1, CamelPlayer("A"))
+        race_track.spectator_tiles[9] = (-1, CamelPlayer("B"))
+        pyramid = Pyramid()
+        pyramid.rolled_dice = [("blue", 2), ("white", -1)]
+        pyramid.unrolled_dice = ["green", "red", "yellow", "purple"]
+        tents = BettingTicketHolder()
+        tents.take_out_bet("red", CamelPlayer("A"))
+        players = [CamelPlayer("A"), CamelPlayer("B", 7)]
+
+        # The string TheGame.get_game_state_str built before the renderer existed
+        legacy = self.renderer.bets_line(tents.get_available_bets()) + "            " + pyramid.to_printable() + "\n"
+        legacy += "+Start+" + "-" * 31 + "+Finish+\n"
+        for row in reversed(race_track.to_rotated_list()):
+            legacy += "|     |" + "_".join(row) + "|      |\n"
+        legacy += "+Start+0-1-2-3-4-5-6-7-8-9-0-1-2-3-4-5+Finish+\n"
+        legacy += "A has 3 coin(s)\nB has 7 coin(s)\n"
+
+        lines = self.renderer.state_lines(tents.get_available_bets(), pyramid, race_track, players)
+        self.assertEqual("\n".join(lines) + "\n", legacy)
+
+    def test_only_changed_lines_are_redrawn(self):
+        first = self.renderer.render("a\nb\nc\n")
+        self.assertTrue(first.startswith(TerminalRenderer.CLEAR))
+
+        unchanged = self.renderer.render("a\nb\nc\n")
+        self.assertEqual(unchanged, "\x1b[4;1H\x1b[J")
+
+        changed = self.renderer.render("a\nB\n")
+        self.assertEqual(changed, "\x1b[2;1HB\x1b[K\x1b[3;1H\x1b[J")
+        self.assertEqual(self.stream.getvalue(), first + unchanged + changed)
+
+    def test_clear_screen_forces_full_redraw(self):
+        self.renderer.render("a\nb")
+        TerminalRenderer.clear_screen(io.StringIO())
+        self.assertTrue(self.renderer.render("a\nb").startswith(TerminalRenderer.CLEAR))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+import sys
+import os
+import io
+import contextlib
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.join(current_dir, '..')
+sys.path.append(parent_dir)
+
+from Tournament import Tournament
+
+
+class TestTournament(unittest.TestCase):
+    def test_headless_games(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            report = Tournament(num_players=3, amount_of_sims=20, workers=1, seed=7).run(3)
+        self.assertEqual(output.getvalue(), "")  # no terminal I/O
+        self.assertEqual(report["games"], 3)
+        self.assertEqual(report["unfinished_games"], 0)
+        self.assertAlmostEqual(sum(report["win_rate_by_seat"]), 1.0)
+        self.assertEqual(len(report["coins_by_seat"]), 3)
+
+    def test_seeded_games_repeat(self):
+        first = Tournament.play_game(11, num_players=2, amount_of_sims=20)
+        second = Tournament.play_game(11, num_players=2, amount_of_sims=20)
+        self.assertEqual(first, second)
+        self.assertTrue(first["finished"])
+
+
+if __name__ == "__main__":
+    unittest.main()